@@ -44,6 +44,7 @@ class CacheEntryResponse(BaseModel):
 class CacheClearRequest(BaseModel):
     """캐시 삭제 요청"""
     pattern: Optional[str] = Field(None, description="키 패턴")
+    prefix: Optional[str] = Field(None, description="키 접두사")
     content_type: Optional[str] = Field(None, description="콘텐츠 타입")
     older_than_hours: Optional[int] = Field(None, ge=1, description="특정 시간 이전 항목")
 
@@ -199,13 +200,16 @@ async def clear_cache(request: CacheClearRequest):
     try:
         deleted_count = 0
         
-        if request.pattern or request.content_type or request.older_than_hours:
+        if request.pattern or request.prefix or request.content_type or request.older_than_hours:
             # 조건부 삭제
             invalidator = CacheInvalidator(advanced_cache)
             
             if request.pattern:
                 deleted_count += await invalidator.invalidate_by_pattern(request.pattern)
                 
+            if request.prefix:
+                deleted_count += await invalidator.invalidate_by_prefix(request.prefix)
+                
             if request.content_type:
                 deleted_count += await invalidator.invalidate_by_metadata(
                     {"content_type": request.content_type}
@@ -10,7 +10,8 @@ from typing import Optional
 from sqlalchemy.orm import Session
 import json
 
-from ..models.database import get_db, Category as CategoryModel, Subcategory as SubcategoryModel
+from sqlalchemy import func
+from ..models.database import get_db, bulk_insert, Category as CategoryModel, Content as ContentModel, Subcategory as SubcategoryModel
 from ..services.category_optimizer import CategoryOptimizer
 from ..services.advanced_cache_manager import advanced_cache
 from ..services.performance_optimizer import performance_optimizer
@@ -69,17 +70,18 @@ async def generate_categories(
         if not keyword:
             raise HTTPException(status_code=400, detail="유효한 키워드를 입력해주세요")
             
-        # 항상 새로운 카테고리 생성 (캐시 사용 안함)
-        app_logger.info(f"새로운 카테고리 생성 요청: {keyword}")
+        # 같은 키워드/개수는 GeminiClient 캐시에서 반환 (force_new면 새로 생성)
+        app_logger.info(f"카테고리 생성 요청: {keyword} (force_new={request.force_new})")
         
         # 토큰 추적기 초기화 (새 워크플로우 시작)
         token_tracker.reset()
             
         # 카테고리 생성 (Gemini AI 사용)
         app_logger.info(f"카테고리 생성 시작: {keyword}")
-        categories = gemini_client.generate_categories(
+        categories = await gemini_client.generate_categories(
             keyword=keyword,
-            count=request.count
+            count=request.count,
+            bypass_cache=request.force_new
         )
         
         # 생성된 카테고리 로깅
@@ -91,44 +93,54 @@ async def generate_categories(
         filtered_categories = categories
         
         # 응답 생성 및 데이터베이스 저장
-        response_categories = []
-        for cat in filtered_categories:
-            cat_id = f"cat_{hash(cat.name)}"
-            
-            # 데이터베이스에 존재하는지 확인
-            existing_cat = db.query(CategoryModel).filter(CategoryModel.id == cat_id).first()
-            if not existing_cat:
-                # 새 카테고리 생성
-                db_category = CategoryModel(
-                    id=cat_id,
-                    name=cat.name,
-                    emoji=cat.emoji or '📌',
-                    description=cat.description or '',
-                    seed_keyword=keyword,
-                    practicality_score=cat.research_activity,  # research_activity는 practicality_score를 담고 있음
-                    interest_score=cat.trend_score  # trend_score는 interest_score를 담고 있음
-                )
-                db.add(db_category)
-                db.commit()
-                db.refresh(db_category)
-                created_at = db_category.created_at.isoformat()
-            else:
-                created_at = existing_cat.created_at.isoformat()
-            
-            # 콘텐츠 수 계산
-            from ..models.database import Content as ContentModel
-            content_count = db.query(ContentModel).filter(ContentModel.category_id == cat_id).count()
-            
-            response_categories.append(CategoryResponse(
+        cat_ids = [f"cat_{hash(cat.name)}" for cat in filtered_categories]
+        
+        # 기존 카테고리 생성 시각을 한 번에 조회
+        created_at_by_id = {
+            cat_id: created_at.isoformat()
+            for cat_id, created_at in db.query(CategoryModel.id, CategoryModel.created_at)
+            .filter(CategoryModel.id.in_(cat_ids))
+        }
+        
+        # 새 카테고리는 한 트랜잭션으로 일괄 저장
+        now = datetime.utcnow()
+        new_rows = {}
+        for cat_id, cat in zip(cat_ids, filtered_categories):
+            if cat_id in created_at_by_id or cat_id in new_rows:
+                continue
+            new_rows[cat_id] = {
+                'id': cat_id,
+                'name': cat.name,
+                'emoji': cat.emoji or '📌',
+                'description': cat.description or '',
+                'seed_keyword': keyword,
+                'practicality_score': cat.research_activity,  # research_activity는 practicality_score를 담고 있음
+                'interest_score': cat.trend_score,  # trend_score는 interest_score를 담고 있음
+                'created_at': now
+            }
+        bulk_insert(db, CategoryModel, list(new_rows.values()))
+        created_at_by_id.update({cat_id: now.isoformat() for cat_id in new_rows})
+        
+        # 콘텐츠 수를 카테고리별로 한 번에 계산
+        content_counts = dict(
+            db.query(ContentModel.category_id, func.count(ContentModel.id))
+            .filter(ContentModel.category_id.in_(cat_ids))
+            .group_by(ContentModel.category_id)
+        )
+        
+        response_categories = [
+            CategoryResponse(
                 id=cat_id,
                 name=cat.name,
                 emoji=cat.emoji or '📌',
                 description=cat.description or '',
                 practicality_score=cat.research_activity,  # research_activity는 practicality_score를 담고 있음
                 interest_score=cat.trend_score,  # trend_score는 interest_score를 담고 있음
-                created_at=created_at,
-                content_count=content_count
-            ))
+                created_at=created_at_by_id[cat_id],
+                content_count=content_counts.get(cat_id, 0)
+            )
+            for cat_id, cat in zip(cat_ids, filtered_categories)
+        ]
             
         response = CategoryListResponse(
             categories=response_categories,
@@ -380,12 +392,12 @@ async def generate_subcategories_auto(
         subcategories = []
         successful_count = 0
         
-        for topic in topics:
+        # 논문 기반 서브카테고리 생성 시도 - 주제별 검색을 동시에 실행
+        results = await gemini_client.discover_papers_for_topics_batch(category_name, topics)
+        
+        for topic, result in zip(topics, results):
             if successful_count >= 3:  # 최대 3개의 서브카테고리만 생성
                 break
-                
-            # 논문 기반 서브카테고리 생성 시도
-            result = gemini_client.discover_papers_for_topic(category_name, topic)
             
             if result:
                 # 카테고리 ID 찾기
@@ -505,11 +517,11 @@ async def generate_additional_subcategories(category_name: str, remaining_topics
         from ..services.gemini_client import GeminiClient
         gemini_client = GeminiClient()
         
-        for topic in remaining_topics:
-            if len(existing_subcategories) >= 3:
-                break
-            
-            result = gemini_client.discover_papers_for_topic(category_name, topic)
+        if len(existing_subcategories) >= 3:
+            return
+        
+        results = await gemini_client.discover_papers_for_topics_batch(category_name, remaining_topics)
+        for result in results:
             if result:
                 # 결과를 캐시에 저장하거나 DB에 저장
                 app_logger.info(f"추가 서브카테고리 생성 성공: {result.name}")
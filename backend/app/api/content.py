@@ -88,7 +88,7 @@ async def generate_content(
             start_time = time.time()
             
             # Generate content using Gemini
-            result = gemini_client.generate_content(subcategory, content_type)
+            result = await gemini_client.generate_content(subcategory, content_type)
             
             generation_time = time.time() - start_time
             
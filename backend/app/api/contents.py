@@ -3,14 +3,17 @@
 """
 
 from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks, Query
-from typing import List, Dict, Any, Optional
+from fastapi.responses import StreamingResponse
+from typing import AsyncIterator, List, Dict, Any, Literal, Optional
 from datetime import datetime
 from pydantic import BaseModel, Field
 from enum import Enum
 import json
+import asyncio
+import orjson
 from sqlalchemy.orm import Session
 
-from ..models.database import get_db, Content as ContentModel, Category as CategoryModel, Paper as PaperModel
+from ..models.database import get_db, SessionLocal, Content as ContentModel, Category as CategoryModel, Paper as PaperModel
 
 from ..services.advanced_cache_manager import advanced_cache
 from ..services.performance_optimizer import performance_optimizer
@@ -81,6 +84,10 @@ class ContentTransformRequest(BaseModel):
 class BatchContentRequest(BaseModel):
     """배치 콘텐츠 생성 요청"""
     requests: List[ContentRequest] = Field(..., min_items=1, max_items=10)
+    mode: Literal["sync", "batch"] = Field(
+        default="sync",
+        description="sync: 요청별 실시간 생성, batch: Gemini Batch API로 일괄 생성 (비용 50% 절감, 완료까지 최대 24시간)"
+    )
 
 # 의존성
 def get_thinking_engine():
@@ -103,6 +110,18 @@ async def generate_content(
     db: Session = Depends(get_db)
 ):
     """콘텐츠 생성"""
+    from ..services.gemini_client import INTERACTIVE_SERVICE_TIER
+    
+    return await _generate_content(request, thinking_engine, generators, db, INTERACTIVE_SERVICE_TIER)
+
+async def _generate_content(
+    request: ContentRequest,
+    thinking_engine: NativeThinkingEngine,
+    generators: Dict[ContentType, Any],
+    db: Session,
+    service_tier: Optional[str]
+) -> ContentResponse:
+    """콘텐츠 생성 (service_tier: 사용자가 기다리는 요청은 priority, 백그라운드 작업은 flex)"""
     try:
         start_time = datetime.now()
         
@@ -150,12 +169,14 @@ async def generate_content(
         if not generator:
             raise HTTPException(status_code=400, detail="지원하지 않는 콘텐츠 타입입니다")
         
-        # 콘텐츠 생성
-        generated_content = generator.generate(
+        # 콘텐츠 생성 (생성기는 동기 API이므로 이벤트 루프를 막지 않도록 스레드에서 실행)
+        generated_content = await asyncio.to_thread(
+            generator.generate,
             topic=request.topic,
             papers=papers,
             category_id=request.category_id,
-            additional_context=request.additional_context
+            additional_context=request.additional_context,
+            service_tier=service_tier
         )
         
         # 품질 평가
@@ -174,37 +195,12 @@ async def generate_content(
             if thinking_result.thinking_quality_score > 0.8:
                 quality_score = min(100, quality_score * 1.1)
         
-        # 결과 생성
-        content_id = f"cnt_{datetime.now().strftime('%Y%m%d%H%M%S')}_{hash(request.topic) % 10000}"
-        
-        # 메타데이터 준비
-        metadata = {
-            "tone": generated_content.tone,
-            "word_count": len(generated_content.content.split()) if generated_content.content else 0,
-            "paper_count": len(papers),
-            "generation_method": generator.__class__.__name__,
-            "papers": papers  # 논문 정보 추가
-        }
-        
         # 데이터베이스에 저장
-        db_content = ContentModel(
-            id=content_id,
-            topic=request.topic,
-            category_id=request.category_id,
-            paper_id=request.paper_ids[0] if request.paper_ids else None,  # 첫 번째 논문 ID 사용
-            content_type=request.content_type.value,
-            content=generated_content.content,
-            content_metadata=json.dumps(metadata),  # JSON으로 직렬화
-            thinking_process=thinking_process,
-            quality_score=quality_score
+        content_id, metadata, db_content = _save_content(
+            db, request, generated_content.content, generated_content.tone, quality_score,
+            papers, generator.__class__.__name__, thinking_process
         )
         
-        db.add(db_content)
-        db.commit()
-        db.refresh(db_content)
-        
-        app_logger.info(f"콘텐츠 데이터베이스 저장 완료: {content_id}")
-        
         # API 응답용 객체 생성
         result = GeneratedContent(
             id=content_id,
@@ -243,7 +239,6 @@ async def generate_content(
         # report 생성 후 전체 워크플로우 토큰 사용량 총합 로깅
         if request.content_type == ContentType.REPORT:
             # 약간의 지연을 두고 전체 요약 (모든 개별 요약이 끝난 후)
-            import asyncio
             await asyncio.sleep(0.1)
             
             app_logger.info("\n" + "="*80)
@@ -295,6 +290,118 @@ async def generate_content(
         app_logger.error(f"콘텐츠 생성 실패: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail="콘텐츠 생성 중 오류가 발생했습니다")
 
+def _save_content(
+    db: Session,
+    request: ContentRequest,
+    content: str,
+    tone: str,
+    quality_score: float,
+    papers: List[Any],
+    generation_method: str,
+    thinking_process: Optional[str] = None
+):
+    """생성된 콘텐츠를 데이터베이스에 저장하고 (content_id, metadata, db_content) 반환"""
+    content_id = f"cnt_{datetime.now().strftime('%Y%m%d%H%M%S')}_{hash(request.topic) % 10000}"
+    
+    # 메타데이터 준비
+    metadata = {
+        "tone": tone,
+        "word_count": len(content.split()) if content else 0,
+        "paper_count": len(papers),
+        "generation_method": generation_method,
+        "papers": papers  # 논문 정보 추가
+    }
+    
+    db_content = ContentModel(
+        id=content_id,
+        topic=request.topic,
+        category_id=request.category_id,
+        paper_id=request.paper_ids[0] if request.paper_ids else None,  # 첫 번째 논문 ID 사용
+        content_type=request.content_type.value,
+        content=content,
+        content_metadata=json.dumps(metadata),  # JSON으로 직렬화
+        thinking_process=thinking_process,
+        quality_score=quality_score
+    )
+    
+    db.add(db_content)
+    db.commit()
+    db.refresh(db_content)
+    
+    app_logger.info(f"콘텐츠 데이터베이스 저장 완료: {content_id}")
+    return content_id, metadata, db_content
+
+def _context_papers(additional_context: Optional[str]) -> Optional[List[Any]]:
+    """additional_context JSON의 논문 목록 (없거나 형식이 잘못되면 None)"""
+    try:
+        papers = json.loads(additional_context or "{}").get("papers")
+    except (json.JSONDecodeError, AttributeError):
+        return None
+    return papers or None
+
+def _sse_event(data: Dict[str, Any], event: Optional[str] = None) -> bytes:
+    """Server-Sent Events 메시지 하나 (데이터는 JSON으로 인코딩해 줄바꿈이 들어가지 않음)"""
+    prefix = f"event: {event}\n".encode() if event else b""
+    return prefix + b"data: " + orjson.dumps(data) + b"\n\n"
+
+async def _stream_content_events(
+    request: ContentRequest,
+    papers: List[Any],
+    generator: Any
+) -> AsyncIterator[bytes]:
+    """본문 조각을 SSE로 전달하고, 끝나면 저장한 뒤 done 이벤트로 콘텐츠 ID 전달"""
+    from ..services.gemini_client import GeminiClient, SubcategoryResult, INTERACTIVE_SERVICE_TIER
+    
+    subcategory = SubcategoryResult.from_context(request.topic, papers, request.additional_context)
+    chunks = []
+    
+    try:
+        async for text in GeminiClient().generate_content_stream(
+            subcategory, request.content_type.value, service_tier=INTERACTIVE_SERVICE_TIER
+        ):
+            chunks.append(text)
+            yield _sse_event({"text": text})
+        
+        # 응답이 끝난 뒤 저장 - 요청 스코프의 DB 세션은 이미 닫혔을 수 있어 새 세션 사용
+        db = SessionLocal()
+        try:
+            content_id, _, _ = _save_content(
+                db, request, "".join(chunks), generator.tone, subcategory.quality_score,
+                papers, generator.__class__.__name__
+            )
+        finally:
+            db.close()
+    except Exception as e:
+        app_logger.error(f"스트리밍 콘텐츠 생성 실패: {e}", exc_info=True)
+        yield _sse_event({"detail": "콘텐츠 생성 중 오류가 발생했습니다"}, event="error")
+        return
+    
+    yield _sse_event({"content_id": content_id}, event="done")
+
+@router.post("/generate/stream")
+async def generate_content_stream(
+    request: ContentRequest,
+    generators: Dict[ContentType, Any] = Depends(get_content_generators)
+):
+    """콘텐츠 스트리밍 생성 (text/event-stream)
+    
+    생성되는 대로 본문 조각을 보내므로 첫 바이트까지의 시간이 전체 생성 시간이 아닌 첫 토큰 시간이 된다.
+    Thinking Mode와 응답 캐시는 적용되지 않는다.
+    """
+    papers = _context_papers(request.additional_context)
+    if not papers:
+        raise HTTPException(
+            status_code=400,
+            detail="논문 정보가 제공되지 않았습니다. 먼저 논문을 검색해주세요."
+        )
+    
+    token_tracker.reset()
+    return StreamingResponse(
+        _stream_content_events(request, papers, generators[request.content_type]),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 @router.get("/list", response_model=ContentListResponse)
 async def list_contents(
     content_type: Optional[ContentType] = None,
@@ -420,12 +527,14 @@ async def batch_generate_content(
             request.requests,
             thinking_engine,
             generators,
-            db
+            db,
+            request.mode
         )
         
         return {
             "batch_id": batch_id,
             "status": "processing",
+            "mode": request.mode,
             "request_count": len(request.requests),
             "message": "배치 콘텐츠 생성이 시작되었습니다"
         }
@@ -439,31 +548,39 @@ async def process_batch_generation(
     requests: List[ContentRequest],
     thinking_engine: NativeThinkingEngine,
     generators: Dict[ContentType, Any],
-    db: Session = None
+    db: Session = None,
+    mode: str = "sync"
 ):
     """배치 생성 처리 (백그라운드)"""
+    from ..services.gemini_client import BACKGROUND_SERVICE_TIER
+    
     try:
-        results = []
-        
-        for req in requests:
-            try:
-                # 각 요청 처리
-                result = await generate_content(
-                    req,
-                    thinking_engine,
-                    generators
-                )
-                results.append({
-                    "status": "success",
-                    "content_id": result.content.id,
-                    "topic": req.topic
-                })
-            except Exception as e:
-                results.append({
-                    "status": "failed",
-                    "topic": req.topic,
-                    "error": str(e)
-                })
+        if mode == "batch":
+            results = await _generate_with_batch_api(requests, generators, db)
+        else:
+            results = []
+            
+            for req in requests:
+                try:
+                    # 각 요청 처리 - 기다리는 사용자가 없으므로 지연이 길어도 저렴한 flex 등급 사용
+                    result = await _generate_content(
+                        req,
+                        thinking_engine,
+                        generators,
+                        db,
+                        BACKGROUND_SERVICE_TIER
+                    )
+                    results.append({
+                        "status": "success",
+                        "content_id": result.content.id,
+                        "topic": req.topic
+                    })
+                except Exception as e:
+                    results.append({
+                        "status": "failed",
+                        "topic": req.topic,
+                        "error": str(e)
+                    })
         
         # 결과 캐시에 저장
         advanced_cache.set(
@@ -494,6 +611,55 @@ async def process_batch_generation(
             ttl=3600*24
         )
 
+async def _generate_with_batch_api(
+    requests: List[ContentRequest],
+    generators: Dict[ContentType, Any],
+    db: Session
+) -> List[Dict[str, Any]]:
+    """Gemini Batch API 작업 하나로 모든 요청의 본문을 생성한 뒤 요청별로 저장 (Thinking Mode 미적용)"""
+    from ..services.gemini_client import GeminiClient, SubcategoryResult
+    
+    results = []
+    jobs = []
+    pending = []
+    
+    for req in requests:
+        papers = _context_papers(req.additional_context)
+        if not papers:
+            results.append({
+                "status": "failed",
+                "topic": req.topic,
+                "error": "논문 정보가 제공되지 않았습니다."
+            })
+            continue
+        
+        jobs.append((SubcategoryResult.from_context(req.topic, papers, req.additional_context), req.content_type.value))
+        pending.append((req, papers))
+    
+    generated = await GeminiClient().generate_content_batch(jobs)
+    
+    for (req, papers), result in zip(pending, generated):
+        if result is None:
+            results.append({
+                "status": "failed",
+                "topic": req.topic,
+                "error": "배치 작업에서 콘텐츠를 생성하지 못했습니다."
+            })
+            continue
+        
+        generator = generators[req.content_type]
+        content_id, _, _ = _save_content(
+            db, req, result["content"], generator.tone, result["quality_score"],
+            papers, generator.__class__.__name__
+        )
+        results.append({
+            "status": "success",
+            "content_id": content_id,
+            "topic": req.topic
+        })
+    
+    return results
+
 @router.get("/batch/{batch_id}")
 async def get_batch_status(batch_id: str):
     """배치 생성 상태 조회"""
@@ -661,7 +827,7 @@ async def transform_content(
         # 변환 실행
         prompt = f"{transformation_prompts[request.transformation_type]}\n\n원본 콘텐츠:\n{db_content.content}"
         
-        transformed_content = gemini_client.transform_content(
+        transformed_content = await gemini_client.transform_content(
             content=db_content.content,
             transformation_type=request.transformation_type,
             prompt=prompt
@@ -865,7 +1031,11 @@ async def complete_workflow(
         raise HTTPException(status_code=500, detail="워크플로우 완료 처리 중 오류가 발생했습니다")
 
 @router.delete("/{content_id}")
-async def delete_content(content_id: str, db: Session = Depends(get_db)):
+async def delete_content(
+    content_id: str,
+    background_tasks: BackgroundTasks,
+    db: Session = Depends(get_db)
+):
     """콘텐츠 삭제"""
     try:
         # 데이터베이스에서 콘텐츠 조회
@@ -874,24 +1044,27 @@ async def delete_content(content_id: str, db: Session = Depends(get_db)):
         if not db_content:
             raise HTTPException(status_code=404, detail="콘텐츠를 찾을 수 없습니다")
         
+        # 커밋 후에는 인스턴스가 만료되므로 필요한 값을 먼저 보관
+        topic = db_content.topic
+        content_type = db_content.content_type
+        cache_key = f"content_{hash(str({'topic': topic, 'category_id': db_content.category_id, 'content_type': content_type}))}"
+        
         # 콘텐츠 삭제
         db.delete(db_content)
         db.commit()
         
-        # 캐시에서도 삭제
-        cache_key = f"content_{hash(str({'topic': db_content.topic, 'category_id': db_content.category_id, 'content_type': db_content.content_type}))}"
-        advanced_cache.delete(cache_key)
-        
         app_logger.info(f"콘텐츠 삭제 완료: {content_id}")
         
-        # 감사 로깅
-        audit_logger.log_action(
+        # 캐시 삭제와 감사 로깅은 응답 전송 후 백그라운드에서 처리
+        background_tasks.add_task(advanced_cache.delete, cache_key)
+        background_tasks.add_task(
+            audit_logger.log_action,
             action="delete_content",
             entity_type="content",
             entity_id=content_id,
             changes={
-                "topic": db_content.topic,
-                "type": db_content.content_type
+                "topic": topic,
+                "type": content_type
             }
         )
         
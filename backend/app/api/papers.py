@@ -2,13 +2,23 @@
 논문 관련 API 엔드포인트
 """
 
-from fastapi import APIRouter, HTTPException, Query, Depends
-from typing import List, Dict, Any, Optional
+from fastapi import APIRouter, HTTPException, Query, Depends, Request, Response
+from fastapi.responses import StreamingResponse
+from typing import AsyncIterator, List, Dict, Any, Literal, Optional, Set
 from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 from enum import Enum
+from collections import defaultdict
+from functools import wraps
+from types import SimpleNamespace as MockPaper
+import asyncio
+import heapq
+import hashlib
+import time
+import json
+import orjson
 
-from ..services.paper_quality_evaluator import PaperQualityEvaluator, QualityGrade
+from ..services.paper_quality_evaluator import PaperQualityEvaluator, QualityGrade, paper_quality_evaluator
 from ..services.advanced_cache_manager import advanced_cache
 from ..services.performance_optimizer import performance_optimizer
 from ..utils.logging_config import app_logger, audit_logger
@@ -101,7 +111,7 @@ class SubcategoryResponse(BaseModel):
 # 의존성
 async def get_paper_evaluator():
     """논문 평가기 인스턴스"""
-    return PaperQualityEvaluator()
+    return paper_quality_evaluator
 
 # 모의 논문 데이터베이스
 MOCK_PAPERS = [
@@ -143,458 +153,531 @@ MOCK_PAPERS = [
     }
 ]
 
+# 논문 발견 시 동시에 요청할 주제 변형 수
+SPECULATIVE_DISCOVERY_ATTEMPTS = 4
+
+# 응답의 created_at에 쓰는 현재 시각 문자열 (lifespan에서 시작한 작업이 1초마다 갱신)
+_CURRENT_ISO = datetime.now().isoformat()
+# 마지막 갱신 시각 (monotonic, 갱신 작업이 없으면 None)
+_LAST_TICK: Optional[float] = None
+# 갱신이 이보다 오래 없으면 갱신 작업이 멈춘 것으로 보고 직접 계산 (초)
+TIMESTAMP_TICKER_STALE_AFTER = 2.0
+
+# 갱신 작업이 없을 때 쓰는 초 단위 캐시
+_now_iso_cache = {"second": None, "iso": ""}
+
+async def run_timestamp_ticker(interval: float = 1.0):
+    """현재 시각 문자열을 주기적으로 갱신"""
+    global _CURRENT_ISO, _LAST_TICK
+    try:
+        while True:
+            _CURRENT_ISO = datetime.now().isoformat()
+            _LAST_TICK = time.monotonic()
+            await asyncio.sleep(interval)
+    finally:
+        _LAST_TICK = None
+
+def _now_iso() -> str:
+    """현재 시각 ISO 문자열 (1초 해상도)
+    
+    갱신 작업이 돌고 있으면 그 값을 쓰고, 그렇지 않으면(lifespan 없이 라우터만
+    마운트한 앱, 테스트 클라이언트 등) 같은 초 안에서만 재사용하며 직접 계산한다.
+    """
+    if _LAST_TICK is not None and time.monotonic() - _LAST_TICK <= TIMESTAMP_TICKER_STALE_AFTER:
+        return _CURRENT_ISO
+        
+    now = datetime.now()
+    second = int(now.timestamp())
+    if _now_iso_cache["second"] != second:
+        _now_iso_cache["iso"] = now.isoformat()
+        _now_iso_cache["second"] = second
+    return _now_iso_cache["iso"]
+
+def _to_response(paper_data: Dict[str, Any], quality_info) -> PaperResponse:
+    """논문 데이터와 평가 결과로 응답 모델 생성 (내부 데이터이므로 검증 생략)"""
+    return PaperResponse.model_construct(
+        id=paper_data['id'],
+        title=paper_data['title'],
+        authors=paper_data['authors'],
+        journal=paper_data['journal'],
+        year=paper_data['year'],
+        doi=paper_data.get('doi'),
+        abstract=paper_data.get('abstract'),
+        paper_type=paper_data['paper_type'],
+        impact_factor=paper_data['impact_factor'],
+        citations=paper_data['citations'],
+        quality_info=PaperQualityInfo.model_construct(
+            quality_score=quality_info.quality_score,
+            grade=quality_info.grade.value,
+            details=quality_info.details,
+            strengths=quality_info.strengths,
+            weaknesses=quality_info.weaknesses
+        ),
+        created_at=_now_iso()
+    )
+
+# MOCK_PAPERS는 변하지 않으므로 평가 결과를 모듈 로드 시 한 번만 계산
+EVALUATED_PAPERS: Dict[str, PaperResponse] = {
+    paper_data['id']: _to_response(paper_data, paper_quality_evaluator.evaluate_paper(MockPaper(**paper_data)))
+    for paper_data in MOCK_PAPERS
+}
+
+def _trigrams(text: str) -> Set[str]:
+    """문자열의 3-gram 집합"""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+# 검색용 소문자 제목/초록과 3-gram 역색인 (요청마다 lower()를 반복하지 않도록 미리 계산)
+_PAPER_TITLES_LC = [paper_data['title'].lower() for paper_data in MOCK_PAPERS]
+_PAPER_ABSTRACTS_LC = [paper_data['abstract'].lower() for paper_data in MOCK_PAPERS]
+_TRIGRAM_INDEX: Dict[str, Set[int]] = defaultdict(set)
+for _idx, (_title_lc, _abstract_lc) in enumerate(zip(_PAPER_TITLES_LC, _PAPER_ABSTRACTS_LC)):
+    for _gram in _trigrams(_title_lc) | _trigrams(_abstract_lc):
+        _TRIGRAM_INDEX[_gram].add(_idx)
+
+def _search_candidates(query_lc: str) -> List[int]:
+    """검색어의 모든 3-gram을 포함하는 논문 인덱스 (실제 부분 문자열 검사는 호출 측에서 수행)"""
+    grams = _trigrams(query_lc)
+    if not grams:
+        return list(range(len(MOCK_PAPERS)))
+    
+    postings = sorted((_TRIGRAM_INDEX.get(gram, set()) for gram in grams), key=len)
+    return sorted(postings[0].intersection(*postings[1:]))
+
+# 정적 엔드포인트용 직렬화 가능 형태 (요청 시 Pydantic 모델 재구성 없이 바로 JSON으로 인코딩)
+_PAPER_PAYLOADS: Dict[str, Dict[str, Any]] = {
+    paper_id: paper_response.model_dump()
+    for paper_id, paper_response in EVALUATED_PAPERS.items()
+}
+
+_PAPER_LIST_ADAPTER = TypeAdapter(List[PaperResponse])
+
+def _papers_with_timestamp(paper_ids: List[str]) -> List[PaperResponse]:
+    """미리 계산된 페이로드로 응답 모델 목록을 한 번에 생성"""
+    created_at = _now_iso()
+    return _PAPER_LIST_ADAPTER.validate_python([
+        {**_PAPER_PAYLOADS[paper_id], "created_at": created_at}
+        for paper_id in paper_ids
+    ])
+
+def _build_quality_distribution() -> Dict[str, Any]:
+    """품질 등급 분포 계산"""
+    distribution = {
+        'A+': 0, 'A': 0, 'B+': 0, 'B': 0, 'C': 0, 'D': 0
+    }
+    
+    for paper_response in EVALUATED_PAPERS.values():
+        distribution[paper_response.quality_info.grade] += 1
+    
+    total = sum(distribution.values())
+    
+    return {
+        "distribution": distribution,
+        "percentages": {
+            grade: (count / total * 100) if total > 0 else 0
+            for grade, count in distribution.items()
+        },
+        "total_papers": total,
+        "high_quality_count": distribution['A+'] + distribution['A'] + distribution['B+']
+    }
+
+_QUALITY_DISTRIBUTION = _build_quality_distribution()
+
+# 등급 순위 (낮은 등급부터)
+GRADE_RANK = {grade: rank for rank, grade in enumerate(['D', 'C', 'B', 'B+', 'A', 'A+'])}
+
+# 최소 등급별로 미리 걸러 둔 논문 목록
+PAPERS_BY_MIN_GRADE: Dict[str, List[PaperResponse]] = {
+    min_grade: [
+        paper_response for paper_response in EVALUATED_PAPERS.values()
+        if GRADE_RANK[paper_response.quality_info.grade] >= min_rank
+    ]
+    for min_grade, min_rank in GRADE_RANK.items()
+}
+
+# 논문 목록 정렬 키
+_SORT_KEYS = {
+    SortField.QUALITY_SCORE: lambda p: p.quality_info.quality_score,
+    SortField.IMPACT_FACTOR: lambda p: p.impact_factor,
+    SortField.CITATIONS: lambda p: p.citations,
+    SortField.YEAR: lambda p: p.year,
+    SortField.TITLE: lambda p: p.title
+}
+
+# 정적 논문 데이터의 ETag (응답마다 달라지는 타임스탬프는 제외하므로 약한 ETag 사용)
+PAPERS_ETAG = 'W/"{}"'.format(hashlib.blake2b(
+    orjson.dumps(
+        [
+            {k: v for k, v in _PAPER_PAYLOADS[paper_data['id']].items() if k != "created_at"}
+            for paper_data in MOCK_PAPERS
+        ],
+        option=orjson.OPT_SORT_KEYS
+    ),
+    digest_size=8
+).hexdigest())
+
+_CACHE_HEADERS = {"ETag": PAPERS_ETAG, "Cache-Control": "public, max-age=600", "Vary": "Accept"}
+
+def _is_not_modified(request: Request) -> bool:
+    """If-None-Match 헤더가 현재 ETag와 일치하는지 확인 (약한 비교)"""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in tags or PAPERS_ETAG.removeprefix("W/") in tags
+
+def _not_modified_response() -> Response:
+    """304 Not Modified 응답"""
+    return Response(status_code=304, headers=_CACHE_HEADERS)
+
+def _json_response(content: Dict[str, Any], headers: Optional[Dict[str, str]] = None) -> Response:
+    """orjson으로 직접 인코딩한 JSON 응답"""
+    return Response(content=orjson.dumps(content), media_type="application/json", headers=headers)
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+async def _stream_ndjson(papers: List[PaperResponse], created_at: str) -> AsyncIterator[bytes]:
+    """논문 목록을 NDJSON 행 단위로 직렬화"""
+    for paper in papers:
+        yield orjson.dumps({**_PAPER_PAYLOADS[paper.id], "created_at": created_at}) + b"\n"
+
+def _with_current_timestamp(paper_response: PaperResponse) -> PaperResponse:
+    """미리 계산된 응답에 요청 시각을 반영한 사본"""
+    return paper_response.model_copy(update={"created_at": _now_iso()})
+
+def _stable_cache_key(prefix: str, *parts: str) -> str:
+    """프로세스/워커 간에 동일한 캐시 키 생성 (내장 hash()는 프로세스마다 달라짐)
+    
+    각 구성 요소 사이에 단위 구분자(0x1f)를 넣어 ("ab", "c")와 ("a", "bc")가 충돌하지 않도록 함
+    """
+    hasher = hashlib.blake2b(digest_size=8)
+    for i, part in enumerate(parts):
+        if i:
+            hasher.update(b"\x1f")
+        hasher.update(part.encode())
+    return f"{prefix}_{hasher.hexdigest()}"
+
+def _handle_errors(action: str):
+    """엔드포인트 공통 예외 처리 데코레이터
+    
+    HTTPException은 그대로 전달하고, 그 외 예외는 로깅 후 500 응답으로 변환
+    """
+    def decorator(func):
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            try:
+                return await func(*args, **kwargs)
+            except HTTPException:
+                raise
+            except Exception as e:
+                app_logger.error(f"{action} 실패: {e}", exc_info=True)
+                raise HTTPException(status_code=500, detail=f"{action} 중 오류가 발생했습니다")
+        return wrapper
+    return decorator
+
 @router.post("/search", response_model=PaperListResponse)
 @performance_optimizer.measure_performance("paper_search")
-async def search_papers(
-    request: PaperSearchRequest,
-    evaluator: PaperQualityEvaluator = Depends(get_paper_evaluator)
-):
+@_handle_errors("논문 검색")
+async def search_papers(request: PaperSearchRequest):
     """논문 검색"""
-    try:
-        # 입력 검증
-        query = bug_fix_utils.safe_string_processing(request.query)
-        if not query:
-            raise HTTPException(status_code=400, detail="유효한 검색어를 입력해주세요")
-        
-        # 캐시 확인
-        cache_key = f"paper_search_{hash(str(request.dict()))}"
-        cached_result = advanced_cache.get(cache_key)
-        
-        if cached_result:
-            app_logger.info(f"캐시에서 논문 검색 결과 반환: {query}")
-            return cached_result
-        
-        # 논문 검색 (모의 구현)
-        filtered_papers = []
-        
-        for paper_data in MOCK_PAPERS:
-            # 검색어 매칭
-            if query.lower() not in paper_data['title'].lower() and \
-               query.lower() not in paper_data['abstract'].lower():
-                continue
-            
-            # 필터 적용
-            if request.paper_types and paper_data['paper_type'] not in [pt.value for pt in request.paper_types]:
-                continue
-            if request.min_impact_factor and paper_data['impact_factor'] < request.min_impact_factor:
-                continue
-            if request.min_year and paper_data['year'] < request.min_year:
-                continue
-            
-            # 논문 평가
-            class MockPaper:
-                def __init__(self, **kwargs):
-                    for k, v in kwargs.items():
-                        setattr(self, k, v)
-            
-            paper = MockPaper(**paper_data)
-            quality_info = evaluator.evaluate_paper(paper)
-            
-            # 응답 생성
-            paper_response = PaperResponse(
-                id=paper_data['id'],
-                title=paper_data['title'],
-                authors=paper_data['authors'],
-                journal=paper_data['journal'],
-                year=paper_data['year'],
-                doi=paper_data.get('doi'),
-                abstract=paper_data.get('abstract'),
-                paper_type=paper_data['paper_type'],
-                impact_factor=paper_data['impact_factor'],
-                citations=paper_data['citations'],
-                quality_info=PaperQualityInfo(
-                    quality_score=quality_info.quality_score,
-                    grade=quality_info.grade.value,
-                    details=quality_info.details,
-                    strengths=quality_info.strengths,
-                    weaknesses=quality_info.weaknesses
-                ),
-                created_at=datetime.now().isoformat()
-            )
-            
-            filtered_papers.append(paper_response)
-            
-            if len(filtered_papers) >= request.max_results:
-                break
-        
-        response = PaperListResponse(
-            papers=filtered_papers,
-            total=len(filtered_papers),
-            query=query,
-            filters_applied={
-                'paper_types': [pt.value for pt in request.paper_types] if request.paper_types else None,
-                'min_impact_factor': request.min_impact_factor,
-                'min_year': request.min_year
-            }
-        )
-        
-        # 캐시 저장
-        advanced_cache.set(cache_key, response, ttl=3600*6)  # 6시간
-        
-        # 감사 로깅
-        audit_logger.log_action(
-            action="search_papers",
-            entity_type="paper",
-            entity_id=query,
-            changes={"result_count": len(filtered_papers)}
-        )
-        
-        return response
-        
-    except Exception as e:
-        app_logger.error(f"논문 검색 실패: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail="논문 검색 중 오류가 발생했습니다")
+    # 입력 검증
+    query = bug_fix_utils.safe_string_processing(request.query)
+    if not query:
+        raise HTTPException(status_code=400, detail="유효한 검색어를 입력해주세요")
+    
+    # 캐시 확인
+    cache_key = _stable_cache_key(
+        "paper_search",
+        json.dumps(request.dict(), sort_keys=True, ensure_ascii=False, default=str)
+    )
+    cached_result = advanced_cache.get(cache_key)
+    
+    if cached_result:
+        app_logger.info(f"캐시에서 논문 검색 결과 반환: {query}")
+        return cached_result
+    
+    # 논문 검색 (모의 구현)
+    matched_ids = []
+    query_lc = query.lower()
+    paper_types = {pt.value for pt in request.paper_types} if request.paper_types else None
+    
+    for idx in _search_candidates(query_lc):
+        # 검색어 매칭
+        if query_lc not in _PAPER_TITLES_LC[idx] and query_lc not in _PAPER_ABSTRACTS_LC[idx]:
+            continue
+        
+        paper_data = MOCK_PAPERS[idx]
+        
+        # 필터 적용
+        if paper_types and paper_data['paper_type'] not in paper_types:
+            continue
+        if request.min_impact_factor and paper_data['impact_factor'] < request.min_impact_factor:
+            continue
+        if request.min_year and paper_data['year'] < request.min_year:
+            continue
+        
+        matched_ids.append(paper_data['id'])
+        
+        if len(matched_ids) >= request.max_results:
+            break
+    
+    filtered_papers = _papers_with_timestamp(matched_ids)
+    
+    response = PaperListResponse(
+        papers=filtered_papers,
+        total=len(filtered_papers),
+        query=query,
+        filters_applied={
+            'paper_types': [pt.value for pt in request.paper_types] if request.paper_types else None,
+            'min_impact_factor': request.min_impact_factor,
+            'min_year': request.min_year
+        }
+    )
+    
+    # 캐시 저장
+    advanced_cache.set(cache_key, response, ttl=3600*6)  # 6시간
+    
+    # 감사 로깅
+    audit_logger.enqueue_action(
+        action="search_papers",
+        entity_type="paper",
+        entity_id=query,
+        changes={"result_count": len(filtered_papers)}
+    )
+    
+    return response
 
 @router.get("/{paper_id}", response_model=PaperResponse)
-async def get_paper(
-    paper_id: str,
-    evaluator: PaperQualityEvaluator = Depends(get_paper_evaluator)
-):
+@_handle_errors("논문 조회")
+async def get_paper(paper_id: str, request: Request, response: Response):
     """논문 상세 조회"""
-    try:
-        # 논문 찾기
-        paper_data = None
-        for p in MOCK_PAPERS:
-            if p['id'] == paper_id:
-                paper_data = p
-                break
-        
-        if not paper_data:
-            raise HTTPException(status_code=404, detail="논문을 찾을 수 없습니다")
-        
-        # 논문 평가
-        class MockPaper:
-            def __init__(self, **kwargs):
-                for k, v in kwargs.items():
-                    setattr(self, k, v)
-        
-        paper = MockPaper(**paper_data)
-        quality_info = evaluator.evaluate_paper(paper)
-        
-        return PaperResponse(
-            id=paper_data['id'],
-            title=paper_data['title'],
-            authors=paper_data['authors'],
-            journal=paper_data['journal'],
-            year=paper_data['year'],
-            doi=paper_data.get('doi'),
-            abstract=paper_data.get('abstract'),
-            paper_type=paper_data['paper_type'],
-            impact_factor=paper_data['impact_factor'],
-            citations=paper_data['citations'],
-            quality_info=PaperQualityInfo(
-                quality_score=quality_info.quality_score,
-                grade=quality_info.grade.value,
-                details=quality_info.details,
-                strengths=quality_info.strengths,
-                weaknesses=quality_info.weaknesses
-            ),
-            created_at=datetime.now().isoformat()
-        )
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        app_logger.error(f"논문 조회 실패: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail="논문 조회 중 오류가 발생했습니다")
+    paper_response = EVALUATED_PAPERS.get(paper_id)
+    
+    if not paper_response:
+        raise HTTPException(status_code=404, detail="논문을 찾을 수 없습니다")
+    
+    if _is_not_modified(request):
+        return _not_modified_response()
+    
+    response.headers.update(_CACHE_HEADERS)
+    return _with_current_timestamp(paper_response)
 
 @router.post("/evaluate", response_model=PaperQualityInfo)
+@_handle_errors("논문 평가")
 async def evaluate_paper(
     request: PaperEvaluationRequest,
     evaluator: PaperQualityEvaluator = Depends(get_paper_evaluator)
 ):
     """논문 품질 평가"""
-    try:
-        # MockPaper 객체 생성
-        class MockPaper:
-            def __init__(self, **kwargs):
-                for k, v in kwargs.items():
-                    setattr(self, k, v)
-        
-        paper = MockPaper(**request.dict())
-        
-        # 논문 검증
-        if not data_validator.validate_paper(paper):
-            raise HTTPException(status_code=400, detail="유효하지 않은 논문 정보입니다")
-        
-        # 품질 평가
-        quality_info = evaluator.evaluate_paper(paper)
-        
-        return PaperQualityInfo(
-            quality_score=quality_info.quality_score,
-            grade=quality_info.grade.value,
-            details=quality_info.details,
-            strengths=quality_info.strengths,
-            weaknesses=quality_info.weaknesses
-        )
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        app_logger.error(f"논문 평가 실패: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail="논문 평가 중 오류가 발생했습니다")
+    # MockPaper 객체 생성
+    paper = MockPaper(**request.dict())
+    
+    # 논문 검증
+    if not data_validator.validate_paper(paper):
+        raise HTTPException(status_code=400, detail="유효하지 않은 논문 정보입니다")
+    
+    # 품질 평가
+    quality_info = evaluator.evaluate_paper(paper)
+    
+    return PaperQualityInfo.model_construct(
+        quality_score=quality_info.quality_score,
+        grade=quality_info.grade.value,
+        details=quality_info.details,
+        strengths=quality_info.strengths,
+        weaknesses=quality_info.weaknesses
+    )
 
 @router.get("/", response_model=PaperListResponse)
+@_handle_errors("논문 목록 조회")
 async def list_papers(
+    request: Request,
     page: int = Query(1, ge=1, description="페이지 번호"),
     size: int = Query(10, ge=1, le=50, description="페이지 크기"),
     sort_by: SortField = Query(SortField.QUALITY_SCORE, description="정렬 필드"),
-    order: str = Query("desc", regex="^(asc|desc)$", description="정렬 순서"),
-    min_grade: Optional[str] = Query(None, regex="^(A\\+|A|B\\+|B|C|D)$", description="최소 등급")
+    order: Literal["asc", "desc"] = Query("desc", description="정렬 순서"),
+    min_grade: Optional[Literal["A+", "A", "B+", "B", "C", "D"]] = Query(None, description="최소 등급")
 ):
     """논문 목록 조회"""
-    try:
-        evaluator = PaperQualityEvaluator()
-        
-        # 모든 논문 평가
-        evaluated_papers = []
-        for paper_data in MOCK_PAPERS:
-            class MockPaper:
-                def __init__(self, **kwargs):
-                    for k, v in kwargs.items():
-                        setattr(self, k, v)
-            
-            paper = MockPaper(**paper_data)
-            quality_info = evaluator.evaluate_paper(paper)
-            
-            # 등급 필터
-            if min_grade:
-                grade_order = ['D', 'C', 'B', 'B+', 'A', 'A+']
-                if grade_order.index(quality_info.grade.value) < grade_order.index(min_grade):
-                    continue
-            
-            paper_response = PaperResponse(
-                id=paper_data['id'],
-                title=paper_data['title'],
-                authors=paper_data['authors'],
-                journal=paper_data['journal'],
-                year=paper_data['year'],
-                doi=paper_data.get('doi'),
-                abstract=paper_data.get('abstract'),
-                paper_type=paper_data['paper_type'],
-                impact_factor=paper_data['impact_factor'],
-                citations=paper_data['citations'],
-                quality_info=PaperQualityInfo(
-                    quality_score=quality_info.quality_score,
-                    grade=quality_info.grade.value,
-                    details=quality_info.details,
-                    strengths=quality_info.strengths,
-                    weaknesses=quality_info.weaknesses
-                ),
-                created_at=datetime.now().isoformat()
-            )
-            
-            evaluated_papers.append(paper_response)
-        
-        # 정렬
-        if sort_by == SortField.QUALITY_SCORE:
-            evaluated_papers.sort(key=lambda x: x.quality_info.quality_score, reverse=(order == "desc"))
-        elif sort_by == SortField.IMPACT_FACTOR:
-            evaluated_papers.sort(key=lambda x: x.impact_factor, reverse=(order == "desc"))
-        elif sort_by == SortField.CITATIONS:
-            evaluated_papers.sort(key=lambda x: x.citations, reverse=(order == "desc"))
-        elif sort_by == SortField.YEAR:
-            evaluated_papers.sort(key=lambda x: x.year, reverse=(order == "desc"))
-        elif sort_by == SortField.TITLE:
-            evaluated_papers.sort(key=lambda x: x.title, reverse=(order == "desc"))
-        
-        # 페이지네이션
-        start = (page - 1) * size
-        end = start + size
-        paginated_papers = evaluated_papers[start:end]
-        
-        return PaperListResponse(
-            papers=paginated_papers,
-            total=len(evaluated_papers),
-            query="all",
-            filters_applied={'min_grade': min_grade}
+    if _is_not_modified(request):
+        return _not_modified_response()
+    
+    # 등급 필터
+    if min_grade:
+        evaluated_papers = PAPERS_BY_MIN_GRADE[min_grade]
+    else:
+        evaluated_papers = list(EVALUATED_PAPERS.values())
+    
+    # 정렬 및 페이지네이션 (요청된 페이지 끝까지만 부분 정렬)
+    start = (page - 1) * size
+    end = start + size
+    select_top = heapq.nlargest if order == "desc" else heapq.nsmallest
+    top_papers = select_top(end, evaluated_papers, key=_SORT_KEYS[sort_by])
+    
+    created_at = _now_iso()
+    
+    # NDJSON 요청 시 한 줄씩 스트리밍 (목록 전체를 만들지 않음)
+    if NDJSON_MEDIA_TYPE in request.headers.get("accept", ""):
+        return StreamingResponse(
+            _stream_ndjson(top_papers[start:end], created_at),
+            media_type=NDJSON_MEDIA_TYPE,
+            headers=_CACHE_HEADERS
         )
-        
-    except Exception as e:
-        app_logger.error(f"논문 목록 조회 실패: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail="논문 목록 조회 중 오류가 발생했습니다")
+    
+    paginated_papers = [
+        {**_PAPER_PAYLOADS[p.id], "created_at": created_at}
+        for p in top_papers[start:end]
+    ]
+    
+    return _json_response({
+        "papers": paginated_papers,
+        "total": len(evaluated_papers),
+        "query": "all",
+        "filters_applied": {'min_grade': min_grade}
+    }, headers=_CACHE_HEADERS)
 
 @router.get("/category/{category_id}/papers", response_model=PaperListResponse)
+@_handle_errors("카테고리별 논문 조회")
 async def get_papers_by_category(
     category_id: str,
     limit: int = Query(10, ge=1, le=50, description="최대 결과 수")
 ):
     """카테고리별 관련 논문 조회"""
-    try:
-        # TODO: 실제 카테고리-논문 매핑 구현
-        # 현재는 카테고리와 관련 있을 것 같은 논문 반환
-        
-        evaluator = PaperQualityEvaluator()
-        related_papers = []
-        
-        # 샘플: 처음 몇 개 논문 반환
-        for paper_data in MOCK_PAPERS[:limit]:
-            class MockPaper:
-                def __init__(self, **kwargs):
-                    for k, v in kwargs.items():
-                        setattr(self, k, v)
-            
-            paper = MockPaper(**paper_data)
-            quality_info = evaluator.evaluate_paper(paper)
-            
-            paper_response = PaperResponse(
-                id=paper_data['id'],
-                title=paper_data['title'],
-                authors=paper_data['authors'],
-                journal=paper_data['journal'],
-                year=paper_data['year'],
-                doi=paper_data.get('doi'),
-                abstract=paper_data.get('abstract'),
-                paper_type=paper_data['paper_type'],
-                impact_factor=paper_data['impact_factor'],
-                citations=paper_data['citations'],
-                quality_info=PaperQualityInfo(
-                    quality_score=quality_info.quality_score,
-                    grade=quality_info.grade.value,
-                    details=quality_info.details,
-                    strengths=quality_info.strengths,
-                    weaknesses=quality_info.weaknesses
-                ),
-                created_at=datetime.now().isoformat()
-            )
-            
-            related_papers.append(paper_response)
-        
-        return PaperListResponse(
-            papers=related_papers,
-            total=len(related_papers),
-            query=f"category:{category_id}",
-            filters_applied={'category_id': category_id}
-        )
-        
-    except Exception as e:
-        app_logger.error(f"카테고리별 논문 조회 실패: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail="카테고리별 논문 조회 중 오류가 발생했습니다")
+    # TODO: 실제 카테고리-논문 매핑 구현
+    # 현재는 카테고리와 관련 있을 것 같은 논문 반환
+    
+    # 샘플: 처음 몇 개 논문 반환
+    related_papers = _papers_with_timestamp([paper_data['id'] for paper_data in MOCK_PAPERS[:limit]])
+    
+    return PaperListResponse(
+        papers=related_papers,
+        total=len(related_papers),
+        query=f"category:{category_id}",
+        filters_applied={'category_id': category_id}
+    )
 
 @router.get("/quality/distribution")
-async def get_quality_distribution():
+@_handle_errors("품질 분포 조회")
+async def get_quality_distribution(request: Request):
     """논문 품질 등급 분포"""
-    try:
-        evaluator = PaperQualityEvaluator()
-        
-        distribution = {
-            'A+': 0, 'A': 0, 'B+': 0, 'B': 0, 'C': 0, 'D': 0
-        }
-        
-        for paper_data in MOCK_PAPERS:
-            class MockPaper:
-                def __init__(self, **kwargs):
-                    for k, v in kwargs.items():
-                        setattr(self, k, v)
-            
-            paper = MockPaper(**paper_data)
-            quality_info = evaluator.evaluate_paper(paper)
-            distribution[quality_info.grade.value] += 1
-        
-        total = sum(distribution.values())
-        
-        return {
-            "distribution": distribution,
-            "percentages": {
-                grade: (count / total * 100) if total > 0 else 0
-                for grade, count in distribution.items()
-            },
-            "total_papers": total,
-            "high_quality_count": distribution['A+'] + distribution['A'] + distribution['B+'],
-            "generated_at": datetime.now().isoformat()
-        }
-        
-    except Exception as e:
-        app_logger.error(f"품질 분포 조회 실패: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail="품질 분포 조회 중 오류가 발생했습니다")
+    if _is_not_modified(request):
+        return _not_modified_response()
+    
+    return _json_response({
+        **_QUALITY_DISTRIBUTION,
+        "generated_at": _now_iso()
+    }, headers=_CACHE_HEADERS)
 
 @router.post("/discover", response_model=SubcategoryResponse)
 @performance_optimizer.measure_performance("paper_discovery")
+@_handle_errors("논문 발견")
 async def discover_papers(
     request: PaperDiscoveryRequest,
     evaluator: PaperQualityEvaluator = Depends(get_paper_evaluator)
 ):
     """카테고리와 주제를 기반으로 논문 검색 및 서브카테고리 생성"""
-    try:
-        # 입력 검증
-        category = bug_fix_utils.safe_string_processing(request.category)
-        topic = bug_fix_utils.safe_string_processing(request.topic)
-        
-        if not category or not topic:
-            raise HTTPException(status_code=400, detail="유효한 카테고리와 주제를 입력해주세요")
-        
-        # 캐시 확인
-        cache_key = f"paper_discover_{hash(category + topic)}"
-        cached_result = advanced_cache.get(cache_key)
-        
-        if cached_result:
-            app_logger.info(f"캐시에서 논문 발견 결과 반환: {category}/{topic}")
-            return cached_result
-        
-        # Gemini 클라이언트 초기화
-        from ..services.gemini_client import GeminiClient
-        gemini_client = GeminiClient()
+    # 입력 검증
+    category = bug_fix_utils.safe_string_processing(request.category)
+    topic = bug_fix_utils.safe_string_processing(request.topic)
+    
+    if not category or not topic:
+        raise HTTPException(status_code=400, detail="유효한 카테고리와 주제를 입력해주세요")
+    
+    # 캐시 확인
+    cache_key = _stable_cache_key("paper_discover", category, topic)
+    cached_result = advanced_cache.get(cache_key)
+    
+    if cached_result:
+        app_logger.info(f"캐시에서 논문 발견 결과 반환: {category}/{topic}")
+        return cached_result
+    
+    # Gemini 클라이언트 초기화
+    from ..services.gemini_client import GeminiClient
+    gemini_client = GeminiClient()
+    
+    # 논문 검색 및 서브카테고리 생성 (최대 15회 시도)
+    max_attempts = 15
+    
+    async def _attempt(attempt: int):
+        app_logger.info(f"논문 검색 시도 {attempt + 1}/{max_attempts}: {category}/{topic}")
+        
+        # 시도할 때마다 약간 다른 주제로 변형
+        if attempt > 0:
+            topic_variation = f"{topic} (변형 {attempt})"
+        else:
+            topic_variation = topic
+        
+        # 한 변형의 실패가 동시에 진행 중인 다른 변형까지 중단시키지 않도록 실패는 결과 없음으로 처리
+        try:
+            result = await gemini_client.discover_papers_for_topic(category, topic_variation)
+        except Exception as e:
+            app_logger.warning(f"논문 검색 시도 {attempt + 1} 실패: {e}")
+            result = None
+        return attempt, result
+    
+    found = None
+    
+    # 변형을 SPECULATIVE_DISCOVERY_ATTEMPTS개씩 동시에 요청하고 가장 먼저 성공한 결과를 사용
+    for batch_start in range(0, max_attempts, SPECULATIVE_DISCOVERY_ATTEMPTS):
+        batch_end = min(batch_start + SPECULATIVE_DISCOVERY_ATTEMPTS, max_attempts)
+        tasks = [asyncio.create_task(_attempt(attempt)) for attempt in range(batch_start, batch_end)]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                attempt, subcategory_result = await next_done
+                if subcategory_result:
+                    found = (attempt, subcategory_result)
+                    break
+        finally:
+            # 남은 요청은 취소하고 취소가 끝날 때까지 대기
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        
+        if found:
+            break
+    
+    if found:
+        attempt, subcategory_result = found
+        
+        # 결과를 응답 형식으로 변환
+        response = SubcategoryResponse(
+            name=subcategory_result.name,
+            description=subcategory_result.description,
+            papers=[{
+                "title": p.title,
+                "authors": p.authors,
+                "journal": p.journal,
+                "publication_year": p.year,
+                "doi": p.doi,
+                "impact_factor": p.impact_factor,
+                "citations": p.citations,
+                "paper_type": p.paper_type
+            } for p in subcategory_result.papers],
+            expected_effect=subcategory_result.expected_effect,
+            quality_score=subcategory_result.quality_score,
+            quality_grade=subcategory_result.quality_grade
+        )
         
-        # 논문 검색 및 서브카테고리 생성 (최대 15회 시도)
-        max_attempts = 15
-        for attempt in range(max_attempts):
-            app_logger.info(f"논문 검색 시도 {attempt + 1}/{max_attempts}: {category}/{topic}")
-            
-            # 시도할 때마다 약간 다른 주제로 변형
-            if attempt > 0:
-                topic_variation = f"{topic} (변형 {attempt})"
-            else:
-                topic_variation = topic
-            
-            subcategory_result = gemini_client.discover_papers_for_topic(category, topic_variation)
-            
-            if subcategory_result:
-                # 결과를 응답 형식으로 변환
-                response = SubcategoryResponse(
-                    name=subcategory_result.name,
-                    description=subcategory_result.description,
-                    papers=[{
-                        "title": p.title,
-                        "authors": p.authors,
-                        "journal": p.journal,
-                        "publication_year": p.year,
-                        "doi": p.doi,
-                        "impact_factor": p.impact_factor,
-                        "citations": p.citations,
-                        "paper_type": p.paper_type
-                    } for p in subcategory_result.papers],
-                    expected_effect=subcategory_result.expected_effect,
-                    quality_score=subcategory_result.quality_score,
-                    quality_grade=subcategory_result.quality_grade
-                )
-                
-                # 캐시 저장 (12시간)
-                advanced_cache.set(cache_key, response, ttl=3600*12)
-                
-                # 감사 로깅
-                audit_logger.log_action(
-                    action="discover_papers",
-                    entity_type="subcategory",
-                    entity_id=subcategory_result.name,
-                    changes={
-                        "category": category,
-                        "topic": topic,
-                        "papers_found": len(subcategory_result.papers),
-                        "attempts": attempt + 1
-                    }
-                )
-                
-                return response
+        # 캐시 저장 (12시간)
+        advanced_cache.set(cache_key, response, ttl=3600*12)
         
-        # 모든 시도가 실패한 경우
-        app_logger.warning(f"논문 발견 실패 (모든 시도 소진): {category}/{topic}")
-        raise HTTPException(
-            status_code=404, 
-            detail="해당 주제에 대한 적절한 논문을 찾을 수 없습니다. 다른 주제를 시도해보세요."
+        # 감사 로깅
+        audit_logger.enqueue_action(
+            action="discover_papers",
+            entity_type="subcategory",
+            entity_id=subcategory_result.name,
+            changes={
+                "category": category,
+                "topic": topic,
+                "papers_found": len(subcategory_result.papers),
+                "attempts": attempt + 1
+            }
         )
         
-    except HTTPException:
-        raise
-    except Exception as e:
-        app_logger.error(f"논문 발견 실패: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail="논문 발견 중 오류가 발생했습니다")
\ No newline at end of file
+        return response
+    
+    # 모든 시도가 실패한 경우
+    app_logger.warning(f"논문 발견 실패 (모든 시도 소진): {category}/{topic}")
+    raise HTTPException(
+        status_code=404, 
+        detail="해당 주제에 대한 적절한 논문을 찾을 수 없습니다. 다른 주제를 시도해보세요."
+    )
@@ -1,7 +1,9 @@
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from contextlib import asynccontextmanager
 from datetime import datetime
+import asyncio
 import os
 import sys
 from pathlib import Path
@@ -11,6 +13,7 @@ sys.path.append(str(Path(__file__).parent.parent))
 
 from app.api import categories, papers, contents, health, cache, analytics
 from app.models.database import init_db
+from app.utils.logging_config import audit_logger
 
 # Lifespan context manager for startup/shutdown
 @asynccontextmanager
@@ -20,31 +23,45 @@ async def lifespan(app: FastAPI):
     # Initialize database
     init_db()
     print("Database initialized successfully")
+    # Keep the cached response timestamp fresh
+    timestamp_task = asyncio.create_task(papers.run_timestamp_ticker())
+    # Write audit logs off the request path
+    audit_task = asyncio.create_task(audit_logger.run_drain())
     yield
     # Shutdown
     print("Shutting down...")
+    timestamp_task.cancel()
+    audit_task.cancel()
+    # Wait for the drain task to flush queued audit records
+    await asyncio.gather(timestamp_task, audit_task, return_exceptions=True)
 
 # Create FastAPI app
 app = FastAPI(
     title="Enhanced Dynamic Content System v6.1",
     description="AI-powered content generation system based on academic papers",
     version="6.1.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # Configure CORS for frontend
+# 와일드카드 대신 실제 사용하는 메서드/헤더만 허용 (요청 헤더 반향 응답 생성 방지)
+CORS_ORIGINS = frozenset([
+    "http://localhost:3000", 
+    "http://localhost:3001", 
+    "http://localhost:3002", 
+    "http://localhost:3003", 
+    "http://localhost:5173"
+])  # React dev servers
+CORS_METHODS = ["GET", "POST", "PUT", "DELETE"]
+CORS_HEADERS = ["authorization", "content-type", "accept", "if-none-match"]
+
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=[
-        "http://localhost:3000", 
-        "http://localhost:3001", 
-        "http://localhost:3002", 
-        "http://localhost:3003", 
-        "http://localhost:5173"
-    ],  # React dev servers
+    allow_origins=CORS_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=CORS_METHODS,
+    allow_headers=CORS_HEADERS,
 )
 
 # Include routers
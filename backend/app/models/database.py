@@ -1,13 +1,17 @@
-from sqlalchemy import create_engine, String, Float, Integer, DateTime, ForeignKey, Text, text
-from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship, sessionmaker
+from sqlalchemy import create_engine, event, func, insert, Index, MetaData, String, Float, Integer, DateTime, ForeignKey, Text, text
+from sqlalchemy.schema import CreateTable
+from sqlalchemy.orm import DeclarativeBase, Mapped, Session, mapped_column, relationship, sessionmaker
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Callable, Dict, List, Optional, Type
+from functools import wraps
 import os
+import time
 from pathlib import Path
 
 # Database configuration
 BASE_DIR = Path(__file__).parent.parent.parent
 DATABASE_URL = f"sqlite:///{BASE_DIR}/data/app.db"
+DB_PATH = BASE_DIR / "data" / "app.db"
 
 # Ensure data directory exists
 os.makedirs(f"{BASE_DIR}/data", exist_ok=True)
@@ -18,6 +22,22 @@ engine = create_engine(
     connect_args={"check_same_thread": False}  # Needed for SQLite
 )
 
+# SQLite PRAGMA settings applied to every new connection
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",      # Readers don't block writers; fsync per commit, not per statement
+    "PRAGMA synchronous=NORMAL",    # Safe with WAL, avoids a full fsync on every commit
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",   # 256MB
+    "PRAGMA cache_size=-65536",     # 64MB page cache
+)
+
+@event.listens_for(engine, "connect")
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    for pragma in SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
 # Create session
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
@@ -36,7 +56,7 @@ class Category(Base):
     seed_keyword: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
     practicality_score: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
     interest_score: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now(), nullable=False)
     
     # Relationships
     contents: Mapped[List["Content"]] = relationship("Content", back_populates="category")
@@ -50,31 +70,35 @@ class Paper(Base):
     authors: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     journal: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
     publication_year: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
-    doi: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    doi: Mapped[Optional[str]] = mapped_column(String(255), nullable=True, index=True)
     impact_factor: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
     citations: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     paper_type: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
     quality_score: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
     quality_grade: Mapped[Optional[str]] = mapped_column(String(10), nullable=True)
-    subcategory_id: Mapped[Optional[str]] = mapped_column(String, ForeignKey("subcategories.id"), nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+    subcategory_id: Mapped[Optional[str]] = mapped_column(String, ForeignKey("subcategories.id"), nullable=True, index=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now(), nullable=False)
     
     # Relationships
     contents: Mapped[List["Content"]] = relationship("Content", back_populates="paper")
 
 class Content(Base):
     __tablename__ = "contents"
+    __table_args__ = (
+        # Covers category_id lookups and "latest contents per category"
+        Index("ix_contents_category_created", "category_id", "created_at"),
+    )
     
     id: Mapped[str] = mapped_column(String, primary_key=True)
     topic: Mapped[str] = mapped_column(String(500), nullable=False)
     category_id: Mapped[str] = mapped_column(String, ForeignKey("categories.id"), nullable=False)
-    paper_id: Mapped[Optional[str]] = mapped_column(String, ForeignKey("papers.id"), nullable=True)
-    content_type: Mapped[str] = mapped_column(String(50), nullable=False)  # 'shorts', 'article', 'report'
+    paper_id: Mapped[Optional[str]] = mapped_column(String, ForeignKey("papers.id"), nullable=True, index=True)
+    content_type: Mapped[str] = mapped_column(String(50), nullable=False, index=True)  # 'shorts', 'article', 'report'
     content: Mapped[str] = mapped_column(Text, nullable=False)
     content_metadata: Mapped[Optional[str]] = mapped_column(Text, nullable=True)  # JSON string
     thinking_process: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     quality_score: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now(), nullable=False)
     
     # Relationships
     category: Mapped["Category"] = relationship("Category", back_populates="contents")
@@ -85,22 +109,57 @@ class Subcategory(Base):
     __tablename__ = "subcategories"
     
     id: Mapped[str] = mapped_column(String, primary_key=True)
-    category_id: Mapped[str] = mapped_column(String, ForeignKey("categories.id"), nullable=False)
+    category_id: Mapped[str] = mapped_column(String, ForeignKey("categories.id"), nullable=False, index=True)
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     expected_effect: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     quality_score: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
     quality_grade: Mapped[Optional[str]] = mapped_column(String(10), nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, server_default=func.now(), nullable=False)
     
     # Relationships
     category: Mapped["Category"] = relationship("Category", back_populates="subcategories")
     papers: Mapped[List["Paper"]] = relationship("Paper", backref="subcategory")
 
 # Database initialization
+def _rebuild_tables_without_server_defaults():
+    """Rebuild tables created before created_at got a server-side default
+    
+    SQLite can't ALTER a column default, so such tables are copied into a freshly
+    created table and swapped in. Indexes are recreated afterwards by init_db.
+    """
+    # Scratch copy of the schema so the new tables' foreign keys can resolve
+    scratch = MetaData()
+    for table in Base.metadata.sorted_tables:
+        table.to_metadata(scratch)
+    
+    with engine.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            columns = conn.exec_driver_sql(f'PRAGMA table_info("{table.name}")').fetchall()
+            # PRAGMA table_info rows: (cid, name, type, notnull, dflt_value, pk)
+            if not any(col[1] == "created_at" and col[4] is None for col in columns):
+                continue
+            
+            new_name = f"{table.name}_new"
+            new_table = table.to_metadata(scratch, name=new_name)
+            column_list = ", ".join(f'"{col[1]}"' for col in columns if col[1] in table.c)
+            
+            conn.execute(CreateTable(new_table))
+            conn.exec_driver_sql(
+                f'INSERT INTO "{new_name}" ({column_list}) SELECT {column_list} FROM "{table.name}"'
+            )
+            conn.exec_driver_sql(f'DROP TABLE "{table.name}"')
+            conn.exec_driver_sql(f'ALTER TABLE "{new_name}" RENAME TO "{table.name}"')
+            print(f"Rebuilt table {table.name} with server-side created_at default")
+
 def init_db():
     """Initialize database tables"""
     Base.metadata.create_all(bind=engine)
+    _rebuild_tables_without_server_defaults()
+    # create_all skips indexes of tables that already exist
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
     print(f"Database initialized at: {DATABASE_URL}")
 
 # Dependency to get DB session
@@ -111,7 +170,46 @@ def get_db():
     finally:
         db.close()
 
+def bulk_insert(db: Session, model: Type[Base], rows: List[Dict[str, Any]], chunk_size: int = 1000):
+    """Insert many rows with executemany in a single transaction"""
+    if not rows:
+        return
+    
+    stmt = insert(model)
+    try:
+        for i in range(0, len(rows), chunk_size):
+            db.execute(stmt, rows[i:i + chunk_size])
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+
+# Health check results are reused for a few seconds so frequent /health polling
+# (load balancers, k8s probes) doesn't hit the database on every request
+DB_CONNECTION_CHECK_TTL = 2
+DB_SIZE_CHECK_TTL = 5
+
+def _ttl_cached(ttl: float) -> Callable:
+    """Cache the result of a no-argument function for `ttl` seconds"""
+    def decorator(func):
+        cached: Dict[str, Any] = {}
+        
+        @wraps(func)
+        def wrapper():
+            now = time.monotonic()
+            if cached and now < cached["expires_at"]:
+                return cached["value"]
+            value = func()
+            cached["value"] = value
+            cached["expires_at"] = now + ttl
+            return value
+        
+        wrapper.cache_clear = cached.clear
+        return wrapper
+    return decorator
+
 # Helper functions for health checks
+@_ttl_cached(DB_CONNECTION_CHECK_TTL)
 def check_db_connection():
     """Check if database connection is working"""
     try:
@@ -123,12 +221,10 @@ def check_db_connection():
     except Exception:
         return False
 
+@_ttl_cached(DB_SIZE_CHECK_TTL)
 def get_db_size():
     """Get the size of the database file in bytes"""
     try:
-        db_path = Path(DATABASE_URL.replace("sqlite:///", ""))
-        if db_path.exists():
-            return db_path.stat().st_size
-        return 0
-    except Exception:
+        return DB_PATH.stat().st_size
+    except OSError:
         return 0
\ No newline at end of file
@@ -5,17 +5,103 @@
 import os
 import json
 import pickle
+import orjson
 import hashlib
 import time
 import asyncio
-import aiofiles
-from typing import Any, Optional, Dict, List, Tuple, Union
+from typing import Any, Callable, Optional, Dict, List, Set, Tuple, Union
 from datetime import datetime, timedelta
 from dataclasses import dataclass, asdict
+from collections import OrderedDict, defaultdict
+from contextlib import ExitStack
+from concurrent.futures import ThreadPoolExecutor
 import threading
 from pathlib import Path
 import shutil
-import gzip
+import sqlite3
+import zlib
+import math
+from functools import lru_cache
+
+from .cache_manager import atomic_write
+
+# zlib 압축 레벨 (기본값 6/gzip 9 대비 2배 이상 빠르고 압축률 차이는 작음)
+COMPRESSION_LEVEL = 3
+# zlib/gzip 헤더 자동 인식 (기존 gzip 엔트리 호환)
+_ZLIB_AUTO_WBITS = 32 + zlib.MAX_WBITS
+
+# 소형 엔트리용 zlib 프리셋 사전 설정
+ZLIB_DICT_SIZE = 32 * 1024          # zlib 윈도우 최대 크기
+DICT_SAMPLE_BYTES = 512             # 샘플당 사용할 앞부분 (pickle 헤더/키 이름 반복 구간)
+MIN_DICT_SAMPLES = 10
+MIN_DICT_COMPRESS_SIZE = 256        # 사전이 있으면 이 크기부터 압축
+DICT_RETRAIN_INTERVAL = 24 * 3600   # 하루에 한 번 재학습
+
+# 유지보수 작업 주기 (초)
+MAINTENANCE_INTERVAL = 300
+
+# 키별 잠금 샤드 수 (2의 거듭제곱)
+LOCK_SHARDS = 16
+
+# 비동기 경로의 직렬화/압축 전용 스레드 수
+CODEC_WORKERS = max(2, (os.cpu_count() or 2) // 2)
+
+# 직렬화 형식 태그 (태그가 없는 데이터는 이전 버전의 pickle)
+_FORMAT_JSON = b"J"
+_FORMAT_PICKLE = b"P"
+_JSON_SCALAR_TYPES = (str, int, bool, type(None))
+
+@lru_cache(maxsize=4096)
+def _hashed_cache_name(key: str) -> Tuple[str, str]:
+    """키 해시로 (서브디렉토리, 파일명) 계산 - 인스턴스와 무관하므로 모듈 수준에서 메모이즈"""
+    key_hash = hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+    return key_hash[:2], f"{key_hash}.cache"
+
+
+def _is_json_native(value: Any) -> bool:
+    """JSON으로 왕복해도 타입이 그대로 유지되는 값인지 확인 (튜플/Enum/datetime 등은 제외)"""
+    value_type = type(value)
+    if value_type in _JSON_SCALAR_TYPES:
+        return True
+    if value_type is float:
+        return math.isfinite(value)
+    if value_type is list:
+        return all(_is_json_native(item) for item in value)
+    if value_type is dict:
+        return all(type(k) is str and _is_json_native(v) for k, v in value.items())
+    return False
+
+# 압축 해제된 직렬화 바이트를 보관하는 메모리 계층 설정
+# (조회마다 새로 역직렬화하므로 호출자가 반환값을 수정해도 캐시가 오염되지 않음)
+MEMORY_CACHE_SIZE = 1024
+MEMORY_CACHE_MAX_ENTRY_BYTES = 1024 * 1024  # 이보다 큰 엔트리는 메모리에 두지 않음
+_MISSING = object()
+
+# 인덱스 메타데이터 저장소 (SQLite)
+_INDEX_DB_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    created_at REAL NOT NULL,
+    expires_at REAL,
+    access_count INTEGER NOT NULL DEFAULT 0,
+    last_accessed REAL NOT NULL,
+    size_bytes INTEGER NOT NULL DEFAULT 0,
+    compression INTEGER NOT NULL DEFAULT 0,
+    metadata TEXT,
+    dict_id TEXT,
+    inline INTEGER NOT NULL DEFAULT 0,
+    data BLOB
+);
+CREATE INDEX IF NOT EXISTS ix_entries_last_accessed ON entries(last_accessed);
+CREATE INDEX IF NOT EXISTS ix_entries_expires_at ON entries(expires_at);
+"""
+_INDEX_DB_COLUMNS = (
+    "key", "created_at", "expires_at", "access_count", "last_accessed",
+    "size_bytes", "compression", "metadata", "dict_id", "inline"
+)
+
+# 이 크기 이하의 엔트리는 개별 파일 대신 인덱스 DB에 BLOB으로 저장
+INLINE_MAX_BYTES = 64 * 1024
 
 @dataclass
 class CacheEntry:
@@ -29,6 +115,8 @@ class CacheEntry:
     size_bytes: int = 0
     compression: bool = False
     metadata: Dict[str, Any] = None
+    dict_id: Optional[str] = None
+    inline: bool = False
     
     def __post_init__(self):
         if self.last_accessed is None:
@@ -65,11 +153,30 @@ class AdvancedCacheManager:
         self.enable_async = enable_async
         
         # 인덱스 파일
-        self.index_file = self.cache_dir / "cache_index.json"
+        self.index_db_file = self.cache_dir / "cache_index.db"
         self.stats_file = self.cache_dir / "cache_stats.json"
         
-        # 메모리 인덱스
-        self.index: Dict[str, CacheEntry] = {}
+        # 이전 버전의 JSON 인덱스 (최초 실행 시 SQLite로 이전)
+        self.index_file = self.cache_dir / "cache_index.json"
+        self.index_log_file = self.cache_dir / "cache_index.log"
+        
+        # 압축 사전 (사전 ID -> 사전 바이트)
+        self.dict_dir = self.cache_dir / "dicts"
+        self._zdicts: Dict[str, bytes] = {}
+        self._active_dict_id: Optional[str] = None
+        self._dict_trained_at = 0.0
+        
+        # 메모리 인덱스 (LRU 순서: 앞쪽이 가장 오래 전에 사용된 엔트리)
+        self.index: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._total_size_bytes = 0
+        # 마지막 저장 이후 접근 정보가 바뀐 키
+        self._dirty_access_keys = set()
+        # 메모리 계층: 키 -> (엔트리, 압축 해제된 직렬화 바이트), LRU 순서
+        self._memory_cache: "OrderedDict[str, Tuple[CacheEntry, bytes]]" = OrderedDict()
+        # 메타데이터 역색인: (필드, 값) -> 키 집합 (해시 가능한 값만)
+        self._tag_index: Dict[Tuple[str, Any], Set[str]] = defaultdict(set)
+        # 엔트리 교체/제거 시 호출할 리스너 (키, 전체 삭제면 None)
+        self._invalidation_listeners: List[Callable[[Optional[str]], None]] = []
         self.stats = {
             'hit_count': 0,
             'miss_count': 0,
@@ -79,96 +186,487 @@ class AdvancedCacheManager:
         }
         
         # 스레드 안전성
+        # - _lock: 인덱스/로그 변경용 (파일 I/O 동안에는 잡지 않음)
+        # - _shard_locks: 같은 키에 대한 파일 읽기/쓰기 순서 보장
+        #   (비동기 경로도 잠금 구간을 스레드에서 실행해 같은 잠금을 사용 - 이벤트 루프에서는 잡지 않음)
+        # - _stats_lock: 통계 카운터 갱신용
         self._lock = threading.Lock()
-        self._async_lock = asyncio.Lock()
+        self._shard_locks = [threading.Lock() for _ in range(LOCK_SHARDS)]
+        self._stats_lock = threading.Lock()
+        
+        # 직렬화/압축 전용 풀 - 기본 executor의 파일/DB 작업과 대기열을 공유하지 않음
+        # (zlib/orjson은 네이티브 코드라 스레드로 충분하고, 프로세스 풀은 값을 다시 pickle해야 함)
+        self._codec_pool = ThreadPoolExecutor(max_workers=CODEC_WORKERS, thread_name_prefix="cache-codec")
         
         # 초기화
+        self._create_shard_dirs()
+        self._open_index_db()
         self._load_index()
+        self._load_compression_dict()
         self._start_maintenance_tasks()
         
+    def _open_index_db(self):
+        """인덱스 메타데이터 DB 연결 (WAL 모드)"""
+        self._index_db = sqlite3.connect(
+            str(self.index_db_file),
+            check_same_thread=False,  # _lock으로 접근 직렬화
+            isolation_level=None
+        )
+        self._index_db.execute("PRAGMA journal_mode=WAL")
+        self._index_db.execute("PRAGMA synchronous=NORMAL")
+        self._index_db.executescript(_INDEX_DB_SCHEMA)
+        
+        # 이전 스키마에 인라인 저장 컬럼 추가
+        columns = {row[1] for row in self._index_db.execute("PRAGMA table_info(entries)")}
+        if "inline" not in columns:
+            self._index_db.execute("ALTER TABLE entries ADD COLUMN inline INTEGER NOT NULL DEFAULT 0")
+        if "data" not in columns:
+            self._index_db.execute("ALTER TABLE entries ADD COLUMN data BLOB")
+        
     def _load_index(self):
-        """인덱스 로드"""
-        if self.index_file.exists():
-            try:
+        """인덱스 로드 (마지막 사용 시각 순으로 LRU 순서 복원)"""
+        self._migrate_json_index()
+        
+        try:
+            rows = self._index_db.execute(
+                f"SELECT {', '.join(_INDEX_DB_COLUMNS)} FROM entries ORDER BY last_accessed"
+            )
+            for row in rows:
+                entry = self._row_to_entry(row)
+                self.index[entry.key] = entry
+                self._index_tags(entry.key, entry)
+                
+        except Exception as e:
+            print(f"인덱스 로드 실패: {e}")
+            
+        self._total_size_bytes = sum(entry.size_bytes for entry in self.index.values())
+        
+    def _migrate_json_index(self):
+        """이전 버전의 JSON 인덱스와 변경 로그를 SQLite로 이전"""
+        if not self.index_file.exists() and not self.index_log_file.exists():
+            return
+            
+        legacy_index: Dict[str, CacheEntry] = {}
+        try:
+            if self.index_file.exists():
                 with open(self.index_file, 'r') as f:
-                    index_data = json.load(f)
-                    
-                for key, entry_data in index_data.items():
-                    self.index[key] = CacheEntry(**entry_data)
-                    
+                    for key, entry_data in json.load(f).items():
+                        legacy_index[key] = CacheEntry(**entry_data)
+                        
+            if self.index_log_file.exists():
+                with open(self.index_log_file, 'rb') as f:
+                    for line in f:
+                        try:
+                            record = orjson.loads(line)
+                        except orjson.JSONDecodeError:
+                            break  # 기록 도중 중단된 마지막 줄
+                            
+                        if record['op'] == 'set':
+                            legacy_index[record['k']] = CacheEntry(**record['e'])
+                        else:
+                            legacy_index.pop(record['k'], None)
+                            
+            self._index_db.execute("BEGIN")
+            self._index_db.executemany(
+                self._upsert_sql(),
+                [self._entry_to_row(entry) + (None,) for entry in legacy_index.values()]
+            )
+            self._index_db.execute("COMMIT")
+            
+            self.index_file.unlink(missing_ok=True)
+            self.index_log_file.unlink(missing_ok=True)
+            
+        except Exception as e:
+            if self._index_db.in_transaction:
+                self._index_db.execute("ROLLBACK")
+            print(f"JSON 인덱스 이전 실패: {e}")
+            
+    @staticmethod
+    def _upsert_sql() -> str:
+        columns = _INDEX_DB_COLUMNS + ("data",)
+        placeholders = ", ".join("?" for _ in columns)
+        return f"INSERT OR REPLACE INTO entries ({', '.join(columns)}) VALUES ({placeholders})"
+        
+    @staticmethod
+    def _entry_to_row(entry: CacheEntry) -> tuple:
+        metadata = orjson.dumps(entry.metadata, default=str).decode() if entry.metadata is not None else None
+        return (
+            entry.key, entry.created_at, entry.expires_at, entry.access_count,
+            entry.last_accessed, entry.size_bytes, int(entry.compression), metadata, entry.dict_id,
+            int(entry.inline)
+        )
+        
+    @staticmethod
+    def _row_to_entry(row: tuple) -> CacheEntry:
+        key, created_at, expires_at, access_count, last_accessed, size_bytes, compression, metadata, dict_id, inline = row
+        return CacheEntry(
+            key=key,
+            value=None,
+            created_at=created_at,
+            expires_at=expires_at,
+            access_count=access_count,
+            last_accessed=last_accessed,
+            size_bytes=size_bytes,
+            compression=bool(compression),
+            metadata=orjson.loads(metadata) if metadata is not None else None,
+            dict_id=dict_id,
+            inline=bool(inline)
+        )
+        
+    def add_invalidation_listener(self, listener: Callable[[Optional[str]], None]):
+        """엔트리가 교체/제거될 때 호출할 리스너 등록 (앞단 캐시 무효화용)
+        
+        리스너는 인덱스 잠금 안에서 키(전체 삭제면 None)를 받아 호출되므로
+        가볍게 동작하고 캐시 매니저를 다시 호출하지 않아야 한다.
+        """
+        self._invalidation_listeners.append(listener)
+        
+    def _notify_invalidation(self, key: Optional[str]):
+        """무효화 리스너 호출"""
+        for listener in self._invalidation_listeners:
+            try:
+                listener(key)
             except Exception as e:
-                print(f"인덱스 로드 실패: {e}")
+                print(f"캐시 무효화 리스너 실패: {e}")
                 
-    def _save_index(self):
-        """인덱스 저장"""
+    def _put_entry(self, key: str, entry: CacheEntry, data: Optional[bytes] = None):
+        """인덱스에 엔트리 추가 (가장 최근 사용 위치로 이동, 인라인 엔트리는 데이터도 함께 저장)"""
+        old_entry = self.index.get(key)
+        if old_entry is not None:
+            self._total_size_bytes -= old_entry.size_bytes
+            self._unindex_tags(key, old_entry)
+            self._notify_invalidation(key)
+            # 파일 저장이던 이전 값을 인라인으로 대체하면 파일 정리
+            if entry.inline and not old_entry.inline:
+                self._get_cache_path(key).unlink(missing_ok=True)
+            
+        self.index[key] = entry
+        self.index.move_to_end(key)
+        self._total_size_bytes += entry.size_bytes
+        self._index_tags(key, entry)
+        self._dirty_access_keys.discard(key)
+        self._memory_cache.pop(key, None)
+        
         try:
-            index_data = {}
-            for key, entry in self.index.items():
-                entry_dict = asdict(entry)
-                # 직렬화 불가능한 값 제거
-                entry_dict['value'] = None
-                index_data[key] = entry_dict
+            self._index_db.execute(self._upsert_sql(), self._entry_to_row(entry) + (data,))
+        except Exception as e:
+            print(f"인덱스 기록 실패: {e}")
+            
+    def _read_inline_data(self, key: str) -> Optional[bytes]:
+        """인덱스 DB에 저장된 인라인 데이터 조회 (_lock 보유 상태에서 호출)"""
+        row = self._index_db.execute("SELECT data FROM entries WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+            
+    def _pop_entry(self, key: str) -> Optional[CacheEntry]:
+        """메모리 인덱스에서 엔트리 제거 (크기 카운터/역색인 함께 갱신, _lock 보유 상태에서 호출)"""
+        entry = self.index.pop(key, None)
+        if entry is not None:
+            self._total_size_bytes -= entry.size_bytes
+            self._unindex_tags(key, entry)
+            self._notify_invalidation(key)
+        return entry
+        
+    def _index_tags(self, key: str, entry: CacheEntry):
+        """메타데이터 필드/값을 역색인에 등록"""
+        if not entry.metadata:
+            return
+        for field, value in entry.metadata.items():
+            try:
+                self._tag_index[(field, value)].add(key)
+            except TypeError:
+                # 리스트/딕셔너리 등 해시 불가능한 값은 색인하지 않음
+                continue
                 
-            with open(self.index_file, 'w') as f:
-                json.dump(index_data, f)
+    def _unindex_tags(self, key: str, entry: CacheEntry):
+        """역색인에서 엔트리 제거"""
+        if not entry.metadata:
+            return
+        for field, value in entry.metadata.items():
+            try:
+                tag = (field, value)
+                keys = self._tag_index.get(tag)
+            except TypeError:
+                continue
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tag_index[tag]
+                    
+    def find_keys_by_metadata(self, conditions: Dict[str, Any]) -> List[str]:
+        """메타데이터 조건을 모두 만족하는 키 조회 (역색인 교집합)"""
+        with self._lock:
+            try:
+                key_sets = [self._tag_index.get((field, value), set()) for field, value in conditions.items()]
+            except TypeError:
+                # 해시 불가능한 조건 값은 역색인에 없으므로 전체 스캔
+                return [
+                    key for key, entry in self.index.items()
+                    if entry.metadata and all(
+                        entry.metadata.get(field) == value for field, value in conditions.items()
+                    )
+                ]
                 
+            if not key_sets:
+                # 조건이 없으면 메타데이터가 있는 모든 엔트리
+                return [key for key, entry in self.index.items() if entry.metadata]
+            key_sets.sort(key=len)
+            return list(key_sets[0].intersection(*key_sets[1:]))
+            
+    def find_keys_containing(self, pattern: str) -> List[str]:
+        """키에 부분 문자열이 포함된 키 조회 (일치하는 키만 리스트로 복사)"""
+        with self._lock:
+            return [key for key in self.index if pattern in key]
+            
+    def find_keys_by_prefix(self, prefix: str) -> List[str]:
+        """접두사로 시작하는 키 조회 (인덱스 DB 기본 키 범위 검색)"""
+        with self._lock:
+            rows = self._index_db.execute(
+                "SELECT key FROM entries WHERE key >= ? AND key < ?",
+                (prefix, prefix + "\U0010ffff")
+            ).fetchall()
+        return [row[0] for row in rows]
+        
+    def _memory_lookup(self, key: str, entry: CacheEntry) -> Any:
+        """메모리 계층에서 직렬화 바이트 조회 (현재 인덱스 엔트리와 같은 버전일 때만)"""
+        cached = self._memory_cache.get(key)
+        if cached is None or cached[0] is not entry:
+            return _MISSING
+            
+        self._memory_cache.move_to_end(key)
+        return cached[1]
+        
+    def _touch_entry(self, key: str, entry: CacheEntry, plain: bytes):
+        """접근 정보 갱신 및 메모리 계층에 압축 해제된 직렬화 바이트 보관"""
+        entry.access_count += 1
+        entry.last_accessed = time.time()
+        
+        # 조회 도중 교체/삭제된 엔트리는 반영하지 않음
+        if self.index.get(key) is not entry:
+            return
+            
+        self.index.move_to_end(key)
+        self._dirty_access_keys.add(key)
+        
+        if len(plain) <= MEMORY_CACHE_MAX_ENTRY_BYTES:
+            self._memory_cache[key] = (entry, plain)
+            self._memory_cache.move_to_end(key)
+            if len(self._memory_cache) > MEMORY_CACHE_SIZE:
+                self._memory_cache.popitem(last=False)
+        
+    def _delete_persisted_entry(self, key: str):
+        """인덱스 DB에서 엔트리 삭제"""
+        self._dirty_access_keys.discard(key)
+        self._memory_cache.pop(key, None)
+        try:
+            self._index_db.execute("DELETE FROM entries WHERE key = ?", (key,))
         except Exception as e:
+            print(f"인덱스 삭제 실패: {e}")
+            
+    def _save_index(self):
+        """변경된 접근 정보를 인덱스 DB에 일괄 반영"""
+        if not self._dirty_access_keys:
+            return
+            
+        try:
+            rows = [
+                (self.index[key].access_count, self.index[key].last_accessed, key)
+                for key in self._dirty_access_keys
+                if key in self.index
+            ]
+            self._index_db.execute("BEGIN")
+            self._index_db.executemany(
+                "UPDATE entries SET access_count = ?, last_accessed = ? WHERE key = ?", rows
+            )
+            self._index_db.execute("COMMIT")
+            self._dirty_access_keys.clear()
+            
+        except Exception as e:
+            if self._index_db.in_transaction:
+                self._index_db.execute("ROLLBACK")
             print(f"인덱스 저장 실패: {e}")
             
     def _get_cache_path(self, key: str) -> Path:
         """캐시 파일 경로 생성"""
-        # 키를 해시하여 파일명 생성
-        key_hash = hashlib.md5(key.encode()).hexdigest()
+        # 디렉토리 분산 (해시 첫 2글자로 서브디렉토리, 디렉토리는 미리 생성됨)
+        subdir, filename = _hashed_cache_name(key)
+        return self.cache_dir / subdir / filename
+        
+    def _create_shard_dirs(self):
+        """256개 해시 서브디렉토리 미리 생성 (경로 계산 시 mkdir 호출 제거)"""
+        for i in range(256):
+            (self.cache_dir / f"{i:02x}").mkdir(exist_ok=True)
         
-        # 디렉토리 분산 (첫 2글자로 서브디렉토리)
-        subdir = self.cache_dir / key_hash[:2]
-        subdir.mkdir(exist_ok=True)
+    def _serialize(self, value: Any) -> bytes:
+        """값 직렬화 (JSON 호환 값은 orjson, 그 외는 pickle)"""
+        data = None
+        if _is_json_native(value):
+            try:
+                data = _FORMAT_JSON + orjson.dumps(value)
+            except TypeError:
+                pass  # 64비트 범위를 넘는 정수, 깊은 중첩 등
+                
+        if data is None:
+            data = _FORMAT_PICKLE + pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+            
+        return data
         
-        return subdir / f"{key_hash}.cache"
+    def _encode(self, value: Any) -> Tuple[bytes, bool, Optional[str]]:
+        """값을 한 번만 직렬화하고 필요하면 그 바이트를 압축
         
-    def _serialize(self, value: Any, compress: bool = False) -> bytes:
-        """값 직렬화"""
-        data = pickle.dumps(value)
+        Returns:
+            (저장할 데이터, 압축 여부, 사용한 압축 사전 ID)
+        """
+        data = self._serialize(value)
+        dict_id = self._active_dict_id
         
-        if compress and self.enable_compression:
-            data = gzip.compress(data)
+        # 압축 여부 결정 (큰 데이터, 또는 사전이 있으면 소형 데이터도)
+        if self.enable_compression and self._should_compress(len(data), dict_id):
+            compressed_data = self._compress(data, dict_id)
             
-        return data
+            # 압축 효율이 좋을 때만 사용
+            if len(compressed_data) < len(data) * 0.9:
+                return compressed_data, True, dict_id
+                
+        return data, False, None
         
-    def _deserialize(self, data: bytes, compressed: bool = False) -> Any:
-        """값 역직렬화"""
+    def _decode(self, data: bytes, compressed: bool = False,
+                dict_id: Optional[str] = None) -> Tuple[bytes, Any]:
+        """압축 해제 후 역직렬화
+        
+        Returns:
+            (압축 해제된 직렬화 바이트, 값)
+        """
         if compressed and self.enable_compression:
-            data = gzip.decompress(data)
+            data = self._decompress(data, dict_id)
             
+        return data, self._loads(data)
+        
+    def _loads(self, data: bytes) -> Any:
+        """압축 해제된 직렬화 바이트에서 값 복원"""
+        data_format = data[:1]
+        if data_format == _FORMAT_JSON:
+            return orjson.loads(data[1:])
+        if data_format == _FORMAT_PICKLE:
+            return pickle.loads(data[1:])
         return pickle.loads(data)
         
+    def _compress(self, data: bytes, dict_id: Optional[str] = None) -> bytes:
+        """바이트 압축 (사전 ID가 있으면 프리셋 사전 사용)"""
+        if dict_id is None:
+            return zlib.compress(data, COMPRESSION_LEVEL)
+            
+        compressor = zlib.compressobj(COMPRESSION_LEVEL, zdict=self._get_zdict(dict_id))
+        return compressor.compress(data) + compressor.flush()
+        
+    def _decompress(self, data: bytes, dict_id: Optional[str] = None) -> bytes:
+        """바이트 압축 해제"""
+        if dict_id is None:
+            return zlib.decompress(data, _ZLIB_AUTO_WBITS)
+            
+        decompressor = zlib.decompressobj(zdict=self._get_zdict(dict_id))
+        return decompressor.decompress(data) + decompressor.flush()
+        
+    def _should_compress(self, size: int, dict_id: Optional[str]) -> bool:
+        """압축 시도 여부 (큰 데이터, 또는 사전이 있으면 소형 데이터도)"""
+        if size > 1024 * 10:  # 10KB 이상
+            return True
+        return dict_id is not None and size >= MIN_DICT_COMPRESS_SIZE
+        
+    def _get_zdict(self, dict_id: str) -> bytes:
+        """압축 사전 조회 (메모리에 없으면 파일에서 로드)"""
+        zdict = self._zdicts.get(dict_id)
+        if zdict is None:
+            zdict = (self.dict_dir / f"{dict_id}.dict").read_bytes()
+            self._zdicts[dict_id] = zdict
+        return zdict
+        
+    def _load_compression_dict(self):
+        """활성 압축 사전 로드 (없으면 기존 엔트리로 학습)"""
+        active_file = self.dict_dir / "ACTIVE"
+        try:
+            if active_file.exists():
+                dict_id = active_file.read_text().strip()
+                self._get_zdict(dict_id)
+                self._active_dict_id = dict_id
+                self._dict_trained_at = active_file.stat().st_mtime
+                return
+        except Exception as e:
+            print(f"압축 사전 로드 실패: {e}")
+            
+        self.train_compression_dict()
+        
+    def train_compression_dict(self, max_samples: int = 1000) -> Optional[str]:
+        """최근 소형 엔트리 샘플로 zlib 프리셋 사전 학습"""
+        if not self.enable_compression:
+            return None
+            
+        with self._lock:
+            recent_entries = list(self.index.items())[-max_samples:]
+            
+        samples = []
+        for key, entry in recent_entries:
+            if entry.size_bytes > ZLIB_DICT_SIZE:
+                continue
+            try:
+                if entry.inline:
+                    with self._lock:
+                        data = self._read_inline_data(key)
+                    if data is None:
+                        continue
+                else:
+                    data = self._get_cache_path(key).read_bytes()
+                if entry.compression:
+                    data = self._decompress(data, entry.dict_id)
+                samples.append(data[:DICT_SAMPLE_BYTES])
+            except Exception:
+                continue
+                
+        if len(samples) < MIN_DICT_SAMPLES:
+            return None
+            
+        # zlib은 사전 끝부분의 문자열을 더 짧게 참조하므로 최근 샘플을 뒤에 배치
+        zdict = b"".join(samples)[-ZLIB_DICT_SIZE:]
+        dict_id = hashlib.blake2b(zdict, digest_size=8).hexdigest()
+        
+        try:
+            self.dict_dir.mkdir(exist_ok=True)
+            (self.dict_dir / f"{dict_id}.dict").write_bytes(zdict)
+            (self.dict_dir / "ACTIVE").write_text(dict_id)
+        except Exception as e:
+            print(f"압축 사전 저장 실패: {e}")
+            return None
+            
+        with self._lock:
+            self._zdicts[dict_id] = zdict
+            self._active_dict_id = dict_id
+            self._dict_trained_at = time.time()
+            
+            # 더 이상 참조되지 않는 이전 사전 정리
+            used_ids = {entry.dict_id for entry in self.index.values()}
+            used_ids.add(dict_id)
+            for dict_file in self.dict_dir.glob("*.dict"):
+                if dict_file.stem not in used_ids:
+                    dict_file.unlink(missing_ok=True)
+                    self._zdicts.pop(dict_file.stem, None)
+                    
+        return dict_id
+        
     def set(self, key: str, value: Any, ttl: Optional[int] = None, 
             metadata: Optional[Dict[str, Any]] = None) -> bool:
         """캐시 설정"""
         start_time = time.time()
         
         try:
-            with self._lock:
+            with self._shard_lock(key):
                 # TTL 설정
                 if ttl is None:
                     ttl = self.default_ttl
                     
                 expires_at = time.time() + ttl if ttl > 0 else None
                 
-                # 압축 여부 결정 (큰 데이터만 압축)
-                data = self._serialize(value)
-                compress = len(data) > 1024 * 10  # 10KB 이상
+                # 직렬화 및 압축
+                data, compress, dict_id = self._encode(value)
                 
-                if compress:
-                    compressed_data = self._serialize(value, compress=True)
-                    compression_ratio = len(compressed_data) / len(data)
-                    
-                    # 압축 효율이 좋을 때만 사용
-                    if compression_ratio < 0.9:
-                        data = compressed_data
-                    else:
-                        compress = False
-                        
                 # 캐시 엔트리 생성
                 entry = CacheEntry(
                     key=key,
@@ -177,77 +675,141 @@ class AdvancedCacheManager:
                     expires_at=expires_at,
                     size_bytes=len(data),
                     compression=compress,
-                    metadata=metadata
+                    metadata=metadata,
+                    dict_id=dict_id,
+                    inline=len(data) <= INLINE_MAX_BYTES
                 )
                 
-                # 크기 확인 및 정리
-                self._ensure_cache_size()
-                
-                # 파일 저장
-                cache_path = self._get_cache_path(key)
-                with open(cache_path, 'wb') as f:
-                    f.write(data)
-                    
-                # 인덱스 업데이트
-                self.index[key] = entry
-                self._save_index()
-                
-                # 통계 업데이트
-                access_time = (time.time() - start_time) * 1000
-                self._update_stats('set', access_time)
+                # 저장 및 인덱스 업데이트
+                self._store_entry(key, entry, data)
                 
-                return True
+            # 통계 업데이트
+            access_time = (time.time() - start_time) * 1000
+            self._update_stats('set', access_time)
+            
+            return True
                 
         except Exception as e:
             print(f"캐시 설정 실패: {e}")
             return False
             
+    def _store_entry(self, key: str, entry: CacheEntry, data: bytes):
+        """직렬화된 엔트리 저장 (샤드 잠금 보유 상태에서 호출)
+        
+        파일 쓰기와 인덱스 갱신 사이에 만료 정리의 파일 삭제가 끼어들지 않도록
+        두 단계를 같은 샤드 잠금 안에서 수행한다.
+        """
+        # 크기 확인 및 정리
+        self._evict_if_needed()
+        
+        if entry.inline:
+            # 소형 엔트리는 인덱스 DB에 함께 저장 (파일 생성 없음)
+            with self._lock:
+                self._put_entry(key, entry, data)
+        else:
+            # 파일 저장
+            atomic_write(self._get_cache_path(key), data)
+                
+            # 인덱스 업데이트
+            with self._lock:
+                self._put_entry(key, entry)
+                
+    def _store_entry_locked(self, key: str, entry: CacheEntry, data: bytes):
+        """샤드 잠금을 잡고 엔트리 저장 (비동기 경로에서 스레드로 실행)"""
+        with self._shard_lock(key):
+            self._store_entry(key, entry, data)
+            
+    def _store_entries_locked(self, entries: List[Tuple[CacheEntry, bytes]]):
+        """관련 샤드 잠금을 모두 잡고 여러 엔트리 저장 (인덱스 DB는 단일 트랜잭션)"""
+        with ExitStack() as stack:
+            # 항상 같은 순서로 획득 (교착 방지)
+            shard_ids = sorted({hash(entry.key) & (LOCK_SHARDS - 1) for entry, _ in entries})
+            for shard_id in shard_ids:
+                stack.enter_context(self._shard_locks[shard_id])
+                
+            # 크기 확인
+            self._evict_if_needed()
+            
+            # 대형 엔트리 파일 저장
+            for entry, data in entries:
+                if not entry.inline:
+                    atomic_write(self._get_cache_path(entry.key), data)
+                    
+            # 인덱스 갱신 (커밋 한 번)
+            with self._lock:
+                self._index_db.execute("BEGIN")
+                try:
+                    for entry, data in entries:
+                        self._put_entry(entry.key, entry, data if entry.inline else None)
+                    self._index_db.execute("COMMIT")
+                except Exception:
+                    if self._index_db.in_transaction:
+                        self._index_db.execute("ROLLBACK")
+                    raise
+        
     def get(self, key: str, default: Any = None) -> Any:
         """캐시 조회"""
+        return self._lookup(key, default, 'get')
+        
+    def _lookup(self, key: str, default: Any, operation: str) -> Any:
+        """샤드 잠금 안에서 캐시 조회 (get/aget 공용)"""
         start_time = time.time()
         
         try:
-            with self._lock:
-                # 인덱스 확인
-                if key not in self.index:
-                    self.stats['miss_count'] += 1
-                    return default
-                    
-                entry = self.index[key]
-                
-                # 만료 확인
-                if entry.expires_at and time.time() > entry.expires_at:
-                    self._remove_entry(key)
-                    self.stats['miss_count'] += 1
-                    return default
-                    
-                # 파일 읽기
-                cache_path = self._get_cache_path(key)
-                if not cache_path.exists():
-                    self._remove_entry(key)
-                    self.stats['miss_count'] += 1
-                    return default
-                    
-                with open(cache_path, 'rb') as f:
-                    data = f.read()
+            with self._shard_lock(key):
+                with self._lock:
+                    # 인덱스 확인
+                    entry = self.index.get(key)
+                    if entry is None:
+                        self._count_stat('miss_count')
+                        return default
+                        
+                    # 만료 확인
+                    if entry.expires_at and time.time() > entry.expires_at:
+                        self._remove_entry(key)
+                        self._count_stat('miss_count')
+                        return default
+                        
+                    # 메모리 계층 확인
+                    plain = self._memory_lookup(key, entry)
+                    data = None
+                    if plain is _MISSING and entry.inline:
+                        data = self._read_inline_data(key)
                     
-                # 역직렬화
-                value = self._deserialize(data, compressed=entry.compression)
+                if plain is not _MISSING:
+                    value = self._loads(plain)
+                else:
+                    if not entry.inline:
+                        # 파일 읽기 (인덱스 잠금 없이)
+                        try:
+                            with open(self._get_cache_path(key), 'rb') as f:
+                                data = f.read()
+                        except FileNotFoundError:
+                            pass
+                            
+                    if data is None:
+                        with self._lock:
+                            self._remove_entry(key)
+                        self._count_stat('miss_count')
+                        return default
+                        
+                    # 역직렬화
+                    plain, value = self._decode(data, entry.compression, entry.dict_id)
                 
                 # 접근 정보 업데이트
-                entry.access_count += 1
-                entry.last_accessed = time.time()
-                
-                # 통계 업데이트
-                self.stats['hit_count'] += 1
-                access_time = (time.time() - start_time) * 1000
-                self._update_stats('get', access_time)
+                with self._lock:
+                    self._touch_entry(key, entry, plain)
                 
-                return value
+            # 통계 업데이트
+            self._count_stat('hit_count')
+            access_time = (time.time() - start_time) * 1000
+            self._update_stats(operation, access_time)
+            
+            return value
                 
         except Exception as e:
             print(f"캐시 조회 실패: {e}")
-            self.stats['miss_count'] += 1
+            self._count_stat('miss_count')
             return default
             
     async def aset(self, key: str, value: Any, ttl: Optional[int] = None,
@@ -259,117 +821,111 @@ class AdvancedCacheManager:
         start_time = time.time()
         
         try:
-            async with self._async_lock:
-                # TTL 설정
+            # TTL 설정
+            if ttl is None:
+                ttl = self.default_ttl
+                
+            expires_at = time.time() + ttl if ttl > 0 else None
+            
+            # 직렬화 및 압축 (CPU 집약적이므로 스레드 풀에서 한 번에 실행)
+            loop = asyncio.get_event_loop()
+            data, compress, dict_id = await loop.run_in_executor(self._codec_pool, self._encode, value)
+            
+            # 캐시 엔트리 생성
+            entry = CacheEntry(
+                key=key,
+                value=None,
+                created_at=time.time(),
+                expires_at=expires_at,
+                size_bytes=len(data),
+                compression=compress,
+                metadata=metadata,
+                dict_id=dict_id,
+                inline=len(data) <= INLINE_MAX_BYTES
+            )
+            
+            # 저장 및 인덱스 업데이트 (동기 경로와 같은 샤드 잠금 안에서)
+            await loop.run_in_executor(None, self._store_entry_locked, key, entry, data)
+            
+            # 통계 업데이트
+            access_time = (time.time() - start_time) * 1000
+            self._update_stats('aset', access_time)
+            
+            return True
+            
+        except Exception as e:
+            print(f"비동기 캐시 설정 실패: {e}")
+            return False
+            
+    async def aset_many(self, items: List[Tuple[str, Any, Optional[int], Optional[Dict[str, Any]]]]) -> int:
+        """여러 엔트리를 한 번에 저장 (인덱스 DB는 단일 트랜잭션으로 기록)
+        
+        Args:
+            items: (키, 값, TTL, 메타데이터) 목록
+            
+        Returns:
+            저장된 엔트리 수
+        """
+        if not items:
+            return 0
+        if not self.enable_async:
+            return sum(1 for key, value, ttl, metadata in items if self.set(key, value, ttl, metadata))
+            
+        start_time = time.time()
+        
+        # 같은 키가 여러 번 있으면 마지막 값만 저장 (같은 파일을 동시에 쓰지 않도록)
+        items = list({item[0]: item for item in items}.values())
+        
+        try:
+            # 직렬화/압축은 코덱 풀에서 병렬로
+            loop = asyncio.get_event_loop()
+            encoded = await asyncio.gather(*(
+                loop.run_in_executor(self._codec_pool, self._encode, value)
+                for _, value, _, _ in items
+            ))
+            
+            now = time.time()
+            entries = []
+            for (key, _, ttl, metadata), (data, compress, dict_id) in zip(items, encoded):
                 if ttl is None:
                     ttl = self.default_ttl
-                    
-                expires_at = time.time() + ttl if ttl > 0 else None
-                
-                # 직렬화 (CPU 집약적이므로 스레드 풀에서 실행)
-                loop = asyncio.get_event_loop()
-                data = await loop.run_in_executor(None, self._serialize, value)
-                
-                compress = len(data) > 1024 * 10
-                if compress:
-                    compressed_data = await loop.run_in_executor(
-                        None, self._serialize, value, True
-                    )
-                    if len(compressed_data) < len(data) * 0.9:
-                        data = compressed_data
-                    else:
-                        compress = False
-                        
-                # 캐시 엔트리 생성
                 entry = CacheEntry(
                     key=key,
                     value=None,
-                    created_at=time.time(),
-                    expires_at=expires_at,
+                    created_at=now,
+                    expires_at=now + ttl if ttl > 0 else None,
                     size_bytes=len(data),
                     compression=compress,
-                    metadata=metadata
+                    metadata=metadata,
+                    dict_id=dict_id,
+                    inline=len(data) <= INLINE_MAX_BYTES
                 )
+                entries.append((entry, data))
                 
-                # 크기 확인
-                await loop.run_in_executor(None, self._ensure_cache_size)
-                
-                # 파일 저장
-                cache_path = self._get_cache_path(key)
-                async with aiofiles.open(cache_path, 'wb') as f:
-                    await f.write(data)
-                    
-                # 인덱스 업데이트
-                self.index[key] = entry
-                await loop.run_in_executor(None, self._save_index)
-                
-                # 통계 업데이트
-                access_time = (time.time() - start_time) * 1000
-                self._update_stats('aset', access_time)
-                
-                return True
-                
+            # 파일 저장과 인덱스 갱신 (동기 경로와 같은 샤드 잠금 안에서)
+            await loop.run_in_executor(None, self._store_entries_locked, entries)
+            
+            # 통계 업데이트
+            access_time = (time.time() - start_time) * 1000
+            self._update_stats('aset_many', access_time)
+            
+            return len(entries)
+            
         except Exception as e:
-            print(f"비동기 캐시 설정 실패: {e}")
-            return False
+            print(f"비동기 일괄 캐시 설정 실패: {e}")
+            return 0
             
     async def aget(self, key: str, default: Any = None) -> Any:
-        """비동기 캐시 조회"""
+        """비동기 캐시 조회 (동기 경로와 같은 샤드 잠금을 쓰도록 조회 전체를 스레드에서 실행)"""
         if not self.enable_async:
             return self.get(key, default)
             
-        start_time = time.time()
-        
-        try:
-            async with self._async_lock:
-                # 인덱스 확인
-                if key not in self.index:
-                    self.stats['miss_count'] += 1
-                    return default
-                    
-                entry = self.index[key]
-                
-                # 만료 확인
-                if entry.expires_at and time.time() > entry.expires_at:
-                    await self._aremove_entry(key)
-                    self.stats['miss_count'] += 1
-                    return default
-                    
-                # 파일 읽기
-                cache_path = self._get_cache_path(key)
-                if not cache_path.exists():
-                    await self._aremove_entry(key)
-                    self.stats['miss_count'] += 1
-                    return default
-                    
-                async with aiofiles.open(cache_path, 'rb') as f:
-                    data = await f.read()
-                    
-                # 역직렬화
-                loop = asyncio.get_event_loop()
-                value = await loop.run_in_executor(
-                    None, self._deserialize, data, entry.compression
-                )
-                
-                # 접근 정보 업데이트
-                entry.access_count += 1
-                entry.last_accessed = time.time()
-                
-                # 통계 업데이트
-                self.stats['hit_count'] += 1
-                access_time = (time.time() - start_time) * 1000
-                self._update_stats('aget', access_time)
-                
-                return value
-                
-        except Exception as e:
-            print(f"비동기 캐시 조회 실패: {e}")
-            self.stats['miss_count'] += 1
-            return default
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, self._lookup, key, default, 'aget')
             
     def delete(self, key: str) -> bool:
         """캐시 삭제"""
-        with self._lock:
+        with self._shard_lock(key), self._lock:
             return self._remove_entry(key)
             
     def clear(self) -> int:
@@ -377,13 +933,24 @@ class AdvancedCacheManager:
         with self._lock:
             count = len(self.index)
             
-            # 캐시 디렉토리 삭제 및 재생성
+            # 캐시 디렉토리 삭제 및 재생성 (인덱스 DB도 함께 새로 생성)
+            self._index_db.close()
             shutil.rmtree(self.cache_dir, ignore_errors=True)
             self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self._create_shard_dirs()
+            self._open_index_db()
             
             # 인덱스 초기화
             self.index.clear()
-            self._save_index()
+            self._total_size_bytes = 0
+            self._dirty_access_keys.clear()
+            self._memory_cache.clear()
+            self._tag_index.clear()
+            self._notify_invalidation(None)
+            
+            # 압축 사전도 함께 삭제되었으므로 초기화
+            self._zdicts.clear()
+            self._active_dict_id = None
             
             return count
             
@@ -393,13 +960,13 @@ class AdvancedCacheManager:
             return False
             
         try:
-            # 파일 삭제
-            cache_path = self._get_cache_path(key)
-            if cache_path.exists():
-                cache_path.unlink()
+            # 파일 삭제 (인라인 엔트리는 DB 행 삭제로 충분)
+            if not self.index[key].inline:
+                self._get_cache_path(key).unlink(missing_ok=True)
                 
             # 인덱스에서 제거
-            del self.index[key]
+            self._pop_entry(key)
+            self._delete_persisted_entry(key)
             
             return True
             
@@ -407,58 +974,51 @@ class AdvancedCacheManager:
             print(f"캐시 엔트리 제거 실패: {e}")
             return False
             
-    async def _aremove_entry(self, key: str) -> bool:
-        """비동기 캐시 엔트리 제거"""
-        if key not in self.index:
-            return False
-            
-        try:
-            cache_path = self._get_cache_path(key)
-            if cache_path.exists():
-                loop = asyncio.get_event_loop()
-                await loop.run_in_executor(None, cache_path.unlink)
-                
-            del self.index[key]
-            return True
-            
-        except Exception as e:
-            print(f"비동기 캐시 엔트리 제거 실패: {e}")
-            return False
-            
     def _ensure_cache_size(self):
         """캐시 크기 관리"""
-        total_size = sum(entry.size_bytes for entry in self.index.values())
         max_size_bytes = self.max_size_mb * 1024 * 1024
         
-        if total_size <= max_size_bytes:
+        if self._total_size_bytes <= max_size_bytes:
             return
             
-        # LRU 방식으로 정리
-        entries = sorted(
-            self.index.items(),
-            key=lambda x: x[1].last_accessed
-        )
+        # 만료 엔트리 정리도 곧바로 실행되도록 요청
+        self.request_maintenance()
         
-        while total_size > max_size_bytes * 0.9:  # 90%까지 정리
-            if not entries:
+        # LRU 방식으로 정리 (인덱스 앞쪽부터 제거)
+        while self.index and self._total_size_bytes > max_size_bytes * 0.9:  # 90%까지 정리
+            key = next(iter(self.index))
+            if not self._remove_entry(key):
                 break
-                
-            key, entry = entries.pop(0)
-            if self._remove_entry(key):
-                total_size -= entry.size_bytes
-                self.stats['eviction_count'] += 1
+            self._count_stat('eviction_count')
+            
+    def _evict_if_needed(self):
+        """캐시 크기 관리 (인덱스 잠금 포함)"""
+        with self._lock:
+            self._ensure_cache_size()
+            
+    def _shard_lock(self, key: str) -> threading.Lock:
+        """키가 속한 샤드의 잠금"""
+        return self._shard_locks[hash(key) & (LOCK_SHARDS - 1)]
+        
+    def _count_stat(self, name: str):
+        """통계 카운터 증가"""
+        with self._stats_lock:
+            self.stats[name] += 1
                 
     def _update_stats(self, operation: str, access_time_ms: float):
         """통계 업데이트"""
-        self.stats['total_access_time'] += access_time_ms
-        self.stats['access_count'] += 1
+        with self._stats_lock:
+            self.stats['total_access_time'] += access_time_ms
+            self.stats['access_count'] += 1
         
     def get_stats(self) -> CacheStats:
         """캐시 통계 조회"""
+        with self._stats_lock:
+            stats = dict(self.stats)
+            
         with self._lock:
             # 전체 크기 계산
-            total_size_bytes = sum(entry.size_bytes for entry in self.index.values())
-            total_size_mb = total_size_bytes / 1024 / 1024
+            total_size_mb = self._total_size_bytes / 1024 / 1024
             
             # 압축률 계산
             compressed_entries = [e for e in self.index.values() if e.compression]
@@ -466,7 +1026,7 @@ class AdvancedCacheManager:
             
             # 평균 접근 시간
             avg_access_time = (
-                self.stats['total_access_time'] / max(self.stats['access_count'], 1)
+                stats['total_access_time'] / max(stats['access_count'], 1)
             )
             
             # 가장 많이 접근된 키
@@ -479,9 +1039,9 @@ class AdvancedCacheManager:
             return CacheStats(
                 total_entries=len(self.index),
                 total_size_mb=total_size_mb,
-                hit_count=self.stats['hit_count'],
-                miss_count=self.stats['miss_count'],
-                eviction_count=self.stats['eviction_count'],
+                hit_count=stats['hit_count'],
+                miss_count=stats['miss_count'],
+                eviction_count=stats['eviction_count'],
                 compression_ratio=compression_ratio,
                 avg_access_time_ms=avg_access_time,
                 most_accessed_keys=most_accessed
@@ -489,25 +1049,77 @@ class AdvancedCacheManager:
             
     def _start_maintenance_tasks(self):
         """유지보수 작업 시작"""
-        # 만료된 엔트리 정리 작업
-        def cleanup_expired():
-            while True:
-                time.sleep(300)  # 5분마다
-                with self._lock:
-                    expired_keys = []
-                    for key, entry in self.index.items():
-                        if entry.expires_at and time.time() > entry.expires_at:
-                            expired_keys.append(key)
-                            
-                    for key in expired_keys:
-                        self._remove_entry(key)
-                        
-                    if expired_keys:
-                        self._save_index()
-                        
+        self._maintenance_wakeup = threading.Event()
+        # 파일 삭제는 GIL을 놓으므로 스레드 풀에서 병렬 처리
+        self._unlink_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="cache-unlink")
+        
         # 백그라운드 스레드로 실행
-        cleanup_thread = threading.Thread(target=cleanup_expired, daemon=True)
-        cleanup_thread.start()
+        maintenance_thread = threading.Thread(target=self._maintenance_loop, daemon=True)
+        maintenance_thread.start()
+        
+    def request_maintenance(self):
+        """유지보수 작업을 다음 주기를 기다리지 않고 실행 (여러 요청은 한 번으로 합쳐짐)"""
+        self._maintenance_wakeup.set()
+        
+    def _maintenance_loop(self):
+        """주기적으로, 또는 요청이 있을 때 유지보수 실행"""
+        while True:
+            self._maintenance_wakeup.wait(MAINTENANCE_INTERVAL)
+            self._maintenance_wakeup.clear()
+            
+            try:
+                self.run_maintenance()
+            except Exception as e:
+                print(f"캐시 유지보수 실패: {e}")
+                
+    def run_maintenance(self):
+        """만료 엔트리 정리, 접근 정보 반영, 압축 사전 재학습"""
+        # 압축 사전 주기적 재학습
+        if time.time() - self._dict_trained_at > DICT_RETRAIN_INTERVAL:
+            try:
+                self.train_compression_dict()
+            except Exception as e:
+                print(f"압축 사전 학습 실패: {e}")
+                
+        self.purge_expired()
+        
+        # 접근 정보 일괄 반영
+        with self._lock:
+            self._save_index()
+            
+    def purge_expired(self) -> int:
+        """만료된 엔트리를 한 번의 쿼리로 삭제"""
+        with self._lock:
+            expired_rows = self._index_db.execute(
+                "DELETE FROM entries WHERE expires_at < ? RETURNING key, inline", (time.time(),)
+            ).fetchall()
+            
+            expired_keys = []
+            for key, inline in expired_rows:
+                self._pop_entry(key)
+                self._dirty_access_keys.discard(key)
+                self._memory_cache.pop(key, None)
+                if not inline:
+                    expired_keys.append(key)
+                    
+        # 파일 삭제는 잠금 밖에서 병렬로
+        for key in expired_keys:
+            self._unlink_pool.submit(self._unlink_expired_file, key)
+            
+        return len(expired_rows)
+        
+    def _unlink_expired_file(self, key: str):
+        """만료로 제거된 엔트리의 파일 삭제
+        
+        삭제가 실행되기 전에 같은 키로 새 파일 엔트리가 저장되었을 수 있으므로,
+        샤드 잠금 안에서 키가 여전히 없거나 인라인 엔트리일 때만 파일을 지운다.
+        """
+        with self._shard_lock(key):
+            with self._lock:
+                entry = self.index.get(key)
+                if entry is not None and not entry.inline:
+                    return
+            self._get_cache_path(key).unlink(missing_ok=True)
         
     def export_stats(self, filepath: str):
         """통계 내보내기"""
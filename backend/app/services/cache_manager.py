@@ -2,13 +2,45 @@
 파일 기반 캐싱 시스템 - API 응답 속도 향상
 """
 
-import json
 import hashlib
 import os
+import tempfile
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import Any, Optional, Dict
+from typing import Any, Optional, Dict, List
+from concurrent.futures import ThreadPoolExecutor
 import pickle
+import orjson
+
+
+# 만료 파일 동시 삭제 워커 수
+CLEANUP_WORKERS = 8
+
+
+def atomic_write(path: Path, data: bytes, mtime: Optional[float] = None) -> None:
+    """같은 디렉토리의 임시 파일에 쓴 뒤 os.replace로 교체
+    
+    쓰기 도중 중단되어도 기존 파일이나 빈 자리만 남고, 반쯤 쓰인 캐시 파일은 생기지 않는다.
+    mtime이 주어지면 교체 전에 파일 수정 시각으로 기록한다.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=".tmp-", suffix=".part")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            # 한 번 쓰고 거의 다시 읽지 않는 데이터 - 페이지 캐시에서 핫 페이지를 밀어내지 않도록 힌트
+            if hasattr(os, "posix_fadvise"):
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+        if mtime is not None:
+            os.utime(tmp_path, (mtime, mtime))
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
 
 class CacheManager:
     """파일 기반 캐시 관리자"""
@@ -35,9 +67,13 @@ class CacheManager:
     
     def _generate_key(self, cache_type: str, params: Dict[str, Any]) -> str:
         """캐시 키 생성"""
-        # 파라미터를 정렬하여 일관된 키 생성
-        sorted_params = json.dumps(params, sort_keys=True, ensure_ascii=False)
-        hash_obj = hashlib.md5(sorted_params.encode())
+        # 파라미터를 정렬하여 일관된 키 생성 (orjson은 바로 UTF-8 bytes 반환)
+        sorted_params = orjson.dumps(
+            params,
+            option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+            default=str
+        )
+        hash_obj = hashlib.blake2b(sorted_params, digest_size=16)
         return f"{cache_type}_{hash_obj.hexdigest()}"
     
     def _get_cache_path(self, cache_type: str, key: str) -> Path:
@@ -89,8 +125,12 @@ class CacheManager:
         }
         
         try:
-            with open(cache_path, "wb") as f:
-                pickle.dump(cache_data, f)
+            # 만료 시각을 파일 mtime에 기록 - cleanup_expired가 파일을 열지 않고 stat만으로 판단
+            atomic_write(
+                cache_path,
+                pickle.dumps(cache_data, protocol=pickle.HIGHEST_PROTOCOL),
+                mtime=expires_at.timestamp()
+            )
             return True
             
         except Exception as e:
@@ -127,26 +167,40 @@ class CacheManager:
         return count
     
     def cleanup_expired(self) -> int:
-        """만료된 캐시 정리"""
-        count = 0
-        now = datetime.now()
+        """만료된 캐시 정리
+        
+        파일 mtime이 만료 시각이므로 pickle 로드 없이 디렉토리 스캔만으로 판별하고,
+        삭제는 스레드 풀에서 동시에 처리한다.
+        """
+        now = datetime.now().timestamp()
+        expired: List[str] = []
         
         for subdir in self.subdirs.values():
-            for cache_file in subdir.glob("*.cache"):
-                try:
-                    with open(cache_file, "rb") as f:
-                        cache_data = pickle.load(f)
-                    
-                    if now > cache_data["expires_at"]:
-                        cache_file.unlink()
-                        count += 1
-                        
-                except Exception:
-                    # 읽을 수 없는 파일 삭제
-                    cache_file.unlink()
-                    count += 1
+            with os.scandir(subdir) as it:
+                for entry in it:
+                    if not entry.name.endswith(".cache"):
+                        continue
+                    try:
+                        if entry.stat().st_mtime < now:
+                            expired.append(entry.path)
+                    except FileNotFoundError:
+                        continue
         
-        return count
+        if not expired:
+            return 0
+        
+        with ThreadPoolExecutor(max_workers=CLEANUP_WORKERS) as executor:
+            results = executor.map(self._unlink_quietly, expired)
+            return sum(results)
+    
+    @staticmethod
+    def _unlink_quietly(path: str) -> bool:
+        """파일 삭제 (이미 삭제된 경우 무시)"""
+        try:
+            os.unlink(path)
+            return True
+        except FileNotFoundError:
+            return False
     
     def get_stats(self) -> Dict[str, Any]:
         """캐시 통계 정보"""
@@ -2,9 +2,12 @@
 캐싱 전략 - 다양한 캐싱 패턴과 전략 구현
 """
 
-from typing import Dict, List, Any, Optional, Callable, Union
+from typing import Dict, List, Any, Optional, Callable, Tuple, Union
+from collections import OrderedDict
+import threading
 import hashlib
 import json
+import time
 from datetime import datetime, timedelta
 from abc import ABC, abstractmethod
 import asyncio
@@ -12,6 +15,56 @@ from functools import wraps
 
 from .advanced_cache_manager import AdvancedCacheManager
 
+# CacheDecorator의 프로세스 내 L1 캐시 (캐시 매니저 앞단)
+L1_CACHE_SIZE = 256
+L1_CACHE_TTL = 60  # 초 - 다른 프로세스가 바꾼 값이 늦게 반영될 수 있는 최대 시간
+
+_L1_MISSING = object()
+
+# 콘텐츠 캐시 키 해셔 - xxhash가 설치되어 있으면 XXH3(64비트), 없으면 8바이트 BLAKE2b
+try:
+    import xxhash
+    
+    def _new_key_hasher(data: bytes = b''):
+        return xxhash.xxh3_64(data)
+except ImportError:
+    def _new_key_hasher(data: bytes = b''):
+        return hashlib.blake2b(data, digest_size=8)
+
+# 초 단위로 재사용하는 ISO 형식 현재 시각 (초, 문자열)
+_iso_now_cache = [0, ""]
+
+def _iso_now() -> str:
+    """현재 시각 ISO 문자열 (같은 초 안에서는 포맷 결과 재사용)"""
+    now = time.time()
+    second = int(now)
+    if second != _iso_now_cache[0]:
+        _iso_now_cache[1] = datetime.fromtimestamp(second).isoformat()
+        _iso_now_cache[0] = second
+    return _iso_now_cache[1]
+
+def _fast_key(args: tuple, kwargs: Dict[str, Any]) -> str:
+    """인자 조합을 고정 길이 키로 변환 (긴 문자열 키 대신 BLAKE2b 해시)"""
+    h = hashlib.blake2b(digest_size=16)
+    for arg in args:
+        h.update(repr(arg).encode())
+        h.update(b'\x00')
+    for name in sorted(kwargs):
+        h.update(name.encode())
+        h.update(b'=')
+        h.update(repr(kwargs[name]).encode())
+        h.update(b'\x00')
+    return h.hexdigest()
+
+def _exceeds_utf8_size(text: str, limit: int) -> bool:
+    """UTF-8 인코딩 크기가 limit을 넘는지 확인 (글자 수로 판별 가능하면 인코딩 생략)"""
+    # UTF-8은 글자당 1~4바이트
+    if len(text) > limit:
+        return True
+    if len(text) * 4 <= limit:
+        return False
+    return len(text.encode('utf-8')) > limit
+
 class CacheStrategy(ABC):
     """캐시 전략 기본 클래스"""
     
@@ -56,11 +109,10 @@ class ContentTypeCacheStrategy(CacheStrategy):
         if content_type not in self.ttl_config:
             return False
             
-        # 크기 제한 확인
-        if content_type in self.size_limits:
-            value_size = len(str(value).encode('utf-8'))
-            if value_size > self.size_limits[content_type]:
-                return False
+        # 크기 제한 확인 (큰 콘텐츠의 전체 문자열/바이트 사본을 만들지 않음)
+        size_limit = self.size_limits.get(content_type)
+        if size_limit is not None and self._exceeds_size_limit(value, metadata, size_limit):
+            return False
                 
         # 품질 점수가 낮으면 캐싱하지 않음
         quality_score = metadata.get('quality_score', 100)
@@ -69,6 +121,25 @@ class ContentTypeCacheStrategy(CacheStrategy):
             
         return True
     
+    def _exceeds_size_limit(self, value: Any, metadata: Dict[str, Any], size_limit: int) -> bool:
+        """값 크기가 제한을 넘는지 확인"""
+        # 호출자가 크기를 알려준 경우 그대로 사용
+        size_bytes = metadata.get('size_bytes')
+        if size_bytes is not None:
+            return size_bytes > size_limit
+            
+        if isinstance(value, str):
+            return _exceeds_utf8_size(value, size_limit)
+        if isinstance(value, (bytes, bytearray)):
+            return len(value) > size_limit
+            
+        # GeneratedContent 등 본문 텍스트를 가진 객체는 본문 기준
+        total_content = getattr(value, 'total_content', None)
+        if isinstance(total_content, str):
+            return _exceeds_utf8_size(total_content, size_limit)
+            
+        return len(str(value).encode('utf-8')) > size_limit
+    
     def get_ttl(self, key: str, value: Any, metadata: Dict[str, Any]) -> int:
         """TTL 결정"""
         content_type = metadata.get('content_type', 'unknown')
@@ -91,18 +162,16 @@ class ContentTypeCacheStrategy(CacheStrategy):
         target_audience = kwargs.get('target_audience', 'general')
         
         # 논문 ID들을 정렬하여 일관된 키 생성
-        papers = kwargs.get('papers', [])
-        paper_ids = sorted([str(p.id) if hasattr(p, 'id') else str(p) for p in papers])
-        
-        key_parts = [
-            content_type,
-            topic,
-            target_audience,
-            ','.join(paper_ids)
-        ]
+        papers = kwargs.get('papers')
+        paper_ids = sorted(str(getattr(p, 'id', p)) for p in papers) if papers else []
         
-        key_string = '|'.join(key_parts)
-        return hashlib.md5(key_string.encode()).hexdigest()
+        # 64비트 해시 - MD5보다 빠르고 키도 16자로 짧음 (인덱스 키는 문자열이어야 하므로 hex)
+        # 'content_type|topic|target_audience|id1,id2,...'를 이어 붙인 전체 문자열을 만들지 않고
+        # 앞부분과 논문 ID 목록을 나눠서 해셔에 전달 (해시 값은 동일)
+        hasher = _new_key_hasher(f"{content_type}|{topic}|{target_audience}|".encode())
+        if paper_ids:
+            hasher.update(','.join(paper_ids).encode())
+        return hasher.hexdigest()
 
 class TimeSensitiveCacheStrategy(CacheStrategy):
     """시간대별 캐싱 전략"""
@@ -110,15 +179,36 @@ class TimeSensitiveCacheStrategy(CacheStrategy):
     def __init__(self):
         self.peak_hours = [(7, 10), (18, 21)]  # 오전 7-10시, 저녁 6-9시
         
+        # 시간별 피크 여부 (0-23시)
+        self._peak_mask = tuple(
+            any(start <= hour < end for start, end in self.peak_hours)
+            for hour in range(24)
+        )
+        
+        # 현재 시각(시) 캐시 - 다음 정각까지 유효
+        self._hour = 0
+        self._hour_valid_until = 0.0
+        
+    def _current_hour(self) -> int:
+        """현재 시(hour) - 정각이 바뀔 때만 datetime.now() 호출"""
+        now = time.monotonic()
+        if now < self._hour_valid_until:
+            return self._hour
+            
+        current = datetime.now()
+        self._hour = current.hour
+        seconds_into_hour = current.minute * 60 + current.second + current.microsecond / 1_000_000
+        self._hour_valid_until = now + (3600 - seconds_into_hour)
+        return self._hour
+        
+    def _in_peak_time(self) -> bool:
+        """현재 피크 시간대인지 확인"""
+        return self._peak_mask[self._current_hour()]
+        
     def should_cache(self, key: str, value: Any, metadata: Dict[str, Any]) -> bool:
         """피크 시간대에만 적극적으로 캐싱"""
-        current_hour = datetime.now().hour
-        
         # 피크 시간대 확인
-        in_peak_time = any(
-            start <= current_hour < end 
-            for start, end in self.peak_hours
-        )
+        in_peak_time = self._in_peak_time()
         
         # 피크 시간대가 아니면 중요한 콘텐츠만 캐싱
         if not in_peak_time:
@@ -129,23 +219,16 @@ class TimeSensitiveCacheStrategy(CacheStrategy):
     
     def get_ttl(self, key: str, value: Any, metadata: Dict[str, Any]) -> int:
         """시간대에 따른 TTL 조정"""
-        current_hour = datetime.now().hour
-        
         # 피크 시간대면 짧은 TTL
-        in_peak_time = any(
-            start <= current_hour < end 
-            for start, end in self.peak_hours
-        )
-        
-        if in_peak_time:
+        if self._in_peak_time():
             return 1800  # 30분
         else:
             return 7200  # 2시간
     
     def get_cache_key(self, *args, **kwargs) -> str:
         """시간대를 포함한 캐시 키"""
-        base_key = str(args) + str(sorted(kwargs.items()))
-        time_slot = datetime.now().hour // 6  # 6시간 단위
+        base_key = _fast_key(args, kwargs)
+        time_slot = self._current_hour() // 6  # 6시간 단위
         
         return f"{base_key}_{time_slot}"
 
@@ -178,7 +261,7 @@ class UserSegmentCacheStrategy(CacheStrategy):
     def get_cache_key(self, *args, **kwargs) -> str:
         """사용자 세그먼트를 포함한 캐시 키"""
         user_segment = kwargs.get('user_segment', 'guest')
-        base_key = str(args) + str(sorted(kwargs.items()))
+        base_key = _fast_key(args, kwargs)
         
         return f"{user_segment}_{base_key}"
 
@@ -191,6 +274,58 @@ class CacheDecorator:
         self.cache_manager = cache_manager
         self.strategy = strategy
         
+        # L1: 키 -> (만료 시각(monotonic), 직렬화 바이트), LRU 순서
+        # (조회마다 새로 역직렬화하므로 호출자가 결과를 수정해도 다른 호출자에게 번지지 않음)
+        self._l1: "OrderedDict[str, Tuple[float, bytes]]" = OrderedDict()
+        self._l1_lock = threading.Lock()
+        # 무효화가 있을 때마다 증가 (조회 도중 무효화된 값이 L1에 다시 들어가지 않도록)
+        self._l1_generation = 0
+        
+        # 매니저에서 엔트리가 교체/삭제되면 L1에서도 제거
+        cache_manager.add_invalidation_listener(self._l1_invalidate)
+        
+    def _l1_get(self, cache_key: str) -> Any:
+        """L1 캐시 조회 (없거나 만료되면 _L1_MISSING)"""
+        with self._l1_lock:
+            item = self._l1.get(cache_key)
+            if item is None:
+                return _L1_MISSING
+            if item[0] <= time.monotonic():
+                del self._l1[cache_key]
+                return _L1_MISSING
+            self._l1.move_to_end(cache_key)
+            data = item[1]
+        return self.cache_manager._loads(data)
+            
+    def _l1_set(self, cache_key: str, value: Any, ttl: int = L1_CACHE_TTL,
+                generation: Optional[int] = None):
+        """L1 캐시 저장 (TTL은 최대 L1_CACHE_TTL, 0 이하는 매니저와 같이 만료 없음으로 보고 L1_CACHE_TTL)
+        
+        generation이 주어지면 그 이후 무효화가 있었을 때 저장하지 않는다.
+        """
+        try:
+            data = self.cache_manager._serialize(value)
+        except Exception:
+            return  # 직렬화할 수 없는 값은 L1에 두지 않음
+            
+        l1_ttl = min(ttl, L1_CACHE_TTL) if ttl > 0 else L1_CACHE_TTL
+        with self._l1_lock:
+            if generation is not None and generation != self._l1_generation:
+                return
+            self._l1[cache_key] = (time.monotonic() + l1_ttl, data)
+            self._l1.move_to_end(cache_key)
+            if len(self._l1) > L1_CACHE_SIZE:
+                self._l1.popitem(last=False)
+                
+    def _l1_invalidate(self, cache_key: Optional[str]):
+        """L1에서 키 제거 (None이면 전체 제거)"""
+        with self._l1_lock:
+            self._l1_generation += 1
+            if cache_key is None:
+                self._l1.clear()
+            else:
+                self._l1.pop(cache_key, None)
+        
     def cached(self, 
                content_type: str = None,
                importance: str = 'normal',
@@ -200,26 +335,24 @@ class CacheDecorator:
         def decorator(func):
             @wraps(func)
             async def async_wrapper(*args, **kwargs):
-                # 메타데이터 수집
-                metadata = {
-                    'content_type': content_type or kwargs.get('content_type', 'unknown'),
-                    'importance': importance,
-                    'function': func.__name__,
-                    'timestamp': datetime.now().isoformat()
-                }
-                
-                # 사용자 세그먼트 추가
-                if user_segment_getter:
-                    metadata['user_segment'] = user_segment_getter(*args, **kwargs)
-                    
                 # 캐시 키 생성
                 cache_key = self.strategy.get_cache_key(*args, **kwargs)
                 
+                # L1 확인 (이벤트 루프 양보/잠금 없이 바로 반환)
+                cached_value = self._l1_get(cache_key)
+                if cached_value is not _L1_MISSING:
+                    return cached_value
+                    
                 # 캐시 확인
+                generation = self._l1_generation
                 cached_value = await self.cache_manager.aget(cache_key)
                 if cached_value is not None:
+                    self._l1_set(cache_key, cached_value, generation=generation)
                     return cached_value
                     
+                # 메타데이터 수집 (캐시 미스일 때만)
+                metadata = self._build_metadata(func, content_type, importance, user_segment_getter, args, kwargs)
+                    
                 # 함수 실행
                 result = await func(*args, **kwargs)
                 
@@ -231,28 +364,27 @@ class CacheDecorator:
                 if self.strategy.should_cache(cache_key, result, metadata):
                     ttl = self.strategy.get_ttl(cache_key, result, metadata)
                     await self.cache_manager.aset(cache_key, result, ttl, metadata)
+                    self._l1_set(cache_key, result, ttl)
                     
                 return result
                 
             @wraps(func)
             def sync_wrapper(*args, **kwargs):
                 # 동기 버전
-                metadata = {
-                    'content_type': content_type or kwargs.get('content_type', 'unknown'),
-                    'importance': importance,
-                    'function': func.__name__,
-                    'timestamp': datetime.now().isoformat()
-                }
-                
-                if user_segment_getter:
-                    metadata['user_segment'] = user_segment_getter(*args, **kwargs)
-                    
                 cache_key = self.strategy.get_cache_key(*args, **kwargs)
                 
+                cached_value = self._l1_get(cache_key)
+                if cached_value is not _L1_MISSING:
+                    return cached_value
+                    
+                generation = self._l1_generation
                 cached_value = self.cache_manager.get(cache_key)
                 if cached_value is not None:
+                    self._l1_set(cache_key, cached_value, generation=generation)
                     return cached_value
                     
+                metadata = self._build_metadata(func, content_type, importance, user_segment_getter, args, kwargs)
+                    
                 result = func(*args, **kwargs)
                 
                 if hasattr(result, 'quality_score'):
@@ -261,6 +393,7 @@ class CacheDecorator:
                 if self.strategy.should_cache(cache_key, result, metadata):
                     ttl = self.strategy.get_ttl(cache_key, result, metadata)
                     self.cache_manager.set(cache_key, result, ttl, metadata)
+                    self._l1_set(cache_key, result, ttl)
                     
                 return result
                 
@@ -270,35 +403,58 @@ class CacheDecorator:
                 return sync_wrapper
                 
         return decorator
+    
+    @staticmethod
+    def _build_metadata(func: Callable, content_type: Optional[str], importance: str,
+                        user_segment_getter: Optional[Callable], args: tuple, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """캐시 저장용 메타데이터 수집"""
+        metadata = {
+            'content_type': content_type or kwargs.get('content_type', 'unknown'),
+            'importance': importance,
+            'function': func.__name__,
+            'timestamp': _iso_now()
+        }
+        
+        # 사용자 세그먼트 추가
+        if user_segment_getter:
+            metadata['user_segment'] = user_segment_getter(*args, **kwargs)
+            
+        return metadata
 
 class CacheWarmer:
     """캐시 워밍 - 미리 캐시 채우기"""
     
-    def __init__(self, cache_manager: AdvancedCacheManager):
+    def __init__(self, cache_manager: AdvancedCacheManager, concurrency: int = 8):
         self.cache_manager = cache_manager
         self.warming_tasks = []
+        # 동시에 생성/저장하는 작업 수 제한 (생성기/저장소 과부하 및 메모리 급증 방지)
+        self._semaphore = asyncio.Semaphore(concurrency)
         
     async def warm_popular_content(self, popular_topics: List[Dict[str, Any]]):
         """인기 콘텐츠 미리 캐싱"""
-        tasks = []
-        
-        for topic_info in popular_topics:
-            topic = topic_info['topic']
-            content_types = topic_info.get('content_types', ['shorts', 'article'])
-            
-            for content_type in content_types:
-                task = asyncio.create_task(
-                    self._generate_and_cache(topic, content_type)
-                )
-                tasks.append(task)
+        jobs = [
+            (topic_info['topic'], content_type)
+            for topic_info in popular_topics
+            for content_type in topic_info.get('content_types', ['shorts', 'article'])
+        ]
                 
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        results = await asyncio.gather(
+            *(self._bounded_generate(topic, content_type) for topic, content_type in jobs),
+            return_exceptions=True
+        )
         
-        success_count = sum(1 for r in results if not isinstance(r, Exception))
-        print(f"✅ 캐시 워밍 완료: {success_count}/{len(tasks)} 성공")
+        # 생성된 콘텐츠는 한 번에 저장 (인덱스 커밋 1회)
+        items = [r for r in results if not isinstance(r, Exception)]
+        success_count = await self.cache_manager.aset_many(items)
+        print(f"✅ 캐시 워밍 완료: {success_count}/{len(jobs)} 성공")
         
-    async def _generate_and_cache(self, topic: str, content_type: str):
-        """콘텐츠 생성 및 캐싱"""
+    async def _bounded_generate(self, topic: str, content_type: str):
+        """동시 실행 수 제한 하에 콘텐츠 생성"""
+        async with self._semaphore:
+            return await self._generate(topic, content_type)
+        
+    async def _generate(self, topic: str, content_type: str):
+        """콘텐츠 생성 - (키, 값, TTL, 메타데이터) 반환"""
         # 실제로는 콘텐츠 생성기를 호출
         # 여기서는 시뮬레이션
         cache_key = f"warmed_{content_type}_{topic}"
@@ -310,45 +466,68 @@ class CacheWarmer:
             'quality_score': 85
         }
         
-        return await self.cache_manager.aset(
-            cache_key, value, ttl=3600*24, metadata=metadata
-        )
+        return cache_key, value, 3600*24, metadata
 
 class CacheInvalidator:
     """캐시 무효화 관리"""
     
     def __init__(self, cache_manager: AdvancedCacheManager):
         self.cache_manager = cache_manager
-        self.invalidation_rules = []
+        # 대상 메타데이터 필드 -> 규칙 목록
+        self.invalidation_rules: Dict[str, List[Dict[str, Any]]] = {}
         
     def add_rule(self, rule: Dict[str, Any]):
-        """무효화 규칙 추가"""
-        self.invalidation_rules.append(rule)
+        """무효화 규칙 추가
+        
+        Args:
+            rule: 'target_field'(규칙이 보는 메타데이터 필드)가 필수이며,
+                  'value'가 있으면 해당 값일 때만 적용
+        """
+        if 'target_field' not in rule:
+            raise ValueError("무효화 규칙에는 target_field가 필요합니다")
+        self.invalidation_rules.setdefault(rule['target_field'], []).append(rule)
+        
+    def apply_rules(self, entry_metadata: Optional[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """엔트리 메타데이터에 해당하는 규칙 조회 (메타데이터 필드별 규칙만 확인)"""
+        if not entry_metadata:
+            return []
+            
+        matched = []
+        for field, value in entry_metadata.items():
+            for rule in self.invalidation_rules.get(field, ()):
+                if 'value' not in rule or rule['value'] == value:
+                    matched.append(rule)
+        return matched
         
     async def invalidate_by_pattern(self, pattern: str):
         """패턴에 맞는 캐시 무효화"""
         invalidated = 0
         
-        for key in list(self.cache_manager.index.keys()):
-            if pattern in key:
-                if self.cache_manager.delete(key):
-                    invalidated += 1
+        for key in self.cache_manager.find_keys_containing(pattern):
+            if self.cache_manager.delete(key):
+                invalidated += 1
                     
         print(f"🗑️ 패턴 '{pattern}'에 맞는 {invalidated}개 캐시 무효화")
         return invalidated
         
+    async def invalidate_by_prefix(self, prefix: str):
+        """접두사로 시작하는 캐시 무효화 (전체 키 스캔 없이 인덱스 범위 검색)"""
+        invalidated = 0
+        
+        for key in self.cache_manager.find_keys_by_prefix(prefix):
+            if self.cache_manager.delete(key):
+                invalidated += 1
+                
+        print(f"🗑️ 접두사 '{prefix}'로 시작하는 {invalidated}개 캐시 무효화")
+        return invalidated
+        
     async def invalidate_by_metadata(self, conditions: Dict[str, Any]):
-        """메타데이터 조건에 맞는 캐시 무효화"""
+        """메타데이터 조건에 맞는 캐시 무효화 (메타데이터 역색인 사용)"""
         invalidated = 0
         
-        for key, entry in list(self.cache_manager.index.items()):
-            if entry.metadata:
-                match = all(
-                    entry.metadata.get(k) == v 
-                    for k, v in conditions.items()
-                )
-                if match and self.cache_manager.delete(key):
-                    invalidated += 1
+        for key in self.cache_manager.find_keys_by_metadata(conditions):
+            if self.cache_manager.delete(key):
+                invalidated += 1
                     
         print(f"🗑️ 조건에 맞는 {invalidated}개 캐시 무효화")
         return invalidated
@@ -4,10 +4,11 @@
 
 from typing import List, Dict, Any, Tuple
 from dataclasses import dataclass
+from functools import lru_cache
 import re
 import json
 
-@dataclass
+@dataclass(frozen=True)
 class CategoryMetrics:
     """카테고리 평가 메트릭"""
     has_number: bool  # 구체적 숫자 포함 여부
@@ -20,18 +21,98 @@ class CategoryMetrics:
     interest_score: float  # 즉시관심도 점수 (0-10)
     overall_score: float  # 종합 점수 (0-10)
 
+# 실용적 키워드 패턴 (카테고리마다 반복 사용하므로 미리 컴파일)
+PRACTICAL_PATTERNS = {
+    'numbers': re.compile(r'\d+'),  # 숫자
+    'time': re.compile(r'(\d+분|\d+시간|\d+일|\d+주|\d+개월)'),  # 시간 표현
+    'targets': re.compile(r'(초보|중급|고급|남성|여성|시니어|직장인|학생|주부)'),  # 대상
+    'benefits': re.compile(r'(효과|개선|향상|감소|증가|해결|극복|완치|성공)'),  # 혜택
+    'actions': re.compile(r'(하는법|방법|가이드|팁|비법|전략|루틴|프로그램)')  # 행동
+}
+
+# 중복 체크용 패턴 정규화
+_RE_DIGITS = re.compile(r'\d+')
+_RE_TIME_UNITS = re.compile(r'(분|시간|일|주|개월)')
+_RE_TARGETS_UNIFY = re.compile(r'(초보|중급|고급|남성|여성|시니어)')
+
+@lru_cache(maxsize=4096)
+def _analyze_category_name(category_name: str) -> CategoryMetrics:
+    """카테고리 이름 분석 (이름에만 의존하는 순수 함수이므로 결과를 캐시해 공유)"""
+    # 패턴 매칭
+    # 시간 표현은 항상 숫자를 포함하므로 숫자가 없으면 시간 패턴은 검사하지 않음
+    # (패턴들을 하나의 정규식으로 합치면 re 엔진의 리터럴 최적화가 사라져 오히려 느려짐)
+    has_number = bool(PRACTICAL_PATTERNS['numbers'].search(category_name))
+    has_time = has_number and bool(PRACTICAL_PATTERNS['time'].search(category_name))
+    has_target = bool(PRACTICAL_PATTERNS['targets'].search(category_name))
+    has_benefit = bool(PRACTICAL_PATTERNS['benefits'].search(category_name))
+    has_action = bool(PRACTICAL_PATTERNS['actions'].search(category_name))
+    
+    # 점수 계산
+    specificity_score = (
+        (3 if has_number or has_time else 0) +
+        (2 if has_target else 0) +
+        (2 if has_action else 0) +
+        (3 if len(category_name) > 10 else 1)
+    )
+    
+    clickability_score = (
+        (3 if has_benefit else 0) +
+        (2 if has_number else 0) +
+        (2 if '완전정복' in category_name or '비밀' in category_name else 0) +
+        (3 if '?' in category_name or '!' in category_name else 1)
+    )
+    
+    practicality_score = (
+        (2.5 if has_action else 0) +
+        (2.5 if has_target else 0) +
+        (2.5 if has_time else 0) +
+        (2.5 if '방법' in category_name or '가이드' in category_name else 0)
+    )
+    
+    interest_score = (
+        (3 if has_number else 0) +
+        (3 if has_benefit else 0) +
+        (2 if has_target else 0) +
+        (2 if '최신' in category_name or '2024' in category_name else 0)
+    )
+    
+    overall_score = (
+        specificity_score * 0.2 +
+        clickability_score * 0.3 +
+        practicality_score * 0.3 +
+        interest_score * 0.2
+    )
+    
+    return CategoryMetrics(
+        has_number=has_number or has_time,
+        has_target=has_target,
+        has_benefit=has_benefit,
+        has_action=has_action,
+        specificity_score=min(specificity_score, 10),
+        clickability_score=min(clickability_score, 10),
+        practicality_score=min(practicality_score, 10),
+        interest_score=min(interest_score, 10),
+        overall_score=min(overall_score, 10)
+    )
+
+@lru_cache(maxsize=4096)
+def _normalize_category_pattern(category_name: str) -> str:
+    """숫자/시간/대상 표현을 통일한 패턴 (요청마다 새 인스턴스가 생성되므로 모듈 수준에서 캐시)"""
+    # 숫자 제거
+    pattern = _RE_DIGITS.sub('N', category_name)
+    # 시간 표현 통일
+    pattern = _RE_TIME_UNITS.sub('T', pattern)
+    # 대상 표현 통일
+    pattern = _RE_TARGETS_UNIFY.sub('P', pattern)
+    
+    return pattern.lower()
+
 class CategoryOptimizer:
     """카테고리 생성 최적화 클래스"""
     
     def __init__(self):
         # 실용적 키워드 패턴
-        self.practical_patterns = {
-            'numbers': r'\d+',  # 숫자
-            'time': r'(\d+분|\d+시간|\d+일|\d+주|\d+개월)',  # 시간 표현
-            'targets': r'(초보|중급|고급|남성|여성|시니어|직장인|학생|주부)',  # 대상
-            'benefits': r'(효과|개선|향상|감소|증가|해결|극복|완치|성공)',  # 혜택
-            'actions': r'(하는법|방법|가이드|팁|비법|전략|루틴|프로그램)'  # 행동
-        }
+        self.practical_patterns = PRACTICAL_PATTERNS
         
         # 카테고리 템플릿
         self.category_templates = [
@@ -54,61 +135,7 @@ class CategoryOptimizer:
     
     def analyze_category(self, category_name: str) -> CategoryMetrics:
         """카테고리 이름 분석 및 메트릭 계산"""
-        
-        # 패턴 매칭
-        has_number = bool(re.search(self.practical_patterns['numbers'], category_name))
-        has_time = bool(re.search(self.practical_patterns['time'], category_name))
-        has_target = bool(re.search(self.practical_patterns['targets'], category_name))
-        has_benefit = bool(re.search(self.practical_patterns['benefits'], category_name))
-        has_action = bool(re.search(self.practical_patterns['actions'], category_name))
-        
-        # 점수 계산
-        specificity_score = (
-            (3 if has_number or has_time else 0) +
-            (2 if has_target else 0) +
-            (2 if has_action else 0) +
-            (3 if len(category_name) > 10 else 1)
-        )
-        
-        clickability_score = (
-            (3 if has_benefit else 0) +
-            (2 if has_number else 0) +
-            (2 if '완전정복' in category_name or '비밀' in category_name else 0) +
-            (3 if '?' in category_name or '!' in category_name else 1)
-        )
-        
-        practicality_score = (
-            (2.5 if has_action else 0) +
-            (2.5 if has_target else 0) +
-            (2.5 if has_time else 0) +
-            (2.5 if '방법' in category_name or '가이드' in category_name else 0)
-        )
-        
-        interest_score = (
-            (3 if has_number else 0) +
-            (3 if has_benefit else 0) +
-            (2 if has_target else 0) +
-            (2 if '최신' in category_name or '2024' in category_name else 0)
-        )
-        
-        overall_score = (
-            specificity_score * 0.2 +
-            clickability_score * 0.3 +
-            practicality_score * 0.3 +
-            interest_score * 0.2
-        )
-        
-        return CategoryMetrics(
-            has_number=has_number or has_time,
-            has_target=has_target,
-            has_benefit=has_benefit,
-            has_action=has_action,
-            specificity_score=min(specificity_score, 10),
-            clickability_score=min(clickability_score, 10),
-            practicality_score=min(practicality_score, 10),
-            interest_score=min(interest_score, 10),
-            overall_score=min(overall_score, 10)
-        )
+        return _analyze_category_name(category_name)
     
     def filter_categories(self, categories: List[Dict[str, Any]], 
                          min_score: float = 7.0) -> List[Dict[str, Any]]:
@@ -148,14 +175,7 @@ class CategoryOptimizer:
     
     def _extract_pattern(self, category_name: str) -> str:
         """카테고리에서 핵심 패턴 추출 (중복 체크용)"""
-        # 숫자 제거
-        pattern = re.sub(r'\d+', 'N', category_name)
-        # 시간 표현 통일
-        pattern = re.sub(r'(분|시간|일|주|개월)', 'T', pattern)
-        # 대상 표현 통일
-        pattern = re.sub(r'(초보|중급|고급|남성|여성|시니어)', 'P', pattern)
-        
-        return pattern.lower()
+        return _normalize_category_pattern(category_name)
     
     def enhance_prompt(self, base_prompt: str) -> str:
         """프롬프트 개선 - 실용성과 구체성 강조"""
@@ -200,11 +220,11 @@ class CategoryOptimizer:
         
         for cat in categories:
             # 대상 추출
-            for target in re.findall(self.practical_patterns['targets'], cat['name']):
+            for target in self.practical_patterns['targets'].findall(cat['name']):
                 targets.add(target)
             
             # 혜택 추출
-            for benefit in re.findall(self.practical_patterns['benefits'], cat['name']):
+            for benefit in self.practical_patterns['benefits'].findall(cat['name']):
                 benefits.add(benefit)
         
         # 다양성 부족 체크
@@ -292,7 +312,7 @@ class CategoryOptimizer:
         gemini_client = GeminiClient()
         
         # 논문 검색 및 서브카테고리 생성
-        subcategory_result = gemini_client.discover_papers_for_topic(category, topic)
+        subcategory_result = await gemini_client.discover_papers_for_topic(category, topic)
         
         if subcategory_result:
             return {
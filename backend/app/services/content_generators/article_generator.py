@@ -11,57 +11,28 @@ class ArticleGenerator:
     
     def __init__(self):
         self.content_type = "article"
+        self.tone = "informative"  # 정보 전달 톤
         
     def generate(self, topic: str, papers: List[Any], 
                  category_id: str = None,
-                 additional_context: str = None, **kwargs) -> Any:
+                 additional_context: str = None,
+                 service_tier: Optional[str] = None, **kwargs) -> Any:
         """아티클 생성"""
         
         # GeminiClient import
-        from ..gemini_client import GeminiClient, SubcategoryResult, PaperInfo
+        from ..gemini_client import GeminiClient, SubcategoryResult, run_sync
         
-        # additional_context에서 실제 정보 추출
-        import json
-        context_data = {}
-        if additional_context:
-            try:
-                context_data = json.loads(additional_context)
-            except json.JSONDecodeError:
-                pass
-        
-        # SubcategoryResult 객체 생성
-        paper_objects = []
-        for paper in papers:
-            if isinstance(paper, dict):
-                paper_objects.append(PaperInfo(
-                    title=paper.get('title', 'Unknown Title'),
-                    authors=paper.get('authors', 'Unknown Authors'),
-                    journal=paper.get('journal', 'Unknown Journal'),
-                    year=paper.get('publication_year', paper.get('year', 2024)),
-                    doi=paper.get('doi', ''),
-                    impact_factor=paper.get('impact_factor', 0.0),
-                    citations=paper.get('citations', 0),
-                    paper_type=paper.get('paper_type', 'research')
-                ))
-        
-        # 서브카테고리 결과 생성
-        subcategory = SubcategoryResult(
-            name=topic,
-            description=context_data.get('subcategory_description', ''),
-            papers=paper_objects,
-            expected_effect=context_data.get('expected_effect', ''),
-            quality_score=context_data.get('quality_score', 80.0),
-            quality_grade=context_data.get('quality_grade', 'B')
-        )
+        # 서브카테고리 결과 생성 (additional_context에서 실제 정보 추출)
+        subcategory = SubcategoryResult.from_context(topic, papers, additional_context)
         
         # Gemini API를 사용하여 콘텐츠 생성
         gemini_client = GeminiClient()
-        result = gemini_client.generate_content(subcategory, 'article')
+        result = run_sync(gemini_client.generate_content(subcategory, 'article', service_tier=service_tier))
         
         # API가 기대하는 형식으로 반환
         return SimpleNamespace(
             content=result.get('content', ''),
-            tone='informative',  # 정보 전달 톤
+            tone=self.tone,
             quality_score=result.get('quality_score', 80.0),
             metadata={
                 "content_type": "article",
@@ -8,6 +8,44 @@ from dataclasses import dataclass
 import re
 import time
 
+# 품질 점수 키워드
+STRUCTURE_KEYWORDS = ('첫째', '둘째', '1.', '2.', '단계', '방법', '팁', '결론')
+PRACTICAL_KEYWORDS = ('하는법', '방법', '꿀팁', '주의사항', '추천', '가이드')
+
+# 응답의 <thinking> 블록 (생성 응답마다 사용하므로 미리 컴파일)
+THINKING_PATTERN = re.compile(r'<thinking>(.*?)</thinking>', re.DOTALL)
+
+# 타겟 청중별 톤앤매너 (호출마다 다시 만들지 않도록 모듈 상수로 유지)
+TONE_ADJUSTMENTS = {
+    "general": {
+        "replacements": [
+            ("연구에 따르면", "최신 연구에서 밝혀진 바로는"),
+            ("결과적으로", "그 결과"),
+            ("따라서", "그래서")
+        ],
+        "prefix": "",
+        "suffix": ""
+    },
+    "beginner": {
+        "replacements": [
+            ("유산소 운동", "심장을 뛰게 하는 운동"),
+            ("근력 운동", "근육을 키우는 운동"),
+            ("대사율", "칼로리 소모 속도")
+        ],
+        "prefix": "💡 초보자도 쉽게 이해할 수 있도록 설명드릴게요!\n\n",
+        "suffix": "\n\n🎯 천천히 따라해보세요!"
+    },
+    "expert": {
+        "replacements": [
+            ("효과가 있다", "통계적으로 유의미한 효과가 관찰되었다"),
+            ("증가했다", "유의미한 증가를 보였다"),
+            ("감소했다", "통계적으로 유의한 감소가 나타났다")
+        ],
+        "prefix": "📊 전문가를 위한 심화 분석\n\n",
+        "suffix": "\n\n📈 추가 연구 자료는 참고문헌을 확인하세요."
+    }
+}
+
 @dataclass
 class ContentSection:
     """콘텐츠 섹션"""
@@ -52,13 +90,12 @@ class BaseContentGenerator(ABC):
     
     def extract_thinking_process(self, response: str) -> tuple[str, str]:
         """사고 과정 추출"""
-        thinking_pattern = r'<thinking>(.*?)</thinking>'
-        thinking_matches = re.findall(thinking_pattern, response, re.DOTALL)
+        thinking_matches = THINKING_PATTERN.findall(response)
         
         if thinking_matches:
             thinking_process = '\n'.join(thinking_matches)
             # 사고 과정 제거한 콘텐츠
-            clean_content = re.sub(thinking_pattern, '', response, flags=re.DOTALL)
+            clean_content = THINKING_PATTERN.sub('', response)
             return thinking_process.strip(), clean_content.strip()
         
         return "", response
@@ -67,21 +104,18 @@ class BaseContentGenerator(ABC):
         """콘텐츠 품질 점수 계산"""
         score = 0.0
         
-        # 1. 논문 인용 확인 (30점)
-        paper_citations = sum(1 for paper in papers if any(
-            keyword in content.lower() 
-            for keyword in [paper.title.lower()[:20], paper.authors.split()[0].lower()]
-        ))
+        # 1. 논문 인용 확인 (30점) - 소문자 변환은 한 번만
+        content_lower = content.lower()
+        paper_keys = [self._paper_citation_keys(paper) for paper in papers]
+        paper_citations = sum(1 for keys in paper_keys if any(key in content_lower for key in keys))
         score += min(paper_citations * 10, 30)
         
         # 2. 구조화 수준 (20점)
-        structure_keywords = ['첫째', '둘째', '1.', '2.', '단계', '방법', '팁', '결론']
-        structure_count = sum(1 for keyword in structure_keywords if keyword in content)
+        structure_count = sum(1 for keyword in STRUCTURE_KEYWORDS if keyword in content)
         score += min(structure_count * 5, 20)
         
         # 3. 실용성 키워드 (20점)
-        practical_keywords = ['하는법', '방법', '꿀팁', '주의사항', '추천', '가이드']
-        practical_count = sum(1 for keyword in practical_keywords if keyword in content)
+        practical_count = sum(1 for keyword in PRACTICAL_KEYWORDS if keyword in content)
         score += min(practical_count * 5, 20)
         
         # 4. 적절한 길이 (15점)
@@ -96,9 +130,9 @@ class BaseContentGenerator(ABC):
             else:
                 score += max(0, 15 - abs(len(content) - ideal_length) / 100)
         
-        # 5. 가독성 (15점)
-        sentences = content.split('.')
-        avg_sentence_length = sum(len(s) for s in sentences) / max(len(sentences), 1)
+        # 5. 가독성 (15점) - '.' 기준 문장 수/길이를 리스트 생성 없이 계산
+        period_count = content.count('.')
+        avg_sentence_length = (len(content) - period_count) / (period_count + 1)
         if 20 <= avg_sentence_length <= 40:  # 이상적인 문장 길이
             score += 15
         else:
@@ -106,6 +140,15 @@ class BaseContentGenerator(ABC):
         
         return min(score, 100)
     
+    @staticmethod
+    def _paper_citation_keys(paper: Any) -> tuple:
+        """인용 확인용 키워드 (제목 앞 20자, 제1저자) - 저자 정보가 없으면 제목만"""
+        title_key = paper.title.lower()[:20]
+        author_tokens = paper.authors.split() if paper.authors else []
+        if author_tokens:
+            return title_key, author_tokens[0].lower()
+        return (title_key,)
+    
     def format_paper_info(self, papers: List[Any]) -> str:
         """논문 정보 포맷팅"""
         paper_info = []
@@ -120,37 +163,7 @@ class BaseContentGenerator(ABC):
     
     def apply_tone_and_style(self, content: str, target_audience: str = "general") -> str:
         """타겟 청중에 맞는 톤앤매너 적용"""
-        tone_adjustments = {
-            "general": {
-                "replacements": [
-                    ("연구에 따르면", "최신 연구에서 밝혀진 바로는"),
-                    ("결과적으로", "그 결과"),
-                    ("따라서", "그래서")
-                ],
-                "prefix": "",
-                "suffix": ""
-            },
-            "beginner": {
-                "replacements": [
-                    ("유산소 운동", "심장을 뛰게 하는 운동"),
-                    ("근력 운동", "근육을 키우는 운동"),
-                    ("대사율", "칼로리 소모 속도")
-                ],
-                "prefix": "💡 초보자도 쉽게 이해할 수 있도록 설명드릴게요!\n\n",
-                "suffix": "\n\n🎯 천천히 따라해보세요!"
-            },
-            "expert": {
-                "replacements": [
-                    ("효과가 있다", "통계적으로 유의미한 효과가 관찰되었다"),
-                    ("증가했다", "유의미한 증가를 보였다"),
-                    ("감소했다", "통계적으로 유의한 감소가 나타났다")
-                ],
-                "prefix": "📊 전문가를 위한 심화 분석\n\n",
-                "suffix": "\n\n📈 추가 연구 자료는 참고문헌을 확인하세요."
-            }
-        }
-        
-        adjustments = tone_adjustments.get(target_audience, tone_adjustments["general"])
+        adjustments = TONE_ADJUSTMENTS.get(target_audience, TONE_ADJUSTMENTS["general"])
         
         # 치환 적용
         adjusted_content = content
@@ -1,15 +1,26 @@
 import os
-from typing import List, Dict, Any, Optional
+import asyncio
+import inspect
+from typing import AsyncIterator, Awaitable, Callable, List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
 from google import genai
-from google.genai import types
+from google.genai import types, errors
 import json
-import re
+import orjson
 import logging
+import math
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from functools import partial, wraps
 from dotenv import load_dotenv
 # Removed CategoryOptimizer as we're not using filtering anymore
-from .paper_quality_evaluator import PaperQualityEvaluator, QualityMetrics, PaperInfo as PaperQualityInfo
+# 논문 정보는 품질 평가기와 같은 클래스를 사용해 평가 전에 복사할 필요가 없음
+from .paper_quality_evaluator import QualityMetrics, PaperInfo, paper_quality_evaluator
 from .cache_manager import cache_manager
+from .semantic_cache import semantic_cache
 from ..utils.token_tracker import token_tracker
 
 # Configure logging
@@ -18,7 +29,253 @@ logger = logging.getLogger(__name__)
 # Load environment variables
 load_dotenv()
 
-@dataclass
+# Gemini Batch API 상태 확인 주기(초)와 종료 상태
+BATCH_POLL_INTERVAL = 30
+BATCH_TERMINAL_STATES = (
+    types.JobState.JOB_STATE_SUCCEEDED,
+    types.JobState.JOB_STATE_FAILED,
+    types.JobState.JOB_STATE_CANCELLED,
+    types.JobState.JOB_STATE_EXPIRED,
+)
+
+# Gemini 호출 한도 (Google AI 기본값)
+GEMINI_RPM_LIMIT = 60           # 분당 요청 수
+GEMINI_TPM_LIMIT = 100_000      # 분당 토큰 수
+GEMINI_MAX_CONCURRENCY = 8      # 동시 요청 수
+
+# 서비스 등급 - 사용자가 기다리는 호출은 priority(빠르지만 비쌈), 백그라운드 작업은 flex(느리지만 저렴)
+# priority를 쓸 수 없는 계정이면 환경변수로 standard 지정 (빈 값이면 등급 미지정)
+INTERACTIVE_SERVICE_TIER = os.getenv("GEMINI_INTERACTIVE_SERVICE_TIER", "priority") or None
+BACKGROUND_SERVICE_TIER = os.getenv("GEMINI_BACKGROUND_SERVICE_TIER", "flex") or None
+
+# 일시적 오류 재시도 - 1초, 2초, 4초 간격 (429: 호출 한도 초과, 5xx: 서버 오류/과부하/시간 초과)
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+RATE_LIMIT_MAX_RETRIES = 3
+RATE_LIMIT_BACKOFF_BASE = 1.0
+
+class GeminiRateLimiter:
+    """RPM/TPM 한도와 AIMD 동시성 제어
+    
+    요청이 성공하면 동시 요청 수를 1씩 늘리고(최대 max_concurrency), 429를 받으면 절반으로 줄인다.
+    run_sync로 다른 스레드의 이벤트 루프에서도 함께 쓰이므로 상태는 threading.Lock으로 보호한다.
+    RPM/TPM 한도에 걸리면 윈도우가 비는 시각까지 잠들고, 동시 요청 수가 가득 차면
+    슬롯이 날 때 각자의 루프에서 깨어나도록 Future를 등록해 기다린다.
+    """
+    
+    def __init__(self, rpm: int = GEMINI_RPM_LIMIT, tpm: int = GEMINI_TPM_LIMIT,
+                 max_concurrency: int = GEMINI_MAX_CONCURRENCY):
+        self.rpm = rpm
+        self.tpm = tpm
+        self.max_concurrency = max_concurrency
+        self.concurrency = max_concurrency
+        self._in_flight = 0
+        self._request_times = deque()  # 최근 60초 요청 시각
+        self._tokens_used = 0
+        self._token_window_start = time.monotonic()
+        self._lock = threading.Lock()
+        # 동시 요청 슬롯을 기다리는 (루프, Future)
+        self._slot_waiters: List[Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = []
+    
+    def _try_reserve(self, est_tokens: int,
+                     waiter: Tuple[asyncio.AbstractEventLoop, asyncio.Future]) -> Optional[float]:
+        """요청 슬롯 예약 - 성공하면 None, 아니면 다시 시도할 때까지 기다릴 시간(초)
+        
+        동시 요청 수가 가득 차 있으면 waiter를 등록하고 math.inf를 반환한다 (슬롯이 나면 깨움).
+        """
+        now = time.monotonic()
+        with self._lock:
+            if self._in_flight >= self.concurrency:
+                self._slot_waiters.append(waiter)
+                return math.inf
+            
+            while self._request_times and now - self._request_times[0] >= 60:
+                self._request_times.popleft()
+            if len(self._request_times) >= self.rpm:
+                return 60 - (now - self._request_times[0])
+            
+            if now - self._token_window_start >= 60:
+                self._token_window_start = now
+                self._tokens_used = 0
+            # 윈도우의 첫 요청은 추정치가 한도를 넘어도 보낸다
+            if self._tokens_used and self._tokens_used + est_tokens > self.tpm:
+                return 60 - (now - self._token_window_start)
+            
+            self._in_flight += 1
+            self._request_times.append(now)
+            self._tokens_used += est_tokens
+            return None
+    
+    @asynccontextmanager
+    async def acquire(self, est_tokens: int = 0):
+        """한도 안에서 요청 슬롯을 얻을 때까지 대기"""
+        loop = asyncio.get_running_loop()
+        while True:
+            waiter = loop.create_future()
+            wait = self._try_reserve(est_tokens, (loop, waiter))
+            if wait is None:
+                break
+            try:
+                if wait == math.inf:
+                    await waiter
+                else:
+                    await asyncio.sleep(wait)
+            except BaseException:
+                with self._lock:
+                    if (loop, waiter) in self._slot_waiters:
+                        self._slot_waiters.remove((loop, waiter))
+                raise
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+                waiters = self._take_slot_waiters()
+            self._wake(waiters)
+    
+    def _take_slot_waiters(self) -> List[Tuple[asyncio.AbstractEventLoop, asyncio.Future]]:
+        """빈 슬롯이 있으면 대기 중인 호출을 모두 꺼냄 (_lock 보유 상태에서 호출, 깨어나면 다시 예약 시도)"""
+        if self._in_flight >= self.concurrency or not self._slot_waiters:
+            return []
+        waiters, self._slot_waiters = self._slot_waiters, []
+        return waiters
+    
+    @staticmethod
+    def _wake(waiters: List[Tuple[asyncio.AbstractEventLoop, asyncio.Future]]):
+        """대기 중인 호출을 각자의 이벤트 루프에서 깨움"""
+        for loop, waiter in waiters:
+            try:
+                loop.call_soon_threadsafe(_resolve_waiter, waiter)
+            except RuntimeError:
+                pass  # 이미 닫힌 루프
+    
+    def on_success(self):
+        """가산 증가 (α=1)"""
+        with self._lock:
+            self.concurrency = min(self.max_concurrency, self.concurrency + 1)
+            waiters = self._take_slot_waiters()
+        self._wake(waiters)
+    
+    def on_rate_limited(self):
+        """승산 감소 (β=0.5)"""
+        with self._lock:
+            self.concurrency = max(1, self.concurrency // 2)
+
+def _resolve_waiter(waiter: asyncio.Future):
+    if not waiter.done():
+        waiter.set_result(None)
+
+# 한도는 API 키 단위이므로 모든 GeminiClient가 공유
+gemini_rate_limiter = GeminiRateLimiter()
+
+def _estimate_tokens(prompt: str, template: Optional[str] = None) -> int:
+    """입력 토큰 수 추정 (약 4자당 1토큰)
+    
+    템플릿의 정적 지시문도 컨텍스트 캐시 여부와 관계없이 입력 토큰으로 TPM에 포함된다.
+    """
+    chars = len(prompt)
+    if template is not None:
+        chars += len(PROMPT_INSTRUCTIONS[template])
+    return chars // 4
+
+_json_decoder = json.JSONDecoder()
+
+def _extract_json(text: str) -> Optional[Any]:
+    """응답 텍스트에서 첫 번째 JSON 객체를 파싱 (없으면 None)
+    
+    보통은 첫 '{'부터 마지막 '}'까지가 객체 하나이므로 그 구간을 orjson으로 파싱한다.
+    뒤에 중괄호가 들어간 설명이 붙는 등 파싱되지 않으면 첫 '{'부터 객체가 끝나는 지점까지만 읽는다.
+    """
+    start = text.find('{')
+    end = text.rfind('}')
+    if start < 0 or end < start:
+        return None
+    try:
+        return orjson.loads(text[start:end + 1])
+    except orjson.JSONDecodeError:
+        return _json_decoder.raw_decode(text, start)[0]
+
+def _record_usage(label: str, operation: str, usage: Optional[types.GenerateContentResponseUsageMetadata]) -> None:
+    """토큰 사용량 로그 및 token_tracker 기록
+    
+    로그 메시지는 %-포맷 인자로 넘겨 INFO가 꺼져 있으면 문자열을 만들지 않는다.
+    """
+    if usage is None:
+        logger.warning("[Gemini API - %s] No token usage metadata available", label)
+        return
+    logger.info(
+        "[Gemini API - %s] Token usage: prompt_tokens=%s, response_tokens=%s, total_tokens=%s",
+        label, usage.prompt_token_count, usage.candidates_token_count, usage.total_token_count
+    )
+    token_tracker.add_usage(
+        operation,
+        usage.prompt_token_count,
+        usage.candidates_token_count,
+        usage.total_token_count
+    )
+
+def run_sync(coro):
+    """동기 코드에서 GeminiClient 코루틴 실행
+    
+    이미 이벤트 루프가 돌고 있는 스레드에서 호출되면 별도 스레드의 새 루프에서 실행한다.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
+# 진행 중인 호출: (이벤트 루프, 호출 키) -> 결과 Future
+# Future는 만든 루프에서만 await할 수 있고 run_sync는 별도 스레드의 루프를 쓰기도 하므로 루프별로 구분
+_inflight: Dict[Tuple[asyncio.AbstractEventLoop, str], List[Any]] = {}  # [호출 Task, 기다리는 호출 수]
+
+def _finish_flight(key: Tuple[asyncio.AbstractEventLoop, str], task: asyncio.Task) -> None:
+    """호출 Task 완료 시 진행 중 목록에서 제거"""
+    flight = _inflight.get(key)
+    if flight is not None and flight[0] is task:
+        del _inflight[key]
+    if not task.cancelled():
+        task.exception()  # 기다리는 쪽이 모두 취소된 뒤 실패해도 "exception was never retrieved" 경고가 남지 않도록
+
+def _single_flight(method: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+    """같은 인자로 진행 중인 호출이 있으면 Gemini를 다시 호출하지 않고 그 결과를 함께 기다림
+    
+    동시에 들어온 같은 요청(여러 사용자, 프론트엔드 중복 요청)이 캐시가 채워지기 전에 각각 호출하는 것을 막는다.
+    GeminiClient는 요청마다 새로 만들어지므로 키에는 self를 제외한 인자만 사용한다.
+    실제 호출은 별도 Task로 실행하고 모든 호출(처음 시작한 쪽 포함)이 shield로 기다리므로,
+    한 쪽이 취소되어도 다른 쪽은 영향을 받지 않는다. 기다리는 쪽이 모두 취소되면 호출도 취소한다.
+    """
+    signature = inspect.signature(method)
+    
+    @wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        arguments = list(bound.arguments.items())[1:]
+        loop = asyncio.get_running_loop()
+        key = (loop, f"{method.__name__}:{arguments!r}")
+        
+        flight = _inflight.get(key)
+        if flight is None:
+            task = loop.create_task(method(self, *args, **kwargs))
+            flight = _inflight[key] = [task, 0]
+            task.add_done_callback(partial(_finish_flight, key))
+        
+        task = flight[0]
+        flight[1] += 1
+        try:
+            return await asyncio.shield(task)
+        finally:
+            flight[1] -= 1
+            if flight[1] == 0 and not task.done():
+                # 결과를 기다리는 쪽이 없으므로 호출 취소 (새 호출이 취소 중인 Task를 기다리지 않도록 바로 제거)
+                if _inflight.get(key) is flight:
+                    del _inflight[key]
+                task.cancel()
+    
+    return wrapper
+
+@dataclass(slots=True)
 class CategoryResult:
     """Category generation result"""
     name: str
@@ -27,19 +284,7 @@ class CategoryResult:
     trend_score: float
     research_activity: float
 
-@dataclass
-class PaperInfo:
-    """Paper information"""
-    title: str
-    authors: str
-    journal: str
-    year: int
-    doi: str
-    impact_factor: float
-    citations: int
-    paper_type: str
-
-@dataclass
+@dataclass(slots=True)
 class SubcategoryResult:
     """Subcategory with paper information"""
     name: str
@@ -48,53 +293,56 @@ class SubcategoryResult:
     expected_effect: str
     quality_score: float
     quality_grade: str
-
-class GeminiClient:
-    """Client for Google Gemini API with Native Thinking Mode support"""
     
-    def __init__(self):
-        # Configure API
-        api_key = os.getenv("GEMINI_API_KEY")
-        if not api_key:
-            raise ValueError("GEMINI_API_KEY not found in environment variables")
-        
-        # Initialize client with API key
-        self.client = genai.Client(api_key=api_key)
+    @classmethod
+    def from_context(cls, topic: str, papers: List[Any], additional_context: Optional[str] = None) -> "SubcategoryResult":
+        """콘텐츠 생성 요청(주제, 논문 목록, additional_context JSON)으로부터 생성"""
+        context_data = {}
+        if additional_context:
+            try:
+                context_data = orjson.loads(additional_context)
+            except orjson.JSONDecodeError:
+                pass
         
-        # Using Gemini 2.5 Flash for cost optimization
-        self.model_name = "gemini-2.5-flash"  # Using Flash model
-        logger.info(f"Initialized GeminiClient with model: {self.model_name}")
+        paper_objects = []
+        for paper in papers:
+            if isinstance(paper, dict):
+                paper_objects.append(PaperInfo(
+                    title=paper.get('title', 'Unknown Title'),
+                    authors=paper.get('authors', 'Unknown Authors'),
+                    journal=paper.get('journal', 'Unknown Journal'),
+                    year=paper.get('publication_year', paper.get('year', 2024)),
+                    doi=paper.get('doi', ''),
+                    impact_factor=paper.get('impact_factor', 0.0),
+                    citations=paper.get('citations', 0),
+                    paper_type=paper.get('paper_type', 'research')
+                ))
         
-        # Generation config
-        self.generation_config = types.GenerateContentConfig(
-            temperature=0.9,
-            top_p=0.95,
-            top_k=40,
-            max_output_tokens=8192,
+        return cls(
+            name=topic,
+            description=context_data.get('subcategory_description', ''),
+            papers=paper_objects,
+            expected_effect=context_data.get('expected_effect', ''),
+            quality_score=context_data.get('quality_score', 80.0),
+            quality_grade=context_data.get('quality_grade', 'B')
         )
-        
-        # CategoryOptimizer removed - AI직접 판단 방식으로 변경
-        
-        # Initialize paper quality evaluator
-        self.paper_evaluator = PaperQualityEvaluator()
-    
-    def generate_categories(self, keyword: str, count: int = 5) -> List[CategoryResult]:
-        """Generate practical main categories based on keyword"""
-        
-        # 캐싱 비활성화 - 매번 새로 생성
-        # cache_params = {"keyword": keyword, "count": count}
-        # cached_result = cache_manager.get("categories", cache_params)
-        # if cached_result:
-        #     print(f"캐시 히트: 카테고리 '{keyword}'")
-        #     return cached_result
-        
-        base_prompt = f"""
-'{keyword}'과 관련하여 사람들이 관심을 가질만한 **광범위하고 포괄적인 메인카테고리** {count + 3}개를 생성해주세요.
-각 카테고리는 여러 세부 주제를 포함할 수 있는 큰 주제여야 합니다.
-"""
-        
-        # 프롬프트 직접 구성 (CategoryOptimizer 제거)
-        prompt = base_prompt + f"""
+
+# 프롬프트의 정적 지시문 - 호출마다 바뀌는 부분(주제, 논문 정보)과 분리해 컨텍스트 캐시로 재사용
+# 프롬프트나 결과 데이터클래스를 수정하면 PROMPT_TEMPLATE_VERSION을 올려 기존 컨텍스트 캐시와 응답 캐시를 버린다
+PROMPT_TEMPLATE_VERSION = "v4"
+GENERATION_CACHE_TTL = 3600 * 24    # 카테고리/주제 생성 결과 캐시 (초)
+# 시맨틱 캐시용 질의 임베딩 모델 (모델마다 벡터 공간이 달라 시맨틱 캐시 네임스페이스에 포함)
+EMBEDDING_MODEL = os.getenv("GEMINI_EMBEDDING_MODEL", "gemini-embedding-001")
+# 임베딩 차원 - 시맨틱 캐시 전수 비교 비용이 차원에 비례하므로 줄여서 요청 (gemini-embedding-001 기본값 3072)
+EMBEDDING_DIMENSIONS = 768
+PROMPT_CACHE_TTL = 3600             # 초
+PROMPT_CACHE_REFRESH_MARGIN = 300   # 만료 5분 전에 새 캐시로 교체
+PROMPT_CACHE_RETRY_INTERVAL = 600   # 일시적 오류로 캐시 생성에 실패한 뒤 재시도 간격
+# 컨텍스트 캐시 최소 입력 토큰 수 (gemini-2.5-flash)
+# 토큰 수는 대략 글자 수를 넘지 않으므로 지시문 글자 수가 이보다 적으면 캐시 생성을 시도하지 않는다
+PROMPT_CACHE_MIN_TOKENS = 1024
+
+CATEGORIES_INSTRUCTIONS = """
 <thinking>
 메인카테고리는 광범위한 주제를 다루어야 한다.
 너무 구체적이거나 좁은 주제가 아닌, 여러 서브카테고리를 포함할 수 있는 큰 틀이어야 한다.
@@ -121,17 +369,17 @@ class GeminiClient:
 5. 이모지로 카테고리 특성 표현
 
 JSON 형식으로 응답해주세요:
-{{
+{
   "categories": [
-    {{
+    {
       "name": "포괄적인 카테고리명",
       "description": "카테고리가 다루는 범위에 대한 설명",
       "emoji": "관련 이모지",
       "trend_score": 8.5,  // 현재 트렌드 점수 (1-10)
       "research_activity": 7.0  // 연구 활발도 (1-10)
-    }}
+    }
   ]
-}}
+}
 
 예시 (운동 키워드):
 - "💪 효율적인 운동 방법론" - 운동의 원리, 계획, 기법 등을 포괄
@@ -140,247 +388,8 @@ JSON 형식으로 응답해주세요:
 - "🏃 유산소운동 마스터하기" - 달리기, 수영, 사이클 등을 포괄
 - "🧘 몸과 마음의 균형 운동" - 요가, 필라테스, 명상 등을 포괄
 """
-        
-        # 재시도 로직 (응답 시간 단축을 위해 2회로 축소)
-        max_attempts = 2
-        for attempt in range(max_attempts):
-            try:
-                response = self.client.models.generate_content(
-                    model=self.model_name,
-                    contents=prompt,
-                    config=self.generation_config
-                )
-                
-                # Log token usage
-                if hasattr(response, 'usage_metadata'):
-                    usage = response.usage_metadata
-                    logger.info(f"[Gemini API - generate_categories] Token usage: "
-                               f"prompt_tokens={usage.prompt_token_count}, "
-                               f"response_tokens={usage.candidates_token_count}, "
-                               f"total_tokens={usage.total_token_count}")
-                    token_tracker.add_usage(
-                        "generate_categories",
-                        usage.prompt_token_count,
-                        usage.candidates_token_count,
-                        usage.total_token_count
-                    )
-                else:
-                    logger.warning("[Gemini API - generate_categories] No token usage metadata available")
-                
-                # Parse JSON response
-                text = response.text
-                json_match = re.search(r'\{.*\}', text, re.DOTALL)
-                if json_match:
-                    data = json.loads(json_match.group())
-                    raw_categories = []
-                    
-                    for cat in data.get("categories", []):
-                        raw_categories.append({
-                            "name": cat["name"],
-                            "description": cat["description"],
-                            "emoji": cat["emoji"],
-                            "trend_score": float(cat.get("trend_score", 7.0)),
-                            "research_activity": float(cat.get("research_activity", 7.0))
-                        })
-                    
-                    # AI가 생성한 카테고리를 그대로 사용 (필터링 없음)
-                    result_categories = []
-                    for cat in raw_categories[:count]:  # 요청한 개수만큼만 사용
-                        result_categories.append(CategoryResult(
-                            name=cat["name"],
-                            description=cat["description"],
-                            emoji=cat["emoji"],
-                            trend_score=cat["trend_score"],
-                            research_activity=cat["research_activity"]
-                        ))
-                    
-                    if len(result_categories) >= count:
-                        return result_categories[:count]
-                    
-            except Exception as e:
-                print(f"카테고리 생성 오류 (시도 {attempt + 1}): {e}")
-                if attempt == max_attempts - 1:
-                    print(f"응답 텍스트: {text if 'text' in locals() else 'N/A'}")
-                    # 모든 시도 실패시 에러 발생
-                    raise Exception(f"카테고리 생성에 실패했습니다. 다시 시도해주세요. (오류: {str(e)})")
-    
-    def evaluate_practicality(self, category: str) -> float:
-        """Evaluate practicality score of a category - AI 직접 평가로 변경"""
-        
-        # AI가 이미 평가한 점수를 그대로 사용
-        return 8.0  # 기본값 반환 (AI가 이미 trend_score, research_activity로 평가함)
-    
-    def discover_papers_for_topic(self, category: str, subcategory_topic: str) -> Optional[SubcategoryResult]:
-        """Discover papers and generate subcategory information"""
-        
-        prompt = f"""
-<thinking>
-카테고리: {category}
-주제: {subcategory_topic}
-
-이 주제에 대한 실제 학술 논문을 찾고, 논문 기반으로 서브카테고리를 생성해야 한다.
-논문이 존재하지 않는 주제라면 null을 반환해야 한다.
-국제 학술지의 영어 논문을 우선적으로 찾아야 한다.
-하지만 서브카테고리 제목과 설명은 한국어로 일반인이 이해하기 쉽게 작성해야 한다.
-</thinking>
-
-"{category}" 카테고리의 "{subcategory_topic}" 주제에 대해:
-
-1. 관련된 실제 학술 논문을 1-3개 찾아주세요 (영어 논문)
-2. 논문 정보를 기반으로 매력적인 서브카테고리를 생성해주세요
-   - 서브카테고리 제목은 반드시 한국어로 작성하세요
-   - 일반 운동 애호가가 흥미를 느낄 수 있는 쉽고 친근한 제목을 만드세요
-   - 학술적이거나 전문적인 용어는 피하고, 실용적이고 흥미로운 표현을 사용하세요
-3. 기대 효과를 구체적으로 설명해주세요 (한국어로)
-
-**중요 요구사항**:
-- 실제로 존재하는 논문만 제시해야 합니다
-- 국제 학술 데이터베이스(PubMed, Scopus, Web of Science 등)에 등재된 영어 논문을 우선적으로 찾아주세요
-- High-impact factor를 가진 저명한 국제 저널의 논문을 선호합니다
-- 논문 제목과 저널명은 영어로 제공해주세요
-- 한국어 저널이나 한국어로 작성된 논문은 절대 포함하지 마세요
-- 반드시 영어로 작성된 국제 논문만 포함하세요
-- DOI는 국제 표준인 10.으로 시작해야 합니다
-- Impact Factor가 명시된 국제 저널의 논문을 우선시하세요
-- 논문을 찾을 수 없다면 null을 반환하세요
-
-JSON 형식으로 응답해주세요:
-{{
-  "subcategory": {{
-    "name": "일반인이 이해하기 쉬운 한국어 서브카테고리 제목 (예: '스마트워치로 확인하는 내 몸 상태')",
-    "description": "논문 기반 설명 (한국어로 쉽게 풀어서)",
-    "papers": [
-      {{
-        "title": "Effects of High-Intensity Interval Training on Cardiovascular Function: A Systematic Review and Meta-Analysis",
-        "authors": "Johnson AB, Smith CD, Williams EF et al.",
-        "journal": "Journal of Applied Physiology",
-        "year": 2023,
-        "doi": "10.1152/japplphysiol.00384.2023",
-        "impact_factor": 5.2,
-        "citations": 150,
-        "paper_type": "Systematic Review"
-      }}
-    ],
-    "expected_effect": "구체적인 기대 효과 (한국어로 일반인이 이해하기 쉽게)",
-    "quality_score": 75.5,
-    "quality_grade": "A"
-  }}
-}} 
-
-또는 논문이 없으면: null
-"""
-        
-        response = self.client.models.generate_content(
-            model=self.model_name,
-            contents=prompt,
-            config=self.generation_config
-        )
-        
-        # Log token usage
-        if hasattr(response, 'usage_metadata'):
-            usage = response.usage_metadata
-            logger.info(f"[Gemini API - discover_papers_for_topic] Token usage: "
-                       f"prompt_tokens={usage.prompt_token_count}, "
-                       f"response_tokens={usage.candidates_token_count}, "
-                       f"total_tokens={usage.total_token_count}")
-            token_tracker.add_usage(
-                "discover_papers_for_topic",
-                usage.prompt_token_count,
-                usage.candidates_token_count,
-                usage.total_token_count
-            )
-        else:
-            logger.warning("[Gemini API - discover_papers_for_topic] No token usage metadata available")
-        
-        try:
-            text = response.text.strip()
-            
-            # Check for null or no paper indicators
-            if "null" in text.lower() or "논문이 없" in text or "찾을 수 없" in text:
-                return None
-            
-            # Parse JSON
-            json_match = re.search(r'\{.*\}', text, re.DOTALL)
-            if json_match:
-                data = json.loads(json_match.group())
-                sub = data.get("subcategory")
-                if sub and sub.get("papers"):
-                    papers = []
-                    for p in sub["papers"]:
-                        papers.append(PaperInfo(
-                            title=p["title"],
-                            authors=p["authors"],
-                            journal=p["journal"],
-                            year=p["year"],
-                            doi=p["doi"],
-                            impact_factor=p.get("impact_factor", 3.0),
-                            citations=p.get("citations", 50),
-                            paper_type=p.get("paper_type", "Research Article")
-                        ))
-                    
-                    # 논문 품질 평가
-                    paper_quality_infos = []
-                    for p in papers:
-                        paper_quality_infos.append(PaperQualityInfo(
-                            title=p.title,
-                            authors=p.authors,
-                            journal=p.journal,
-                            year=p.year,
-                            doi=p.doi,
-                            impact_factor=p.impact_factor,
-                            citations=p.citations,
-                            paper_type=p.paper_type
-                        ))
-                    
-                    # 논문 세트 평가
-                    evaluation_result = self.paper_evaluator.evaluate_paper_set(paper_quality_infos)
-                    
-                    return SubcategoryResult(
-                        name=sub["name"],
-                        description=sub["description"],
-                        papers=papers,
-                        expected_effect=sub["expected_effect"],
-                        quality_score=evaluation_result["average_score"],
-                        quality_grade=evaluation_result["average_grade"]
-                    )
-        except Exception as e:
-            print(f"Error parsing subcategory: {e}")
-            print(f"Response: {text}")
-        
-        return None
-    
-    def generate_content(self, subcategory: SubcategoryResult, content_type: str) -> Dict[str, Any]:
-        """Generate content based on paper-backed subcategory"""
-        
-        # Prepare paper information
-        paper_info = "\n".join([
-            f"- {p.title} ({p.authors}, {p.journal}, {p.year})"
-            for p in subcategory.papers
-        ])
-        
-        if content_type == "shorts":
-            # Shorts 생성은 현재 지원하지 않음
-            raise NotImplementedError("Shorts 콘텐츠 생성은 현재 지원하지 않습니다.")
-        
-        elif content_type == "article":
-            prompt = f"""
-<thinking>
-서브카테고리: {subcategory.name}
-논문 정보: {paper_info}
-기대 효과: {subcategory.expected_effect}
-
-2000-3000자 분량의 상세 아티클을 작성해야 한다.
-논문의 내용을 깊이 있게 다루면서도 일반인이 이해하기 쉽게 설명해야 한다.
-네이버 블로그에 복사 가능한 HTML 형식으로 작성해야 한다.
-참조된 논문들은 모두 국제 저널에 발표된 영어 논문들이다.
-</thinking>
-
-다음 국제 학술지 논문들을 기반으로 네이버 블로그 스타일의 상세 아티클을 HTML 형식으로 작성해주세요:
-
-제목: {subcategory.name}
-참조 논문 (모두 영어로 작성된 국제 저널 논문):
-{paper_info}
 
+ARTICLE_INSTRUCTIONS = """
 아티클 구성 (더 친근하고 실용적으로):
 1. 🎯 이게 뭔가요? - 오늘의 주제를 쉽게 소개
 2. 🤔 왜 이게 중요한가요? - 일상 생활과의 연관성
@@ -449,26 +458,8 @@ JSON 형식으로 응답해주세요:
 - 논문 인용은 자연스럽게 녹여서 표현
   예: "최근 스포츠 의학 저널에 발표된 연구에서 놀라운 사실이 밝혀졌어요"
 """
-        
-        else:  # report
-            prompt = f"""
-<thinking>
-서브카테고리: {subcategory.name}
-논문 정보: {paper_info}
-기대 효과: {subcategory.expected_effect}
-
-종합 리포트를 작성해야 한다.
-여러 논문의 내용을 종합하여 깊이 있는 분석을 제공해야 한다.
-네이버 블로그에 복사 가능한 HTML 형식으로 작성해야 한다.
-참조된 논문들은 모두 국제 저널에 발표된 영어 논문들이다.
-</thinking>
-
-다음 국제 학술지 논문들을 기반으로 네이버 블로그 스타일의 종합 리포트를 HTML 형식으로 작성해주세요:
-
-제목: {subcategory.name}
-참조 논문 (모두 영어로 작성된 국제 저널 논문):
-{paper_info}
 
+REPORT_INSTRUCTIONS = """
 리포트 구성 (더 친근하고 실용적으로):
 1. 📋 한눈에 보는 핵심 요약 - 바쁜 분들을 위한 3줄 요약
 2. 🤷 왜 이 주제가 중요할까? - 우리 일상과의 연결고리
@@ -521,56 +512,53 @@ JSON 형식으로 응답해주세요:
 - 각 섹션 마지막에 "한 줄 정리" 추가
 - 전체적으로 정보 전달보다는 독자의 실천을 돕는 것에 초점
 """
-        
-        try:
-            response = self.client.models.generate_content(
-                model=self.model_name,
-                contents=prompt,
-                config=self.generation_config
-            )
-            
-            # Log token usage
-            if hasattr(response, 'usage_metadata'):
-                usage = response.usage_metadata
-                logger.info(f"[Gemini API - generate_content ({content_type})] Token usage: "
-                           f"prompt_tokens={usage.prompt_token_count}, "
-                           f"response_tokens={usage.candidates_token_count}, "
-                           f"total_tokens={usage.total_token_count}")
-                token_tracker.add_usage(
-                    f"generate_content_{content_type}",
-                    usage.prompt_token_count,
-                    usage.candidates_token_count,
-                    usage.total_token_count
-                )
-            else:
-                logger.warning(f"[Gemini API - generate_content ({content_type})] No token usage metadata available")
-            
-            return {
-                "content_type": content_type,
-                "content": response.text,
-                "subcategory": subcategory.name,
-                "papers_used": len(subcategory.papers),
-                "quality_score": subcategory.quality_score
-            }
-        except Exception as e:
-            logger.error(f"[Gemini API - generate_content ({content_type})] Error: {str(e)}")
-            logger.error(f"[Gemini API - generate_content ({content_type})] Model: {self.model_name}")
-            logger.error(f"[Gemini API - generate_content ({content_type})] Prompt length: {len(prompt)} chars")
-            raise
-    
-    async def generate_subcategory_topics(self, category_name: str, count: int = 5) -> List[str]:
-        """카테고리에 대한 서브카테고리 주제 생성"""
-        
-        prompt = f"""
-<thinking>
-카테고리: {category_name}
-이 카테고리에 대해 사람들이 가장 관심을 가질 만한 구체적인 주제를 생성해야 한다.
-각 주제는 실제 학술 논문이 존재할 가능성이 높은 것들이어야 한다.
-국제 학술지에 많이 연구되는 주제들을 우선적으로 선택해야 한다.
-</thinking>
 
-"{category_name}" 카테고리에 대해 사람들이 가장 궁금해하는 구체적인 세부 주제 {count + 2}개를 생성해주세요.
+DISCOVER_INSTRUCTIONS = """
+1. 관련된 실제 학술 논문을 1-3개 찾아주세요 (영어 논문)
+2. 논문 정보를 기반으로 매력적인 서브카테고리를 생성해주세요
+   - 서브카테고리 제목은 반드시 한국어로 작성하세요
+   - 일반 운동 애호가가 흥미를 느낄 수 있는 쉽고 친근한 제목을 만드세요
+   - 학술적이거나 전문적인 용어는 피하고, 실용적이고 흥미로운 표현을 사용하세요
+3. 기대 효과를 구체적으로 설명해주세요 (한국어로)
 
+**중요 요구사항**:
+- 실제로 존재하는 논문만 제시해야 합니다
+- 국제 학술 데이터베이스(PubMed, Scopus, Web of Science 등)에 등재된 영어 논문을 우선적으로 찾아주세요
+- High-impact factor를 가진 저명한 국제 저널의 논문을 선호합니다
+- 논문 제목과 저널명은 영어로 제공해주세요
+- 한국어 저널이나 한국어로 작성된 논문은 절대 포함하지 마세요
+- 반드시 영어로 작성된 국제 논문만 포함하세요
+- DOI는 국제 표준인 10.으로 시작해야 합니다
+- Impact Factor가 명시된 국제 저널의 논문을 우선시하세요
+- 논문을 찾을 수 없다면 null을 반환하세요
+
+JSON 형식으로 응답해주세요:
+{
+  "subcategory": {
+    "name": "일반인이 이해하기 쉬운 한국어 서브카테고리 제목 (예: '스마트워치로 확인하는 내 몸 상태')",
+    "description": "논문 기반 설명 (한국어로 쉽게 풀어서)",
+    "papers": [
+      {
+        "title": "Effects of High-Intensity Interval Training on Cardiovascular Function: A Systematic Review and Meta-Analysis",
+        "authors": "Johnson AB, Smith CD, Williams EF et al.",
+        "journal": "Journal of Applied Physiology",
+        "year": 2023,
+        "doi": "10.1152/japplphysiol.00384.2023",
+        "impact_factor": 5.2,
+        "citations": 150,
+        "paper_type": "Systematic Review"
+      }
+    ],
+    "expected_effect": "구체적인 기대 효과 (한국어로 일반인이 이해하기 쉽게)",
+    "quality_score": 75.5,
+    "quality_grade": "A"
+  }
+} 
+
+또는 논문이 없으면: null
+"""
+
+TOPICS_INSTRUCTIONS = """
 요구사항:
 1. 각 주제는 구체적이고 실용적이어야 함
 2. 국제 학술지에 연구가 활발한 주제 우선
@@ -581,13 +569,13 @@ JSON 형식으로 응답해주세요:
 7. 너무 학술적이거나 어려운 용어는 피하고 친근하게 표현
 
 JSON 형식으로 응답:
-{{
+{
   "topics": [
     "구체적인 주제 1",
     "구체적인 주제 2",
     ...
   ]
-}}
+}
 
 좋은 예시 (일반인 친화적):
 - "고강도 운동 vs 가벼운 유산소, 뱃살 빼는데 뭐가 더 좋을까?"
@@ -598,36 +586,566 @@ JSON 형식으로 응답:
 - "Biometric Data Analysis for Health Optimization"
 - "Genomic-Metabolomic Biomarker Prediction Models"
 """
+
+PROMPT_INSTRUCTIONS = {
+    "categories": CATEGORIES_INSTRUCTIONS,
+    "article": ARTICLE_INSTRUCTIONS,
+    "report": REPORT_INSTRUCTIONS,
+    "discover": DISCOVER_INSTRUCTIONS,
+    "topics": TOPICS_INSTRUCTIONS,
+}
+
+# 템플릿별 최대 출력 토큰 - 짧은 JSON 응답이 드물게 길어질 때의 지연과 비용 상한
+# gemini-2.5-flash는 thinking 토큰도 이 한도에 포함되므로 응답 크기보다 넉넉하게 잡는다
+TEMPLATE_MAX_OUTPUT_TOKENS = {
+    "categories": 4096,   # 응답 JSON 약 1k 토큰
+    "topics": 2048,       # 응답 JSON 약 300 토큰
+    "discover": 4096,     # 논문 3개 JSON 약 1.5k 토큰
+    "article": 8192,
+    "report": 8192,
+}
+
+# 캐시 키 -> (cached content 이름, 만료 시각). 이름이 None이면 생성 중이거나 생성에 실패한 상태
+# (요청 자체가 거부되어 다시 시도해도 실패할 경우 만료 시각은 math.inf)
+_prompt_caches: Dict[str, Tuple[Optional[str], float]] = {}
+_prompt_cache_lock = threading.Lock()
+
+class GeminiClient:
+    """Client for Google Gemini API with Native Thinking Mode support"""
+    
+    def __init__(self):
+        # Configure API
+        api_key = os.getenv("GEMINI_API_KEY")
+        if not api_key:
+            raise ValueError("GEMINI_API_KEY not found in environment variables")
+        
+        # Initialize client with API key
+        self.client = genai.Client(api_key=api_key)
+        
+        # Using Gemini 2.5 Flash for cost optimization
+        self.model_name = "gemini-2.5-flash"  # Using Flash model
+        logger.info("Initialized GeminiClient with model: %s", self.model_name)
+        
+        # Generation config
+        self.generation_config = types.GenerateContentConfig(
+            temperature=0.9,
+            top_p=0.95,
+            top_k=40,
+            max_output_tokens=8192,
+        )
+        
+        # CategoryOptimizer removed - AI직접 판단 방식으로 변경
+        
+        # Initialize paper quality evaluator
+        self.paper_evaluator = paper_quality_evaluator
+        
+        # 호출 한도 관리
+        self.limiter = gemini_rate_limiter
+        
+        # 템플릿별 생성 설정 (출력 토큰 한도만 다름)
+        self._template_configs = {
+            template: self.generation_config.model_copy(update={"max_output_tokens": max_tokens})
+            for template, max_tokens in TEMPLATE_MAX_OUTPUT_TOKENS.items()
+        }
+        
+        # 컨텍스트 캐시를 쓸 수 없을 때 정적 지시문을 system instruction으로 직접 보내는 설정
+        self._instruction_configs = {
+            template: self._template_configs[template].model_copy(update={"system_instruction": instructions})
+            for template, instructions in PROMPT_INSTRUCTIONS.items()
+        }
+    
+    async def _cached_content_name(self, template: str) -> Optional[str]:
+        """템플릿 정적 지시문의 컨텍스트 캐시 이름 (없으면 생성, 만료가 가까우면 새로 생성)"""
+        if len(PROMPT_INSTRUCTIONS[template]) < PROMPT_CACHE_MIN_TOKENS:
+            return None
+        
+        key = f"{PROMPT_TEMPLATE_VERSION}-{template}-{self.model_name}"
+        now = time.time()
+        with _prompt_cache_lock:
+            entry = _prompt_caches.get(key)
+            if entry and now < entry[1]:
+                return entry[0]
+            # 생성하는 동안 다른 호출은 캐시 없이 진행
+            _prompt_caches[key] = (None, now + PROMPT_CACHE_RETRY_INTERVAL)
         
         try:
-            response = self.client.models.generate_content(
+            cache = await self.client.aio.caches.create(
                 model=self.model_name,
-                contents=prompt,
-                config=self.generation_config
+                config=types.CreateCachedContentConfig(
+                    display_name=key,
+                    system_instruction=PROMPT_INSTRUCTIONS[template],
+                    ttl=f"{PROMPT_CACHE_TTL}s"
+                )
+            )
+        except Exception as e:
+            if isinstance(e, errors.ClientError) and e.code != 429:
+                # 최소 토큰 수 미달 등 요청이 거부된 경우 - 재시도해도 같으므로 이 프로세스에서는 더 시도하지 않음
+                with _prompt_cache_lock:
+                    _prompt_caches[key] = (None, math.inf)
+            logger.warning(f"[Gemini API] 컨텍스트 캐시 생성 실패 ({key}): {e}")
+            return None
+        
+        with _prompt_cache_lock:
+            _prompt_caches[key] = (cache.name, now + PROMPT_CACHE_TTL - PROMPT_CACHE_REFRESH_MARGIN)
+        logger.info(f"[Gemini API] 컨텍스트 캐시 생성: {key} -> {cache.name}")
+        return cache.name
+    
+    async def _generation_config(self, template: Optional[str], service_tier: Optional[str] = None) -> types.GenerateContentConfig:
+        """템플릿의 정적 지시문을 컨텍스트 캐시(가능하면) 또는 system instruction으로 붙인 생성 설정"""
+        if template is None:
+            config = self.generation_config
+        else:
+            cache_name = await self._cached_content_name(template)
+            if cache_name:
+                config = self._template_configs[template].model_copy(update={"cached_content": cache_name})
+            else:
+                config = self._instruction_configs[template]
+        
+        if service_tier:
+            config = config.model_copy(update={"service_tier": service_tier})
+        return config
+    
+    async def _generate(self, prompt: str, template: Optional[str] = None, service_tier: Optional[str] = None):
+        """비동기 Gemini 호출 - 호출 한도를 지키고 일시적 오류(429, 5xx)는 지수 백오프로 재시도
+        
+        template을 주면 prompt에는 호출마다 바뀌는 부분만 담고 정적 지시문은 PROMPT_INSTRUCTIONS에서 붙인다.
+        service_tier를 주지 않으면 기본(standard) 등급으로 호출한다.
+        """
+        # 재시도마다 바뀌지 않는 설정과 예상 토큰 수는 루프 밖에서 한 번만 계산
+        config = await self._generation_config(template, service_tier)
+        est_tokens = _estimate_tokens(prompt, template)
+        for attempt in range(RATE_LIMIT_MAX_RETRIES + 1):
+            async with self.limiter.acquire(est_tokens=est_tokens):
+                try:
+                    response = await self.client.aio.models.generate_content(
+                        model=self.model_name,
+                        contents=prompt,
+                        config=config
+                    )
+                except errors.APIError as e:
+                    delay = self._retry_delay(e, attempt)
+                    if delay is None:
+                        raise
+                    error_code = e.code
+                else:
+                    self.limiter.on_success()
+                    return response
+            
+            logger.warning(f"[Gemini API] 일시적 오류({error_code}) - {delay:.0f}초 후 재시도 ({attempt + 1}/{RATE_LIMIT_MAX_RETRIES})")
+            await asyncio.sleep(delay)
+    
+    def _retry_delay(self, error: errors.APIError, attempt: int) -> Optional[float]:
+        """재시도할 오류면 대기 시간(초), 아니면 None - 429면 동시 요청 수도 줄인다"""
+        if error.code not in RETRYABLE_STATUS_CODES:
+            return None
+        if error.code == 429:
+            self.limiter.on_rate_limited()
+        if attempt == RATE_LIMIT_MAX_RETRIES:
+            return None
+        return RATE_LIMIT_BACKOFF_BASE * (2 ** attempt)
+    
+    @_single_flight
+    async def generate_categories(self, keyword: str, count: int = 5, bypass_cache: bool = False) -> List[CategoryResult]:
+        """Generate practical main categories based on keyword"""
+        
+        # bypass_cache=True면 캐시를 무시하고 새로 생성 (결과는 다시 캐시에 저장)
+        cache_params = {"version": PROMPT_TEMPLATE_VERSION, "keyword": keyword, "count": count}
+        if not bypass_cache:
+            cached_result = cache_manager.get("categories", cache_params)
+            if cached_result:
+                logger.info("캐시 히트: 카테고리 '%s'", keyword)
+                return cached_result
+        
+        # 정적 지시문(생성 규칙, 응답 형식)은 CATEGORIES_INSTRUCTIONS
+        prompt = f"""
+'{keyword}'과 관련하여 사람들이 관심을 가질만한 **광범위하고 포괄적인 메인카테고리** {count + 3}개를 생성해주세요.
+각 카테고리는 여러 세부 주제를 포함할 수 있는 큰 주제여야 합니다.
+"""
+        
+        # 일시적 오류 재시도는 _generate에서 처리
+        try:
+            response = await self._generate(prompt, template="categories")
+            
+            _record_usage("generate_categories", "generate_categories", response.usage_metadata)
+            
+            # Parse JSON response
+            text = response.text
+            data = _extract_json(text)
+            if data is not None:
+                raw_categories = []
+                
+                for cat in data.get("categories", []):
+                    raw_categories.append({
+                        "name": cat["name"],
+                        "description": cat["description"],
+                        "emoji": cat["emoji"],
+                        "trend_score": float(cat.get("trend_score", 7.0)),
+                        "research_activity": float(cat.get("research_activity", 7.0))
+                    })
+                
+                # AI가 생성한 카테고리를 그대로 사용 (필터링 없음)
+                result_categories = []
+                for cat in raw_categories[:count]:  # 요청한 개수만큼만 사용
+                    result_categories.append(CategoryResult(
+                        name=cat["name"],
+                        description=cat["description"],
+                        emoji=cat["emoji"],
+                        trend_score=cat["trend_score"],
+                        research_activity=cat["research_activity"]
+                    ))
+                
+                if len(result_categories) >= count:
+                    result_categories = result_categories[:count]
+                    cache_manager.set("categories", cache_params, result_categories, ttl=GENERATION_CACHE_TTL)
+                    return result_categories
+            
+            raise ValueError(f"응답에서 카테고리를 {count}개 찾지 못했습니다")
+                
+        except Exception as e:
+            print(f"카테고리 생성 오류: {e}")
+            print(f"응답 텍스트: {text if 'text' in locals() else 'N/A'}")
+            raise Exception(f"카테고리 생성에 실패했습니다. 다시 시도해주세요. (오류: {str(e)})")
+    
+    def evaluate_practicality(self, category: str) -> float:
+        """Evaluate practicality score of a category - AI 직접 평가로 변경"""
+        
+        # AI가 이미 평가한 점수를 그대로 사용
+        return 8.0  # 기본값 반환 (AI가 이미 trend_score, research_activity로 평가함)
+    
+    async def _embed(self, text: str) -> Optional[List[float]]:
+        """시맨틱 캐시 조회용 임베딩 (실패하면 None - 캐시 없이 진행)
+        
+        생성 호출과 같은 호출 한도를 거친다. 캐시 조회용이므로 429도 재시도하지 않는다.
+        """
+        try:
+            async with self.limiter.acquire(est_tokens=len(text) // 4):
+                try:
+                    response = await self.client.aio.models.embed_content(
+                        model=EMBEDDING_MODEL,
+                        contents=text,
+                        config=types.EmbedContentConfig(output_dimensionality=EMBEDDING_DIMENSIONS)
+                    )
+                except errors.APIError as e:
+                    if e.code == 429:
+                        self.limiter.on_rate_limited()
+                    raise
+                self.limiter.on_success()
+            return response.embeddings[0].values
+        except Exception as e:
+            logger.warning(f"[Gemini API - embed_content] 임베딩 실패: {e}")
+            return None
+    
+    @_single_flight
+    async def discover_papers_for_topic(self, category: str, subcategory_topic: str) -> Optional[SubcategoryResult]:
+        """Discover papers and generate subcategory information
+        
+        표현만 다른 비슷한 주제로 이미 찾은 결과가 있으면 시맨틱 캐시에서 반환한다.
+        """
+        namespace = f"{PROMPT_TEMPLATE_VERSION}:{EMBEDDING_MODEL}:discover"
+        embedding = await self._embed(f"{category} / {subcategory_topic}")
+        if embedding:
+            # 시맨틱 캐시는 전수 비교와 SQLite 쓰기를 하므로 이벤트 루프를 막지 않도록 스레드에서 실행
+            cached_result = await asyncio.to_thread(semantic_cache.get, namespace, embedding)
+            if cached_result is not None:
+                logger.info("시맨틱 캐시 히트: 논문 검색 '%s / %s'", category, subcategory_topic)
+                return cached_result
+        
+        result = await self._discover_papers_for_topic(category, subcategory_topic)
+        if result and embedding:
+            await asyncio.to_thread(semantic_cache.set, namespace, embedding, result)
+        return result
+    
+    async def _discover_papers_for_topic(self, category: str, subcategory_topic: str) -> Optional[SubcategoryResult]:
+        """논문 검색 및 서브카테고리 생성 (Gemini 호출)"""
+        
+        prompt = f"""
+<thinking>
+카테고리: {category}
+주제: {subcategory_topic}
+
+이 주제에 대한 실제 학술 논문을 찾고, 논문 기반으로 서브카테고리를 생성해야 한다.
+논문이 존재하지 않는 주제라면 null을 반환해야 한다.
+국제 학술지의 영어 논문을 우선적으로 찾아야 한다.
+하지만 서브카테고리 제목과 설명은 한국어로 일반인이 이해하기 쉽게 작성해야 한다.
+</thinking>
+
+"{category}" 카테고리의 "{subcategory_topic}" 주제에 대해 실제 학술 논문을 찾고, 이를 기반으로 서브카테고리를 생성해주세요.
+"""
+        
+        response = await self._generate(prompt, template="discover")
+        
+        _record_usage("discover_papers_for_topic", "discover_papers_for_topic", response.usage_metadata)
+        
+        try:
+            text = response.text.strip()
+            
+            # Check for null or no paper indicators
+            if "null" in text.lower() or "논문이 없" in text or "찾을 수 없" in text:
+                return None
+            
+            # Parse JSON
+            data = _extract_json(text)
+            if data is not None:
+                sub = data.get("subcategory")
+                if sub and sub.get("papers"):
+                    papers = []
+                    for p in sub["papers"]:
+                        papers.append(PaperInfo(
+                            title=p["title"],
+                            authors=p["authors"],
+                            journal=p["journal"],
+                            year=p["year"],
+                            doi=p["doi"],
+                            impact_factor=p.get("impact_factor", 3.0),
+                            citations=p.get("citations", 50),
+                            paper_type=p.get("paper_type", "Research Article")
+                        ))
+                    
+                    # 논문 세트 품질 평가 (평균 점수와 등급만 사용)
+                    quality_score, quality_grade = self.paper_evaluator.score_paper_set(papers)
+                    
+                    return SubcategoryResult(
+                        name=sub["name"],
+                        description=sub["description"],
+                        papers=papers,
+                        expected_effect=sub["expected_effect"],
+                        quality_score=quality_score,
+                        quality_grade=quality_grade
+                    )
+        except Exception as e:
+            print(f"Error parsing subcategory: {e}")
+            print(f"Response: {text}")
+        
+        return None
+    
+    async def discover_papers_for_topics_batch(self, category: str, topics: List[str]) -> List[Optional[SubcategoryResult]]:
+        """여러 주제의 논문 검색을 동시에 실행 (결과는 topics 순서, 실패한 주제는 None)"""
+        results = await asyncio.gather(
+            *(self.discover_papers_for_topic(category, topic) for topic in topics),
+            return_exceptions=True
+        )
+        
+        subcategories = []
+        for topic, result in zip(topics, results):
+            if isinstance(result, Exception):
+                logger.error(f"[Gemini API - discover_papers_for_topic] '{topic}' 실패: {result}")
+                result = None
+            subcategories.append(result)
+        return subcategories
+    
+    def _build_content_prompt(self, subcategory: SubcategoryResult, content_type: str) -> str:
+        """콘텐츠 타입별 생성 프롬프트 구성 (정적 지시문은 PROMPT_INSTRUCTIONS[content_type])"""
+        
+        # Prepare paper information
+        paper_info = "\n".join([
+            f"- {p.title} ({p.authors}, {p.journal}, {p.year})"
+            for p in subcategory.papers
+        ])
+        
+        if content_type == "shorts":
+            # Shorts 생성은 현재 지원하지 않음
+            raise NotImplementedError("Shorts 콘텐츠 생성은 현재 지원하지 않습니다.")
+        
+        elif content_type == "article":
+            prompt = f"""
+<thinking>
+서브카테고리: {subcategory.name}
+논문 정보: {paper_info}
+기대 효과: {subcategory.expected_effect}
+
+2000-3000자 분량의 상세 아티클을 작성해야 한다.
+논문의 내용을 깊이 있게 다루면서도 일반인이 이해하기 쉽게 설명해야 한다.
+네이버 블로그에 복사 가능한 HTML 형식으로 작성해야 한다.
+참조된 논문들은 모두 국제 저널에 발표된 영어 논문들이다.
+</thinking>
+
+다음 국제 학술지 논문들을 기반으로 네이버 블로그 스타일의 상세 아티클을 HTML 형식으로 작성해주세요:
+
+제목: {subcategory.name}
+참조 논문 (모두 영어로 작성된 국제 저널 논문):
+{paper_info}
+"""
+        
+        else:  # report
+            prompt = f"""
+<thinking>
+서브카테고리: {subcategory.name}
+논문 정보: {paper_info}
+기대 효과: {subcategory.expected_effect}
+
+종합 리포트를 작성해야 한다.
+여러 논문의 내용을 종합하여 깊이 있는 분석을 제공해야 한다.
+네이버 블로그에 복사 가능한 HTML 형식으로 작성해야 한다.
+참조된 논문들은 모두 국제 저널에 발표된 영어 논문들이다.
+</thinking>
+
+다음 국제 학술지 논문들을 기반으로 네이버 블로그 스타일의 종합 리포트를 HTML 형식으로 작성해주세요:
+
+제목: {subcategory.name}
+참조 논문 (모두 영어로 작성된 국제 저널 논문):
+{paper_info}
+"""
+        
+        return prompt
+    
+    def _content_result(self, subcategory: SubcategoryResult, content_type: str, text: str) -> Dict[str, Any]:
+        """생성된 본문을 API 결과 형식으로 변환"""
+        return {
+            "content_type": content_type,
+            "content": text,
+            "subcategory": subcategory.name,
+            "papers_used": len(subcategory.papers),
+            "quality_score": subcategory.quality_score
+        }
+    
+    async def generate_content(self, subcategory: SubcategoryResult, content_type: str,
+                               service_tier: Optional[str] = None) -> Dict[str, Any]:
+        """Generate content based on paper-backed subcategory"""
+        prompt = self._build_content_prompt(subcategory, content_type)
+        
+        try:
+            response = await self._generate(prompt, template=content_type, service_tier=service_tier)
+            
+            _record_usage(f"generate_content ({content_type})", f"generate_content_{content_type}", response.usage_metadata)
+            
+            return self._content_result(subcategory, content_type, response.text)
+        except Exception as e:
+            logger.error(f"[Gemini API - generate_content ({content_type})] Error: {str(e)}")
+            logger.error(f"[Gemini API - generate_content ({content_type})] Model: {self.model_name}")
+            logger.error(f"[Gemini API - generate_content ({content_type})] Prompt length: {len(prompt)} chars")
+            raise
+    
+    async def generate_content_stream(self, subcategory: SubcategoryResult, content_type: str,
+                                      service_tier: Optional[str] = None) -> AsyncIterator[str]:
+        """generate_content의 스트리밍 버전 - 생성되는 대로 본문 조각을 반환
+        
+        첫 조각을 받기 전의 일시적 오류만 재시도한다 (이미 보낸 조각은 되돌릴 수 없음).
+        토큰 사용량은 스트림이 끝난 뒤 마지막 조각의 usage_metadata로 기록한다.
+        """
+        prompt = self._build_content_prompt(subcategory, content_type)
+        config = await self._generation_config(content_type, service_tier)
+        est_tokens = _estimate_tokens(prompt, content_type)
+        usage = None
+        
+        for attempt in range(RATE_LIMIT_MAX_RETRIES + 1):
+            started = False
+            async with self.limiter.acquire(est_tokens=est_tokens):
+                try:
+                    stream = await self.client.aio.models.generate_content_stream(
+                        model=self.model_name,
+                        contents=prompt,
+                        config=config
+                    )
+                    async for chunk in stream:
+                        if chunk.usage_metadata:
+                            usage = chunk.usage_metadata
+                        if chunk.text:
+                            started = True
+                            yield chunk.text
+                except errors.APIError as e:
+                    delay = self._retry_delay(e, attempt)
+                    if delay is None or started:
+                        raise
+                    error_code = e.code
+                else:
+                    self.limiter.on_success()
+                    break
+            
+            logger.warning(f"[Gemini API] 일시적 오류({error_code}) - {delay:.0f}초 후 재시도 ({attempt + 1}/{RATE_LIMIT_MAX_RETRIES})")
+            await asyncio.sleep(delay)
+        
+        _record_usage(f"generate_content_stream ({content_type})", f"generate_content_{content_type}", usage)
+    
+    async def generate_content_batch(self, jobs: List[Tuple[SubcategoryResult, str]]) -> List[Optional[Dict[str, Any]]]:
+        """Gemini Batch API로 여러 콘텐츠를 한 번에 생성 (비대화형 대량 작업용)
+        
+        배치 작업은 실시간 호출 한도를 쓰지 않고 비용이 절반이지만 완료까지 최대 24시간이 걸릴 수 있다.
+        결과는 jobs 순서이며 실패한 항목은 None.
+        """
+        if not jobs:
+            return []
+        
+        requests = [
+            types.InlinedRequest(
+                contents=self._build_content_prompt(subcategory, content_type),
+                config=self._instruction_configs[content_type]
             )
+            for subcategory, content_type in jobs
+        ]
+        batch_job = await self.client.aio.batches.create(model=self.model_name, src=requests)
+        logger.info(f"[Gemini Batch API] 배치 작업 생성: {batch_job.name} ({len(requests)}개 요청)")
+        
+        while batch_job.state not in BATCH_TERMINAL_STATES:
+            await asyncio.sleep(BATCH_POLL_INTERVAL)
+            batch_job = await self.client.aio.batches.get(name=batch_job.name)
+        
+        if batch_job.state != types.JobState.JOB_STATE_SUCCEEDED:
+            raise Exception(f"배치 작업 실패: {batch_job.name} ({batch_job.state}, {batch_job.error})")
+        
+        results = []
+        for (subcategory, content_type), inlined in zip(jobs, batch_job.dest.inlined_responses):
+            if inlined.error or not inlined.response:
+                logger.error(f"[Gemini Batch API - generate_content ({content_type})] '{subcategory.name}' 실패: {inlined.error}")
+                results.append(None)
+                continue
             
-            # Log token usage
-            if hasattr(response, 'usage_metadata'):
-                usage = response.usage_metadata
-                logger.info(f"[Gemini API - generate_subcategory_topics] Token usage: "
-                           f"prompt_tokens={usage.prompt_token_count}, "
-                           f"response_tokens={usage.candidates_token_count}, "
-                           f"total_tokens={usage.total_token_count}")
+            usage = inlined.response.usage_metadata
+            if usage:
                 token_tracker.add_usage(
-                    "generate_subcategory_topics",
+                    f"generate_content_batch_{content_type}",
                     usage.prompt_token_count,
                     usage.candidates_token_count,
                     usage.total_token_count
                 )
-            else:
-                logger.warning("[Gemini API - generate_subcategory_topics] No token usage metadata available")
+            results.append(self._content_result(subcategory, content_type, inlined.response.text))
+        return results
+    
+    @_single_flight
+    async def generate_subcategory_topics(self, category_name: str, count: int = 5, bypass_cache: bool = False) -> List[str]:
+        """카테고리에 대한 서브카테고리 주제 생성"""
+        
+        cache_params = {"version": PROMPT_TEMPLATE_VERSION, "category_name": category_name, "count": count}
+        if not bypass_cache:
+            cached_topics = cache_manager.get("subcategory_topics", cache_params)
+            if cached_topics:
+                logger.info("캐시 히트: 서브카테고리 주제 '%s'", category_name)
+                return cached_topics
+        
+        # 표현만 다른 비슷한 카테고리의 주제 재사용
+        semantic_namespace = f"{PROMPT_TEMPLATE_VERSION}:{EMBEDDING_MODEL}:topics:{count}"
+        embedding = None if bypass_cache else await self._embed(category_name)
+        if embedding:
+            cached_topics = await asyncio.to_thread(semantic_cache.get, semantic_namespace, embedding)
+            if cached_topics:
+                logger.info("시맨틱 캐시 히트: 서브카테고리 주제 '%s'", category_name)
+                return cached_topics
+        
+        prompt = f"""
+<thinking>
+카테고리: {category_name}
+이 카테고리에 대해 사람들이 가장 관심을 가질 만한 구체적인 주제를 생성해야 한다.
+각 주제는 실제 학술 논문이 존재할 가능성이 높은 것들이어야 한다.
+국제 학술지에 많이 연구되는 주제들을 우선적으로 선택해야 한다.
+</thinking>
+
+"{category_name}" 카테고리에 대해 사람들이 가장 궁금해하는 구체적인 세부 주제 {count + 2}개를 생성해주세요.
+"""
+        
+        try:
+            response = await self._generate(prompt, template="topics")
+            
+            _record_usage("generate_subcategory_topics", "generate_subcategory_topics", response.usage_metadata)
             
             text = response.text
-            json_match = re.search(r'\{.*\}', text, re.DOTALL)
+            data = _extract_json(text)
             
-            if json_match:
-                data = json.loads(json_match.group())
+            if data is not None:
                 topics = data.get("topics", [])[:count]
+                if topics:
+                    # 기본 주제(아래 fallback)는 캐시하지 않음
+                    cache_manager.set("subcategory_topics", cache_params, topics, ttl=GENERATION_CACHE_TTL)
+                    if embedding:
+                        await asyncio.to_thread(semantic_cache.set, semantic_namespace, embedding, topics)
                 return topics
                 
         except Exception as e:
@@ -644,25 +1162,12 @@ JSON 형식으로 응답:
         
         return [f"{category_name} - {topic}" for topic in base_topics[:count]]
     
-    def transform_content(self, content: str, transformation_type: str, prompt: str) -> str:
+    async def transform_content(self, content: str, transformation_type: str, prompt: str) -> str:
         """Transform existing content with a different style"""
         try:
-            response = self.client.models.generate_content(
-                model=self.model_name,
-                contents=prompt,
-                config=self.generation_config
-            )
+            response = await self._generate(prompt)
             
-            # Log token usage
-            usage = response.usage_metadata
-            if usage:
-                logger.info(f"[Gemini API - transform_content ({transformation_type})] Token usage: prompt_tokens={usage.prompt_token_count}, response_tokens={usage.candidates_token_count}, total_tokens={usage.total_token_count}")
-                token_tracker.add_usage(
-                    f"transform_content_{transformation_type}",
-                    usage.prompt_token_count,
-                    usage.candidates_token_count,
-                    usage.total_token_count
-                )
+            _record_usage(f"transform_content ({transformation_type})", f"transform_content_{transformation_type}", response.usage_metadata)
             
             transformed_content = response.text.strip()
             
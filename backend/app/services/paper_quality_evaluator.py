@@ -27,9 +27,9 @@ class QualityMetrics:
     total_score: float  # 총점 (최대 100점)
     quality_grade: QualityGrade  # 등급 (A+, A, B+, B, C)
     
-@dataclass
+@dataclass(slots=True)
 class PaperInfo:
-    """논문 정보"""
+    """논문 정보 (GeminiClient 논문 검색 결과에도 그대로 사용)"""
     title: str
     authors: str
     journal: str
@@ -77,6 +77,15 @@ class PaperQualityEvaluator:
             "Commentary": 5
         }
         
+        # 소문자 유형명 → 점수 (정확 매칭을 dict 조회로 처리)
+        self._paper_type_scores_lower = {
+            type_key.lower(): float(score)
+            for type_key, score in self.paper_type_scores.items()
+        }
+        
+        # 논문 유형 문자열별 점수 캐시 (유형 문자열 종류는 많지 않음)
+        self._paper_type_score_cache: Dict[str, float] = {}
+        
         # 저널 Impact Factor 범위
         self.impact_factor_ranges = {
             "top_tier": 10.0,  # Nature, Science 등
@@ -84,9 +93,11 @@ class PaperQualityEvaluator:
             "medium": 3.0,     # 일반 전문 저널
             "low": 1.0         # 기타 저널
         }
-        
-        # 현재 연도
-        self.current_year = datetime.now().year
+    
+    @property
+    def current_year(self) -> int:
+        """현재 연도 (전역 인스턴스가 해를 넘겨 사용되므로 매번 계산)"""
+        return datetime.now().year
     
     def evaluate_paper_metrics(self, paper: PaperInfo) -> QualityMetrics:
         """논문 품질 종합 평가"""
@@ -190,16 +201,27 @@ class PaperQualityEvaluator:
     def _calculate_paper_type_score(self, paper_type: str) -> float:
         """논문 유형별 점수 계산 (최대 35점)"""
         
+        score = self._paper_type_score_cache.get(paper_type)
+        if score is None:
+            score = self._match_paper_type_score(paper_type)
+            if len(self._paper_type_score_cache) < 1024:
+                self._paper_type_score_cache[paper_type] = score
+        return score
+    
+    def _match_paper_type_score(self, paper_type: str) -> float:
+        """논문 유형 문자열을 점수 테이블과 매칭"""
+        
+        paper_type_lower = paper_type.lower()
+        
         # 정확한 매칭 시도
-        for type_key, score in self.paper_type_scores.items():
-            if paper_type.lower() == type_key.lower():
-                return float(score)
+        score = self._paper_type_scores_lower.get(paper_type_lower)
+        if score is not None:
+            return score
         
         # 부분 매칭 시도
-        paper_type_lower = paper_type.lower()
-        for type_key, score in self.paper_type_scores.items():
-            if type_key.lower() in paper_type_lower or paper_type_lower in type_key.lower():
-                return float(score)
+        for type_key_lower, score in self._paper_type_scores_lower.items():
+            if type_key_lower in paper_type_lower or paper_type_lower in type_key_lower:
+                return score
         
         # 키워드 기반 매칭
         if "systematic" in paper_type_lower and "review" in paper_type_lower:
@@ -314,6 +336,27 @@ class PaperQualityEvaluator:
             "evaluations": evaluations
         }
     
+    def score_paper_set(self, papers: List[PaperInfo]) -> Tuple[float, QualityGrade]:
+        """논문 세트의 평균 점수와 등급만 계산 (evaluate_paper_set의 숫자 경로)
+        
+        논문별 QualityMetrics와 등급 분포를 만들지 않아 논문 검색마다 호출해도 부담이 적다.
+        """
+        
+        if not papers:
+            return 0, "N/A"
+        
+        total = 0.0
+        for paper in papers:
+            total += (
+                self._calculate_paper_type_score(paper.paper_type) +
+                self._calculate_impact_factor_score(paper.impact_factor) +
+                self._calculate_citation_score(paper.citations, paper.year) +
+                self._calculate_recency_score(paper.year)
+            )
+        average_score = total / len(papers)
+        
+        return round(average_score, 1), self._assign_quality_grade(average_score)
+    
     def generate_quality_report(self, paper: PaperInfo, metrics: QualityMetrics) -> str:
         """논문 품질 평가 리포트 생성"""
         
@@ -358,4 +401,8 @@ class PaperQualityEvaluator:
             report += "- 근거 수준이 낮아 주의가 필요합니다.\n"
             report += "- 반드시 다른 논문들과 교차 검증이 필요합니다."
         
-        return report
\ No newline at end of file
+        return report
+
+
+# 전역 논문 품질 평가기 인스턴스 (상태는 유형 점수 캐시뿐이라 요청 간 공유)
+paper_quality_evaluator = PaperQualityEvaluator()
@@ -67,10 +67,12 @@ class PerformanceOptimizer:
             result = await func(*args, **kwargs)
             success = True
             error = None
+            exception = None
         except Exception as e:
             result = None
             success = False
             error = str(e)
+            exception = e
             
         # 종료 메트릭
         end_time = time.time()
@@ -95,7 +97,8 @@ class PerformanceOptimizer:
             self.metrics_history.append(metrics)
             
         if not success:
-            raise Exception(error)
+            # 원래 예외를 그대로 전달 (HTTPException 상태 코드 보존)
+            raise exception
             
         return result
     
@@ -112,10 +115,12 @@ class PerformanceOptimizer:
             result = func(*args, **kwargs)
             success = True
             error = None
+            exception = None
         except Exception as e:
             result = None
             success = False
             error = str(e)
+            exception = e
             
         # 종료 메트릭
         end_time = time.time()
@@ -140,7 +145,8 @@ class PerformanceOptimizer:
             self.metrics_history.append(metrics)
             
         if not success:
-            raise Exception(error)
+            # 원래 예외를 그대로 전달 (HTTPException 상태 코드 보존)
+            raise exception
             
         return result
     
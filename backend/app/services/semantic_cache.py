@@ -0,0 +1,159 @@
+"""
+시맨틱 캐시 - 표현만 다른 같은 질의에 이전 생성 결과를 재사용
+
+질의 임베딩의 코사인 유사도가 임계값 이상인 항목이 있으면 히트로 본다.
+항목은 SQLite에 저장하고, 네임스페이스별로 메모리에 올려 전수 비교한다
+(네임스페이스당 항목 수를 제한하므로 별도 벡터 인덱스 없이도 Gemini 호출보다 훨씬 빠름).
+get/set은 블로킹 호출이므로 이벤트 루프에서는 asyncio.to_thread로 호출한다.
+"""
+
+import array
+import math
+import operator
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+# 캐시 DB 위치 - 실행 디렉토리와 관계없이 backend/cache (환경변수로 변경 가능)
+BASE_DIR = Path(__file__).parent.parent.parent
+SEMANTIC_CACHE_DIR = os.getenv("SEMANTIC_CACHE_DIR") or str(BASE_DIR / "cache")
+
+# 같은 질의로 볼 최소 코사인 유사도
+SEMANTIC_CACHE_THRESHOLD = 0.93
+SEMANTIC_CACHE_TTL = 3600 * 24  # 초
+# 네임스페이스당 최대 항목 수 - 넘으면 오래된 항목부터 제거 (전수 비교 비용: 768차원 500개 약 20ms)
+SEMANTIC_CACHE_MAX_ENTRIES = 500
+
+
+def _normalize(embedding: Sequence[float]) -> array.array:
+    """단위 벡터로 정규화 - 코사인 유사도를 내적만으로 계산하기 위함"""
+    norm = math.sqrt(sum(x * x for x in embedding)) or 1.0
+    return array.array("d", (x / norm for x in embedding))
+
+
+class SemanticCache:
+    """임베딩 유사도 기반 캐시"""
+    
+    def __init__(self, cache_dir: str = SEMANTIC_CACHE_DIR, threshold: float = SEMANTIC_CACHE_THRESHOLD,
+                 ttl: int = SEMANTIC_CACHE_TTL, max_entries: int = SEMANTIC_CACHE_MAX_ENTRIES):
+        """
+        Args:
+            cache_dir: 캐시 디렉토리 경로 (semantic_cache.db 생성)
+            threshold: 히트로 볼 최소 코사인 유사도
+            ttl: 항목 유효 시간 (초)
+            max_entries: 네임스페이스당 최대 항목 수
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.threshold = threshold
+        self.ttl = ttl
+        self.max_entries = max_entries
+        
+        self._db = sqlite3.connect(str(self.cache_dir / "semantic_cache.db"), check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS semantic_entries (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                namespace TEXT NOT NULL,
+                embedding BLOB NOT NULL,
+                value BLOB NOT NULL,
+                expires_at REAL NOT NULL
+            )
+        """)
+        self._db.execute("CREATE INDEX IF NOT EXISTS ix_semantic_entries_namespace ON semantic_entries (namespace, id)")
+        self._db.commit()
+        
+        # 네임스페이스 -> [(id, 정규화된 임베딩, 만료 시각, pickle된 값)] (오래된 순)
+        self._entries: Dict[str, List[Tuple[int, array.array, float, bytes]]] = {}
+        self._lock = threading.Lock()
+    
+    def _load(self, namespace: str) -> List[Tuple[int, array.array, float, bytes]]:
+        """네임스페이스 항목을 처음 접근할 때 DB에서 로드 (lock 안에서 호출)"""
+        entries = self._entries.get(namespace)
+        if entries is None:
+            entries = []
+            rows = self._db.execute(
+                "SELECT id, embedding, expires_at, value FROM semantic_entries WHERE namespace = ? AND expires_at > ? ORDER BY id",
+                (namespace, time.time())
+            )
+            for entry_id, embedding, expires_at, value in rows:
+                vector = array.array("d")
+                vector.frombytes(embedding)
+                entries.append((entry_id, vector, expires_at, value))
+            self._entries[namespace] = entries
+        return entries
+    
+    def get(self, namespace: str, embedding: Sequence[float]) -> Optional[Any]:
+        """유사도가 임계값 이상인 가장 가까운 항목의 값 (없으면 None)"""
+        query = _normalize(embedding)
+        now = time.time()
+        best_value, best_score = None, self.threshold
+        
+        with self._lock:
+            for _, vector, expires_at, value in self._load(namespace):
+                if expires_at <= now or len(vector) != len(query):
+                    continue
+                score = sum(map(operator.mul, query, vector))
+                if score >= best_score:
+                    best_value, best_score = value, score
+        
+        if best_value is None:
+            return None
+        try:
+            return pickle.loads(best_value)
+        except Exception as e:
+            print(f"시맨틱 캐시 읽기 실패: {e}")
+            return None
+    
+    def set(self, namespace: str, embedding: Sequence[float], value: Any) -> bool:
+        """항목 추가 (만료되었거나 한도를 넘는 오래된 항목은 함께 제거)"""
+        vector = _normalize(embedding)
+        now = time.time()
+        expires_at = now + self.ttl
+        
+        try:
+            blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+            with self._lock:
+                entries = self._load(namespace)
+                cursor = self._db.execute(
+                    "INSERT INTO semantic_entries (namespace, embedding, value, expires_at) VALUES (?, ?, ?, ?)",
+                    (namespace, vector.tobytes(), blob, expires_at)
+                )
+                entries.append((cursor.lastrowid, vector, expires_at, blob))
+                
+                stale = [entry for entry in entries if entry[2] <= now]
+                overflow = len(entries) - len(stale) - self.max_entries
+                if overflow > 0:
+                    stale += [entry for entry in entries if entry[2] > now][:overflow]
+                if stale:
+                    stale_ids = {entry[0] for entry in stale}
+                    self._db.executemany("DELETE FROM semantic_entries WHERE id = ?", [(i,) for i in stale_ids])
+                    entries[:] = [entry for entry in entries if entry[0] not in stale_ids]
+                self._db.commit()
+            return True
+        except Exception as e:
+            print(f"시맨틱 캐시 저장 실패: {e}")
+            return False
+    
+    def clear(self, namespace: Optional[str] = None) -> None:
+        """네임스페이스(없으면 전체) 항목 삭제"""
+        with self._lock:
+            if namespace is None:
+                self._db.execute("DELETE FROM semantic_entries")
+                self._entries.clear()
+            else:
+                self._db.execute("DELETE FROM semantic_entries WHERE namespace = ?", (namespace,))
+                self._entries.pop(namespace, None)
+            self._db.commit()
+
+
+# 전역 시맨틱 캐시 인스턴스
+semantic_cache = SemanticCache()
@@ -8,7 +8,8 @@ import asyncio
 import psutil
 import os
 from collections import deque
-from dataclasses import dataclass
+from itertools import islice, takewhile
+from dataclasses import dataclass, field
 import json
 
 @dataclass
@@ -33,6 +34,20 @@ class Alert:
     message: str
     value: Any
     threshold: Any
+    iso_timestamp: str = field(init=False)
+    
+    def __post_init__(self):
+        # 조회 시마다 포맷하지 않도록 생성 시점에 한 번만 문자열로 변환
+        self.iso_timestamp = self.timestamp.isoformat()
+
+@dataclass(frozen=True)
+class StatusSnapshot:
+    """모니터 상태 스냅샷 (모니터링 루프에서 갱신)"""
+    is_monitoring: bool
+    current_status: Dict[str, Any]
+    alert_count: int
+    history_size: int
+    timestamp: datetime
 
 class SystemMonitor:
     """시스템 모니터"""
@@ -42,10 +57,14 @@ class SystemMonitor:
                  monitoring_interval: float = 5.0):
         self.history_size = history_size
         self.monitoring_interval = monitoring_interval
+        # 스냅샷이 자체 타임스탬프를 가지므로 시간 순서의 단일 deque로 관리
         self.history = deque(maxlen=history_size)
         self.alerts = deque(maxlen=100)
+        # 조회용으로 미리 직렬화해 둔 최근 알림 (alerts와 같은 길이로 유지)
+        self.recent_formatted_alerts = deque(maxlen=self.alerts.maxlen)
         self.is_monitoring = False
         self.process = psutil.Process()
+        self._status_snapshot = self._build_status_snapshot()
         
         # 임계값 설정
         self.thresholds = {
@@ -58,12 +77,14 @@ class SystemMonitor:
     async def start_monitoring(self):
         """모니터링 시작"""
         self.is_monitoring = True
+        self._refresh_status_snapshot()
         asyncio.create_task(self._monitoring_loop())
         print("🔍 시스템 모니터링 시작...")
         
     async def stop_monitoring(self):
         """모니터링 중지"""
         self.is_monitoring = False
+        self._refresh_status_snapshot()
         print("🛑 시스템 모니터링 중지...")
         
     async def _monitoring_loop(self):
@@ -75,6 +96,7 @@ class SystemMonitor:
                 
                 # 임계값 확인
                 self._check_thresholds(snapshot)
+                self._refresh_status_snapshot()
                 
                 await asyncio.sleep(self.monitoring_interval)
                 
@@ -166,11 +188,42 @@ class SystemMonitor:
             threshold=threshold
         )
         self.alerts.append(alert)
+        self.recent_formatted_alerts.append({
+            'timestamp': alert.iso_timestamp,
+            'level': alert.level,
+            'metric': alert.metric,
+            'message': alert.message,
+            'value': alert.value,
+            'threshold': alert.threshold
+        })
         
         # 콘솔 출력 (실제로는 로깅 시스템 사용)
         icon = "🔴" if level == 'critical' else "🟡" if level == 'warning' else "🔵"
         print(f"{icon} [{alert.timestamp.strftime('%H:%M:%S')}] {message}")
         
+    def _build_status_snapshot(self) -> StatusSnapshot:
+        """현재 상태로 스냅샷 생성"""
+        return StatusSnapshot(
+            is_monitoring=self.is_monitoring,
+            current_status=self.get_current_status(),
+            alert_count=len(self.alerts),
+            history_size=len(self.history),
+            timestamp=datetime.now()
+        )
+        
+    def _refresh_status_snapshot(self):
+        """상태 스냅샷 갱신"""
+        self._status_snapshot = self._build_status_snapshot()
+        
+    def snapshot(self) -> StatusSnapshot:
+        """마지막으로 갱신된 상태 스냅샷 조회"""
+        return self._status_snapshot
+        
+    def get_recent_alerts(self, limit: int) -> List[Dict[str, Any]]:
+        """최근 알림 조회 (직렬화된 형태)"""
+        start = max(len(self.recent_formatted_alerts) - limit, 0)
+        return list(islice(self.recent_formatted_alerts, start, None))
+        
     def get_current_status(self) -> Dict[str, Any]:
         """현재 상태 조회"""
         if not self.history:
@@ -196,7 +249,10 @@ class SystemMonitor:
             
         # 지정된 시간 범위의 데이터 필터링
         cutoff_time = datetime.now() - timedelta(minutes=minutes)
-        recent_data = [s for s in self.history if s.timestamp > cutoff_time]
+        # 최신 항목부터 거슬러 올라가며 구간 밖에서 중단 (O(구간 내 샘플 수))
+        recent_data = list(takewhile(
+            lambda s: s.timestamp > cutoff_time, reversed(self.history)
+        ))
         
         if not recent_data:
             return {'status': 'insufficient_data'}
@@ -252,7 +308,7 @@ class SystemMonitor:
             ],
             'alerts': [
                 {
-                    'timestamp': a.timestamp.isoformat(),
+                    'timestamp': a.iso_timestamp,
                     'level': a.level,
                     'metric': a.metric,
                     'message': a.message,
@@ -8,6 +8,23 @@ import time
 from dataclasses import dataclass
 from abc import ABC, abstractmethod
 
+# 응답마다 쓰는 정규식은 모듈 로드 시 한 번만 컴파일
+THINKING_PATTERN = re.compile(r'<thinking>(.*?)</thinking>', re.DOTALL)
+DECISION_PATTERNS = [re.compile(pattern) for pattern in (
+    r'따라서[^.]+\.',
+    r'그래서[^.]+\.',
+    r'결론적으로[^.]+\.',
+    r'선택한 이유는[^.]+\.',
+    r'최종적으로[^.]+\.'
+)]
+INSIGHT_PATTERNS = [re.compile(pattern) for pattern in (
+    r'핵심은[^.]+\.',
+    r'중요한 점은[^.]+\.',
+    r'주목할 점은[^.]+\.',
+    r'발견한 것은[^.]+\.',
+    r'알 수 있는 것은[^.]+\.'
+)]
+
 @dataclass
 class ThinkingResult:
     """사고 과정 결과"""
@@ -23,7 +40,6 @@ class NativeThinkingEngine:
     """Native Thinking 엔진 - Gemini의 <thinking> 태그 활용"""
     
     def __init__(self):
-        self.thinking_pattern = r'<thinking>(.*?)</thinking>'
         self.quality_evaluator = ThinkingQualityEvaluator()
         self.insight_extractor = InsightExtractor()
         
@@ -67,14 +83,14 @@ class NativeThinkingEngine:
     
     def extract_thinking_process(self, response: str) -> Tuple[str, str]:
         """응답에서 사고 과정 추출"""
-        thinking_matches = re.findall(self.thinking_pattern, response, re.DOTALL)
+        thinking_matches = THINKING_PATTERN.findall(response)
         
         if thinking_matches:
             # 모든 thinking 태그 내용 결합
             thinking_process = '\n\n'.join(thinking_matches)
             
             # thinking 태그 제거한 clean content
-            clean_content = re.sub(self.thinking_pattern, '', response, flags=re.DOTALL)
+            clean_content = THINKING_PATTERN.sub('', response)
             clean_content = clean_content.strip()
             
             return thinking_process.strip(), clean_content
@@ -158,17 +174,9 @@ class NativeThinkingEngine:
     
     def _extract_decision_points(self, thinking: str) -> List[str]:
         """사고 과정에서 주요 의사결정 포인트 추출"""
-        decision_patterns = [
-            r'따라서[^.]+\.',
-            r'그래서[^.]+\.',
-            r'결론적으로[^.]+\.',
-            r'선택한 이유는[^.]+\.',
-            r'최종적으로[^.]+\.'
-        ]
-        
         decision_points = []
-        for pattern in decision_patterns:
-            matches = re.findall(pattern, thinking)
+        for pattern in DECISION_PATTERNS:
+            matches = pattern.findall(thinking)
             decision_points.extend(matches)
             
         return list(set(decision_points))  # 중복 제거
@@ -262,16 +270,8 @@ class InsightExtractor:
         insights = []
         
         # 인사이트 패턴
-        insight_patterns = [
-            r'핵심은[^.]+\.',
-            r'중요한 점은[^.]+\.',
-            r'주목할 점은[^.]+\.',
-            r'발견한 것은[^.]+\.',
-            r'알 수 있는 것은[^.]+\.'
-        ]
-        
-        for pattern in insight_patterns:
-            matches = re.findall(pattern, thinking)
+        for pattern in INSIGHT_PATTERNS:
+            matches = pattern.findall(thinking)
             insights.extend(matches)
             
         # 문장별 분석으로 추가 인사이트 추출
@@ -114,8 +114,8 @@ class ThinkingEnabledContentGenerator:
         enhanced_kwargs['thinking_patterns'] = thinking_analysis.thinking_patterns
         
         # 생성기 실행
-        content = generator.generate(
-            topic, papers, target_audience=target_audience, **enhanced_kwargs
+        content = await asyncio.to_thread(
+            generator.generate, topic, papers, target_audience=target_audience, **enhanced_kwargs
         )
         
         # 사고 과정 정보 추가
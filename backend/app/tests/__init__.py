@@ -1,7 +1,3 @@
 """
 테스트 패키지
 """
-
-from .test_integration import IntegrationTestSuite, run_integration_tests
-
-__all__ = ['IntegrationTestSuite', 'run_integration_tests']
\ No newline at end of file
@@ -0,0 +1,182 @@
+"""
+고급 캐시 매니저 테스트 - SQLite 인덱스, 인라인 저장, 만료 정리, 일괄 저장
+"""
+
+import asyncio
+import json
+import os
+import pickle
+import threading
+import time
+
+import pytest
+
+from ..services import advanced_cache_manager as acm
+from ..services.advanced_cache_manager import AdvancedCacheManager, INLINE_MAX_BYTES
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return AdvancedCacheManager(cache_dir=str(tmp_path / "cache"))
+
+
+def _large_value() -> bytes:
+    """압축되지 않아 파일로 저장되는 크기의 값"""
+    return os.urandom(INLINE_MAX_BYTES * 2)
+
+
+def test_set_get_roundtrip(cache):
+    """JSON 호환 값과 pickle 값 모두 같은 타입으로 복원"""
+    cache.set("json", {"a": [1, 2], "b": "텍스트"})
+    cache.set("pickle", ("tuple", 1))
+    
+    assert cache.get("json") == {"a": [1, 2], "b": "텍스트"}
+    assert cache.get("pickle") == ("tuple", 1)
+    assert cache.get("missing", "default") == "default"
+
+
+def test_get_returns_independent_copies(cache):
+    """반환값을 수정해도 메모리 계층의 값은 바뀌지 않음"""
+    cache.set("key", {"items": [1]})
+    
+    first = cache.get("key")
+    first["items"].append(2)
+    
+    assert cache.get("key") == {"items": [1]}
+
+
+def test_expired_entry_is_a_miss(cache):
+    cache.set("key", "value", ttl=0.05)
+    time.sleep(0.1)
+    
+    assert cache.get("key") is None
+    assert "key" not in cache.index
+
+
+def test_purge_expired_removes_rows_and_files(cache):
+    cache.set("small", "value", ttl=0.05)
+    cache.set("large", _large_value(), ttl=0.05)
+    cache.set("alive", "value", ttl=100)
+    large_path = cache._get_cache_path("large")
+    assert large_path.exists()
+    
+    time.sleep(0.1)
+    assert cache.purge_expired() == 2
+    cache._unlink_pool.submit(lambda: None).result()  # 대기 중인 파일 삭제 완료 대기
+    
+    assert not large_path.exists()
+    assert set(cache.index) == {"alive"}
+    rows = cache._index_db.execute("SELECT key FROM entries").fetchall()
+    assert rows == [("alive",)]
+
+
+def test_small_entries_inline_and_large_entries_in_files(cache):
+    large = _large_value()
+    cache.set("small", {"a": 1})
+    cache.set("large", large)
+    
+    assert cache.index["small"].inline
+    assert not cache._get_cache_path("small").exists()
+    assert not cache.index["large"].inline
+    assert cache._get_cache_path("large").exists()
+    
+    assert cache.get("small") == {"a": 1}
+    assert cache.get("large") == large
+
+
+def test_inline_value_replaces_file_entry(cache):
+    cache.set("key", _large_value())
+    path = cache._get_cache_path("key")
+    assert path.exists()
+    
+    cache.set("key", "small")
+    
+    assert cache.index["key"].inline
+    assert not path.exists()
+    assert cache.get("key") == "small"
+
+
+def test_index_reloads_from_sqlite(tmp_path):
+    """새 인스턴스가 같은 디렉토리의 인덱스 DB에서 엔트리를 복원"""
+    cache_dir = str(tmp_path / "cache")
+    large = _large_value()
+    first = AdvancedCacheManager(cache_dir=cache_dir)
+    first.set("small", {"a": 1}, metadata={"content_type": "article"})
+    first.set("large", large)
+    
+    second = AdvancedCacheManager(cache_dir=cache_dir)
+    
+    assert second.get("small") == {"a": 1}
+    assert second.get("large") == large
+    assert second.find_keys_by_metadata({"content_type": "article"}) == ["small"]
+
+
+def test_migrates_json_index_and_log(tmp_path):
+    """이전 버전의 JSON 인덱스와 변경 로그를 SQLite로 이전"""
+    cache_dir = tmp_path / "cache"
+    seed = AdvancedCacheManager(cache_dir=str(cache_dir))
+    now = time.time()
+    
+    def legacy_entry(key: str, data: bytes) -> dict:
+        # 이전 버전은 태그 없는 pickle을 파일로 저장
+        seed._get_cache_path(key).write_bytes(data)
+        return {"key": key, "value": None, "created_at": now, "expires_at": now + 3600,
+                "size_bytes": len(data), "compression": False}
+    
+    indexed = legacy_entry("indexed", pickle.dumps({"from": "index"}))
+    logged = legacy_entry("logged", pickle.dumps({"from": "log"}))
+    removed = legacy_entry("removed", pickle.dumps({"from": "removed"}))
+    
+    (cache_dir / "cache_index.json").write_text(json.dumps({"indexed": indexed, "removed": removed}))
+    with open(cache_dir / "cache_index.log", "wb") as f:
+        f.write(json.dumps({"op": "set", "k": "logged", "e": logged}).encode() + b"\n")
+        f.write(json.dumps({"op": "del", "k": "removed"}).encode() + b"\n")
+        f.write(b'{"op": "set", "k": "trunc')  # 기록 도중 중단된 마지막 줄
+    seed._index_db.close()
+    
+    cache = AdvancedCacheManager(cache_dir=str(cache_dir))
+    
+    assert cache.get("indexed") == {"from": "index"}
+    assert cache.get("logged") == {"from": "log"}
+    assert "removed" not in cache.index
+    assert not (cache_dir / "cache_index.json").exists()
+    assert not (cache_dir / "cache_index.log").exists()
+
+
+@pytest.mark.asyncio
+async def test_aset_many_roundtrip(cache):
+    large = _large_value()
+    stored = await cache.aset_many([
+        ("a", {"v": 1}, None, None),
+        ("b", large, None, {"content_type": "report"}),
+        ("a", {"v": 2}, None, None),  # 같은 키는 마지막 값만 저장
+    ])
+    
+    assert stored == 2
+    assert await cache.aget("a") == {"v": 2}
+    assert await cache.aget("b") == large
+    assert cache.find_keys_by_metadata({"content_type": "report"}) == ["b"]
+
+
+@pytest.mark.asyncio
+async def test_async_writes_racing_purge_unlink_keep_fresh_file(cache, monkeypatch):
+    """파일 쓰기와 인덱스 갱신 사이에 실행된 만료 파일 삭제가 새 파일을 지우지 않음"""
+    original_write = acm.atomic_write
+    
+    def write_then_race_unlink(path, data, mtime=None):
+        original_write(path, data, mtime)
+        for key in ("single", "batch"):
+            if path == cache._get_cache_path(key):
+                unlink = threading.Thread(target=cache._unlink_expired_file, args=(key,))
+                unlink.start()
+                unlink.join(0.2)  # 샤드 잠금에 막히면 저장이 끝난 뒤 실행됨
+    
+    monkeypatch.setattr(acm, "atomic_write", write_then_race_unlink)
+    large = _large_value()
+    
+    await cache.aset("single", large)
+    await cache.aset_many([("batch", large, None, None)])
+    await asyncio.sleep(0.3)
+    
+    assert await cache.aget("single") == large
+    assert await cache.aget("batch") == large
@@ -0,0 +1,358 @@
+"""
+Gemini 클라이언트 테스트 - 호출 한도(RPM/TPM, AIMD 동시성), 동일 호출 합치기, 컨텍스트 캐시
+"""
+
+import asyncio
+import math
+import threading
+import time
+from collections import deque
+from types import SimpleNamespace
+
+import pytest
+from google.genai import errors
+
+from ..services import gemini_client
+from ..services.gemini_client import (
+    GeminiClient, GeminiRateLimiter, TOPICS_INSTRUCTIONS, _estimate_tokens, _inflight, _single_flight
+)
+
+
+def _reserve_wait(limiter: GeminiRateLimiter, est_tokens: int = 0):
+    """예약을 시도해 대기 시간 반환 (성공하면 슬롯을 바로 반납)"""
+    loop = asyncio.new_event_loop()
+    try:
+        wait = limiter._try_reserve(est_tokens, (loop, loop.create_future()))
+    finally:
+        loop.close()
+    if wait is None:
+        limiter._in_flight -= 1
+    return wait
+
+
+def _shift_windows(limiter: GeminiRateLimiter, seconds: float):
+    """RPM/TPM 윈도우가 seconds만큼 지난 것으로 처리"""
+    limiter._request_times = deque(t - seconds for t in limiter._request_times)
+    limiter._token_window_start -= seconds
+
+
+async def _hold(limiter: GeminiRateLimiter, est_tokens: int = 0,
+                entered: asyncio.Event = None, release: asyncio.Event = None):
+    """슬롯을 얻고 release가 설정될 때까지 보유"""
+    async with limiter.acquire(est_tokens=est_tokens):
+        if entered is not None:
+            entered.set()
+        if release is not None:
+            await release.wait()
+
+
+@pytest.mark.asyncio
+async def test_rpm_limit_waits_until_oldest_request_leaves_window():
+    limiter = GeminiRateLimiter(rpm=2, tpm=10**9, max_concurrency=8)
+    for _ in range(2):
+        async with limiter.acquire():
+            pass
+    
+    wait = _reserve_wait(limiter)
+    assert 59 < wait <= 60
+    
+    _shift_windows(limiter, 60)
+    async with limiter.acquire():
+        pass
+
+
+@pytest.mark.asyncio
+async def test_tpm_limit_counts_estimated_tokens():
+    limiter = GeminiRateLimiter(rpm=1000, tpm=100, max_concurrency=8)
+    async with limiter.acquire(est_tokens=80):
+        pass
+    
+    assert _reserve_wait(limiter, est_tokens=10) is None
+    wait = _reserve_wait(limiter, est_tokens=30)
+    assert 59 < wait <= 60
+    
+    _shift_windows(limiter, 60)
+    assert _reserve_wait(limiter, est_tokens=30) is None
+
+
+@pytest.mark.asyncio
+async def test_first_request_in_window_may_exceed_tpm():
+    limiter = GeminiRateLimiter(rpm=1000, tpm=100, max_concurrency=8)
+    await asyncio.wait_for(_hold(limiter, est_tokens=500), timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_full_concurrency_waits_for_release_without_polling():
+    limiter = GeminiRateLimiter(rpm=1000, tpm=10**9, max_concurrency=1)
+    reserve_calls = []
+    original_reserve = limiter._try_reserve
+    
+    def counting_reserve(est_tokens, waiter):
+        reserve_calls.append(est_tokens)
+        return original_reserve(est_tokens, waiter)
+    
+    limiter._try_reserve = counting_reserve
+    
+    first_entered, first_release = asyncio.Event(), asyncio.Event()
+    first = asyncio.create_task(_hold(limiter, 1, first_entered, first_release))
+    await first_entered.wait()
+    
+    second_entered = asyncio.Event()
+    second = asyncio.create_task(_hold(limiter, 2, second_entered))
+    await asyncio.sleep(0.2)
+    
+    assert not second_entered.is_set()
+    assert reserve_calls.count(2) == 1  # 슬롯이 날 때까지 다시 시도하지 않음
+    
+    first_release.set()
+    await asyncio.wait_for(asyncio.gather(first, second), timeout=1)
+    assert reserve_calls.count(2) == 2
+    assert limiter._in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_release_wakes_waiter_on_another_loop():
+    """run_sync처럼 다른 스레드의 루프에서 기다리는 호출도 깨어남"""
+    limiter = GeminiRateLimiter(rpm=1000, tpm=10**9, max_concurrency=1)
+    entered, release = asyncio.Event(), asyncio.Event()
+    holder = asyncio.create_task(_hold(limiter, entered=entered, release=release))
+    await entered.wait()
+    
+    other = threading.Thread(target=asyncio.run, args=(_hold(limiter),))
+    other.start()
+    await asyncio.sleep(0.1)
+    assert other.is_alive()
+    
+    release.set()
+    await holder
+    await asyncio.to_thread(other.join, 1)
+    assert not other.is_alive()
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_is_unregistered():
+    limiter = GeminiRateLimiter(rpm=1000, tpm=10**9, max_concurrency=1)
+    entered, release = asyncio.Event(), asyncio.Event()
+    holder = asyncio.create_task(_hold(limiter, entered=entered, release=release))
+    await entered.wait()
+    
+    waiter = asyncio.create_task(_hold(limiter))
+    await asyncio.sleep(0.05)
+    assert len(limiter._slot_waiters) == 1
+    
+    waiter.cancel()
+    await asyncio.gather(waiter, return_exceptions=True)
+    assert limiter._slot_waiters == []
+    
+    release.set()
+    await holder
+    assert limiter._in_flight == 0
+
+
+def test_aimd_halves_on_rate_limit_and_recovers_additively():
+    limiter = GeminiRateLimiter(rpm=1000, tpm=10**9, max_concurrency=8)
+    
+    for expected in (4, 2, 1, 1):
+        limiter.on_rate_limited()
+        assert limiter.concurrency == expected
+    
+    for expected in (2, 3, 4, 5, 6, 7, 8, 8):
+        limiter.on_success()
+        assert limiter.concurrency == expected
+
+
+@pytest.mark.asyncio
+async def test_success_after_backoff_admits_waiting_call():
+    limiter = GeminiRateLimiter(rpm=1000, tpm=10**9, max_concurrency=4)
+    for _ in range(2):
+        limiter.on_rate_limited()
+    assert limiter.concurrency == 1
+    
+    entered, release = asyncio.Event(), asyncio.Event()
+    holder = asyncio.create_task(_hold(limiter, entered=entered, release=release))
+    await entered.wait()
+    
+    second_entered = asyncio.Event()
+    second = asyncio.create_task(_hold(limiter, entered=second_entered))
+    await asyncio.sleep(0.05)
+    assert not second_entered.is_set()
+    
+    limiter.on_success()  # 동시 요청 수 1 -> 2, 첫 호출이 끝나기 전에 들어감
+    await asyncio.wait_for(second_entered.wait(), timeout=1)
+    
+    release.set()
+    await asyncio.gather(holder, second)
+
+
+def test_token_estimate_includes_template_instructions():
+    prompt = "가" * 40
+    
+    assert _estimate_tokens(prompt) == 10
+    assert _estimate_tokens(prompt, "topics") == (40 + len(TOPICS_INSTRUCTIONS)) // 4
+
+
+
+class _FakeClient:
+    """_single_flight 대상 - 호출마다 release가 설정될 때까지 기다린 뒤 결과 반환"""
+    
+    def __init__(self):
+        self.calls = []
+        self.release = asyncio.Event()
+        self.cancelled = 0
+        self.error = None
+    
+    @_single_flight
+    async def generate(self, keyword: str, count: int = 5):
+        self.calls.append((keyword, count))
+        try:
+            await self.release.wait()
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if self.error is not None:
+            raise self.error
+        return {"keyword": keyword, "count": count}
+
+
+@pytest.mark.asyncio
+async def test_single_flight_coalesces_identical_calls():
+    client = _FakeClient()
+    # GeminiClient는 요청마다 새로 만들어지므로 다른 인스턴스의 같은 호출도 합쳐짐
+    other = _FakeClient()
+    other.release = client.release
+    
+    calls = [
+        asyncio.create_task(client.generate("운동")),
+        asyncio.create_task(client.generate("운동", count=5)),  # 기본값을 채운 같은 호출
+        asyncio.create_task(other.generate(keyword="운동")),
+        asyncio.create_task(client.generate("운동", 3)),
+    ]
+    await asyncio.sleep(0.05)
+    client.release.set()
+    results = await asyncio.gather(*calls)
+    
+    assert client.calls + other.calls == [("운동", 5), ("운동", 3)]
+    assert results[:3] == [{"keyword": "운동", "count": 5}] * 3
+    assert results[3] == {"keyword": "운동", "count": 3}
+    assert not _inflight
+    
+    # 끝난 호출은 결과를 보관하지 않으므로 다음 호출은 새로 실행
+    await client.generate("운동")
+    assert client.calls[-1] == ("운동", 5) and len(client.calls) == 3
+
+
+@pytest.mark.asyncio
+async def test_single_flight_cancelling_one_waiter_keeps_the_others():
+    client = _FakeClient()
+    starter = asyncio.create_task(client.generate("운동"))
+    await asyncio.sleep(0.01)
+    follower = asyncio.create_task(client.generate("운동"))
+    await asyncio.sleep(0.01)
+    
+    starter.cancel()  # 호출을 시작한 쪽이 취소되어도
+    await asyncio.gather(starter, return_exceptions=True)
+    client.release.set()
+    
+    assert await follower == {"keyword": "운동", "count": 5}
+    assert starter.cancelled()
+    assert client.cancelled == 0
+    assert len(client.calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_single_flight_cancels_call_when_every_waiter_leaves():
+    client = _FakeClient()
+    waiters = [asyncio.create_task(client.generate("운동")) for _ in range(2)]
+    await asyncio.sleep(0.01)
+    
+    for waiter in waiters:
+        waiter.cancel()
+    await asyncio.gather(*waiters, return_exceptions=True)
+    await asyncio.sleep(0)
+    
+    assert client.cancelled == 1
+    assert not _inflight
+    
+    # 취소 중인 호출을 기다리지 않고 새로 호출
+    client.release.set()
+    assert await client.generate("운동") == {"keyword": "운동", "count": 5}
+    assert len(client.calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_single_flight_exception_reaches_every_waiter():
+    client = _FakeClient()
+    client.error = RuntimeError("upstream failed")
+    waiters = [asyncio.create_task(client.generate("운동")) for _ in range(3)]
+    await asyncio.sleep(0.01)
+    client.release.set()
+    
+    results = await asyncio.gather(*waiters, return_exceptions=True)
+    
+    assert all(result is client.error for result in results)
+    assert len(client.calls) == 1
+    assert not _inflight
+
+
+def _caching_client(error: Exception = None):
+    """caches.create 호출을 기록하는 GeminiClient (API 키 없이 생성)"""
+    calls = []
+    
+    async def create(model, config):
+        calls.append(config.display_name)
+        if error is not None:
+            raise error
+        return SimpleNamespace(name=f"cachedContents/{len(calls)}")
+    
+    client = GeminiClient.__new__(GeminiClient)
+    client.model_name = "gemini-2.5-flash"
+    client.client = SimpleNamespace(aio=SimpleNamespace(caches=SimpleNamespace(create=create)))
+    return client, calls
+
+
+@pytest.fixture
+def prompt_caches(monkeypatch):
+    monkeypatch.setattr(gemini_client, "_prompt_caches", {})
+    return gemini_client._prompt_caches
+
+
+@pytest.mark.asyncio
+async def test_templates_below_cache_minimum_skip_cache_creation(prompt_caches):
+    client, calls = _caching_client()
+    
+    assert await client._cached_content_name("topics") is None
+    assert await client._cached_content_name("categories") is None
+    assert calls == []
+    assert prompt_caches == {}
+
+
+@pytest.mark.asyncio
+async def test_cache_is_created_once_and_reused(prompt_caches):
+    client, calls = _caching_client()
+    
+    assert await client._cached_content_name("article") == "cachedContents/1"
+    assert await client._cached_content_name("article") == "cachedContents/1"
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_rejected_cache_creation_is_not_retried(prompt_caches):
+    rejected = errors.ClientError(400, {"error": {"code": 400, "message": "too small", "status": "INVALID_ARGUMENT"}})
+    client, calls = _caching_client(rejected)
+    
+    assert await client._cached_content_name("article") is None
+    ((name, expires_at),) = prompt_caches.values()
+    assert name is None and expires_at == math.inf
+    
+    assert await client._cached_content_name("article") is None
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_transient_cache_failure_is_retried_later(prompt_caches):
+    unavailable = errors.ServerError(503, {"error": {"code": 503, "message": "busy", "status": "UNAVAILABLE"}})
+    client, calls = _caching_client(unavailable)
+    
+    assert await client._cached_content_name("article") is None
+    ((name, expires_at),) = prompt_caches.values()
+    assert name is None and expires_at <= time.time() + gemini_client.PROMPT_CACHE_RETRY_INTERVAL
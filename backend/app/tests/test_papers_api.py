@@ -0,0 +1,98 @@
+"""
+논문 API 테스트 - ETag/304 조건부 응답, NDJSON 스트리밍
+"""
+
+import orjson
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from ..api import papers
+from ..api.papers import NDJSON_MEDIA_TYPE, PAPERS_ETAG, _CACHE_HEADERS
+
+
+@pytest.fixture(scope="module")
+def client():
+    # lifespan(타임스탬프 갱신, 감사 로그 drain) 없이 라우터만 마운트
+    app = FastAPI()
+    app.include_router(papers.router, prefix="/api/v1/papers")
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+def _assert_cache_headers(response):
+    for name, value in _CACHE_HEADERS.items():
+        assert response.headers[name] == value
+    assert response.headers["Vary"] == "Accept"
+
+
+@pytest.mark.parametrize("path", [
+    "/api/v1/papers/",
+    "/api/v1/papers/paper_001",
+    "/api/v1/papers/quality/distribution",
+])
+def test_responses_carry_etag_and_cache_headers(client, path):
+    response = client.get(path)
+    
+    assert response.status_code == 200
+    _assert_cache_headers(response)
+
+
+@pytest.mark.parametrize("path", [
+    "/api/v1/papers/",
+    "/api/v1/papers/paper_001",
+    "/api/v1/papers/quality/distribution",
+])
+@pytest.mark.parametrize("if_none_match", [
+    PAPERS_ETAG,
+    PAPERS_ETAG.removeprefix("W/"),          # 약한 비교이므로 강한 형식도 일치
+    f'"other", {PAPERS_ETAG}',
+    "*",
+])
+def test_matching_if_none_match_returns_304(client, path, if_none_match):
+    response = client.get(path, headers={"If-None-Match": if_none_match})
+    
+    assert response.status_code == 304
+    assert response.content == b""
+    _assert_cache_headers(response)
+
+
+def test_stale_if_none_match_returns_full_response(client):
+    response = client.get("/api/v1/papers/", headers={"If-None-Match": 'W/"stale"'})
+    
+    assert response.status_code == 200
+    assert response.json()["papers"]
+
+
+def test_unknown_paper_is_404_even_with_matching_etag(client):
+    response = client.get("/api/v1/papers/paper_999", headers={"If-None-Match": PAPERS_ETAG})
+    
+    assert response.status_code == 404
+
+
+@pytest.mark.parametrize("params", [
+    {},
+    {"sort_by": "year", "order": "asc"},
+    {"page": 2, "size": 1, "min_grade": "B"},
+])
+def test_ndjson_stream_matches_json_response(client, params):
+    json_response = client.get("/api/v1/papers/", params=params)
+    ndjson_response = client.get(
+        "/api/v1/papers/", params=params, headers={"Accept": NDJSON_MEDIA_TYPE}
+    )
+    
+    assert ndjson_response.status_code == 200
+    assert ndjson_response.headers["content-type"].startswith(NDJSON_MEDIA_TYPE)
+    _assert_cache_headers(ndjson_response)
+    
+    lines = ndjson_response.content.splitlines()
+    assert ndjson_response.content.endswith(b"\n")
+    streamed = [orjson.loads(line) for line in lines]
+    expected = json_response.json()["papers"]
+    
+    # created_at은 요청 시각이므로 두 요청 간에 다를 수 있음
+    def strip_timestamp(items):
+        return [{k: v for k, v in item.items() if k != "created_at"} for item in items]
+    
+    assert strip_timestamp(streamed) == strip_timestamp(expected)
+    assert len({item["created_at"] for item in streamed}) <= 1
@@ -0,0 +1,112 @@
+"""
+시맨틱 캐시 테스트 - 유사도 임계값, TTL, 네임스페이스별 한도, SQLite 재로드
+"""
+
+import math
+import time
+from pathlib import Path
+
+import pytest
+
+from ..services.semantic_cache import SemanticCache, SEMANTIC_CACHE_DIR
+
+
+def _vector(angle_degrees: float, scale: float = 1.0):
+    """x축과 angle_degrees만큼 벌어진 2차원 벡터 (x축 벡터와의 코사인 유사도 = cos(angle))"""
+    angle = math.radians(angle_degrees)
+    return [scale * math.cos(angle), scale * math.sin(angle)]
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return SemanticCache(cache_dir=str(tmp_path), threshold=0.93)
+
+
+def test_hit_above_threshold_and_miss_below(cache):
+    cache.set("topics", _vector(0), ["근력 운동"])
+    
+    # cos(10°) ≈ 0.985, 크기는 유사도에 영향 없음
+    assert cache.get("topics", _vector(10, scale=5)) == ["근력 운동"]
+    # cos(30°) ≈ 0.866
+    assert cache.get("topics", _vector(30)) is None
+
+
+def test_returns_closest_entry(cache):
+    cache.set("topics", _vector(0), "x축")
+    cache.set("topics", _vector(15), "15도")
+    
+    assert cache.get("topics", _vector(12)) == "15도"
+    assert cache.get("topics", _vector(2)) == "x축"
+
+
+def test_namespaces_are_isolated(cache):
+    cache.set("discover", _vector(0), "논문")
+    
+    assert cache.get("topics", _vector(0)) is None
+
+
+def test_expired_entries_are_misses(tmp_path):
+    cache = SemanticCache(cache_dir=str(tmp_path), ttl=0.05)
+    cache.set("topics", _vector(0), "값")
+    time.sleep(0.1)
+    
+    assert cache.get("topics", _vector(0)) is None
+    # 다음 저장 때 만료 항목은 DB에서도 제거
+    cache.set("topics", _vector(90), "새 값")
+    rows = cache._db.execute("SELECT COUNT(*) FROM semantic_entries").fetchone()[0]
+    assert rows == 1
+
+
+def test_per_namespace_cap_evicts_oldest(tmp_path):
+    cache = SemanticCache(cache_dir=str(tmp_path), max_entries=3)
+    angles = [0, 40, 80, 120, 160]
+    for angle in angles:
+        cache.set("topics", _vector(angle), angle)
+    cache.set("discover", _vector(0), "다른 네임스페이스")
+    
+    assert cache.get("topics", _vector(0)) is None
+    assert cache.get("topics", _vector(40)) is None
+    for angle in angles[2:]:
+        assert cache.get("topics", _vector(angle)) == angle
+    assert cache.get("discover", _vector(0)) == "다른 네임스페이스"
+    
+    rows = cache._db.execute(
+        "SELECT COUNT(*) FROM semantic_entries WHERE namespace = 'topics'"
+    ).fetchone()[0]
+    assert rows == 3
+
+
+def test_reloads_entries_from_sqlite(tmp_path):
+    first = SemanticCache(cache_dir=str(tmp_path))
+    first.set("topics", _vector(0), {"topics": ["유산소", "근력"]})
+    first.set("topics", _vector(90), "다른 질의")
+    
+    second = SemanticCache(cache_dir=str(tmp_path))
+    
+    assert second.get("topics", _vector(5)) == {"topics": ["유산소", "근력"]}
+    assert second.get("topics", _vector(88)) == "다른 질의"
+
+
+def test_reload_skips_expired_entries(tmp_path):
+    first = SemanticCache(cache_dir=str(tmp_path), ttl=0.05)
+    first.set("topics", _vector(0), "값")
+    time.sleep(0.1)
+    
+    second = SemanticCache(cache_dir=str(tmp_path))
+    
+    assert second._load("topics") == []
+
+
+def test_clear_namespace(cache):
+    cache.set("topics", _vector(0), "주제")
+    cache.set("discover", _vector(0), "논문")
+    
+    cache.clear("topics")
+    
+    assert cache.get("topics", _vector(0)) is None
+    assert cache.get("discover", _vector(0)) == "논문"
+
+
+def test_default_directory_does_not_depend_on_working_directory():
+    """기본 DB 위치는 실행 디렉토리가 아니라 backend/cache 기준"""
+    assert Path(SEMANTIC_CACHE_DIR).is_absolute()
@@ -14,6 +14,25 @@ import traceback
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# 위험한 문자 패턴 (모듈 로드 시 한 번만 컴파일)
+_DANGEROUS_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r'<script[^>]*>.*?</script>',  # 스크립트 태그
+        r'javascript:',  # 자바스크립트 프로토콜
+        r'on\w+\s*=',  # 이벤트 핸들러
+        r'--',  # SQL 주석
+        r';.*DROP.*TABLE',  # SQL 인젝션
+        r'\.\./\.\./',  # 디렉토리 순회
+    )
+]
+
+# 모든 위험 패턴을 합친 사전 검사용 정규식 (대부분의 정상 입력은 한 번의 스캔으로 통과)
+_ANY_DANGEROUS = re.compile(
+    '|'.join(f'(?:{p.pattern})' for p in _DANGEROUS_PATTERNS),
+    re.IGNORECASE
+)
+
 class BugFixUtils:
     """버그 수정 유틸리티"""
     
@@ -29,21 +48,14 @@ class BugFixUtils:
             except:
                 return ""
                 
-        # 위험한 문자 제거
-        dangerous_patterns = [
-            r'<script[^>]*>.*?</script>',  # 스크립트 태그
-            r'javascript:',  # 자바스크립트 프로토콜
-            r'on\w+\s*=',  # 이벤트 핸들러
-            r'--',  # SQL 주석
-            r';.*DROP.*TABLE',  # SQL 인젝션
-            r'\.\./\.\./',  # 디렉토리 순회
-        ]
-        
-        for pattern in dangerous_patterns:
-            text = re.sub(pattern, '', text, flags=re.IGNORECASE)
+        # 위험한 문자 제거 (해당 패턴이 있을 때만 순차 치환)
+        if _ANY_DANGEROUS.search(text):
+            for pattern in _DANGEROUS_PATTERNS:
+                text = pattern.sub('', text)
             
         # 특수 문자 이스케이프
-        text = text.replace('<', '&lt;').replace('>', '&gt;')
+        if '<' in text or '>' in text:
+            text = text.replace('<', '&lt;').replace('>', '&gt;')
         
         return text.strip()
     
@@ -2,13 +2,14 @@
 로깅 설정 - 시스템 전반의 로깅 구성
 """
 
+import asyncio
 import logging
 import logging.handlers
 from pathlib import Path
 from datetime import datetime
 import json
 import sys
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 
 class CustomFormatter(logging.Formatter):
     """커스텀 로그 포맷터"""
@@ -286,8 +287,11 @@ class SecurityLogger:
 class AuditLogger:
     """감사 로그"""
     
-    def __init__(self, logger: logging.Logger):
+    def __init__(self, logger: logging.Logger, queue_size: int = 10_000):
         self.logger = logger
+        # 요청 경로에서 디스크 I/O를 분리하기 위한 큐 (lifespan에서 drain 태스크 실행)
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self._draining = False
         
     def log_action(self,
                   action: str,
@@ -296,6 +300,50 @@ class AuditLogger:
                   user_id: Optional[str] = None,
                   changes: Optional[Dict[str, Any]] = None):
         """사용자 액션 로깅"""
+        self._write(self._build_audit_data(action, entity_type, entity_id, user_id, changes))
+        
+    def enqueue_action(self,
+                      action: str,
+                      entity_type: str,
+                      entity_id: str,
+                      user_id: Optional[str] = None,
+                      changes: Optional[Dict[str, Any]] = None):
+        """사용자 액션을 큐에 넣고 즉시 반환 (큐가 가득 차면 버리지 않고 동기 기록)"""
+        audit_data = self._build_audit_data(action, entity_type, entity_id, user_id, changes)
+        
+        # drain 태스크가 없으면 (예: lifespan 없이 실행) 동기 기록
+        if not self._draining:
+            self._write(audit_data)
+            return
+        
+        try:
+            self.queue.put_nowait(audit_data)
+        except asyncio.QueueFull:
+            # 감사 로그는 유실되면 안 되므로 요청 경로에서라도 기록
+            self._write(audit_data)
+            
+    async def run_drain(self, batch_size: int = 100):
+        """큐에 쌓인 감사 로그를 백그라운드 스레드에서 기록 (쌓인 만큼 묶어서)"""
+        self._draining = True
+        try:
+            while True:
+                batch = [await self.queue.get()]
+                while len(batch) < batch_size and not self.queue.empty():
+                    batch.append(self.queue.get_nowait())
+                await asyncio.to_thread(self._write_batch, batch)
+        finally:
+            self._draining = False
+            # 종료 시 남은 항목 기록
+            while not self.queue.empty():
+                self._write(self.queue.get_nowait())
+            
+    def _build_audit_data(self,
+                         action: str,
+                         entity_type: str,
+                         entity_id: str,
+                         user_id: Optional[str],
+                         changes: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """감사 로그 레코드 생성"""
         audit_data = {
             'audit_log': True,
             'action': action,
@@ -308,8 +356,19 @@ class AuditLogger:
         if changes:
             audit_data['changes'] = changes
             
-        self.logger.info(f"Audit: {action} on {entity_type}:{entity_id}", 
-                        extra=audit_data)
+        return audit_data
+        
+    def _write_batch(self, batch: List[Dict[str, Any]]):
+        """감사 로그 여러 건 기록"""
+        for audit_data in batch:
+            self._write(audit_data)
+            
+    def _write(self, audit_data: Dict[str, Any]):
+        """감사 로그 기록"""
+        self.logger.info(
+            f"Audit: {audit_data['action']} on {audit_data['entity_type']}:{audit_data['entity_id']}",
+            extra=audit_data
+        )
 
 
 # 전역 로깅 설정
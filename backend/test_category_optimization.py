@@ -50,7 +50,7 @@ async def test_category_generation():
         start_time = time.time()
         
         # 카테고리 생성
-        categories = client.generate_categories(keyword, count=5)
+        categories = await client.generate_categories(keyword, count=5)
         
         generation_time = time.time() - start_time
         
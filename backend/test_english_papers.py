@@ -44,7 +44,7 @@ async def test_english_paper_discovery():
             # Test paper discovery for the first topic
             if topics:
                 print(f"\nSearching papers for: {topics[0]}")
-                result = client.discover_papers_for_topic(category, topics[0])
+                result = await client.discover_papers_for_topic(category, topics[0])
                 
                 if result:
                     print(f"\n✅ Found subcategory: {result.name}")
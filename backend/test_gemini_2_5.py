@@ -3,6 +3,7 @@
 
 import os
 import sys
+import asyncio
 from dotenv import load_dotenv
 
 # Load environment variables
@@ -13,7 +14,7 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from app.services.gemini_client import GeminiClient
 
-def test_gemini_client():
+async def test_gemini_client():
     """Test basic Gemini client functionality"""
     try:
         print("Initializing Gemini client...")
@@ -22,7 +23,7 @@ def test_gemini_client():
         
         # Test category generation
         print("\nTesting category generation...")
-        categories = client.generate_categories("운동", count=3)
+        categories = await client.generate_categories("운동", count=3)
         
         print(f"\n✅ Generated {len(categories)} categories:")
         for i, cat in enumerate(categories, 1):
@@ -39,7 +40,7 @@ def test_gemini_client():
             topic = "효과적인 방법"
             
             print(f"Searching papers for: {category_name} / {topic}")
-            result = client.discover_papers_for_topic(category_name, topic)
+            result = await client.discover_papers_for_topic(category_name, topic)
             
             if result:
                 print(f"\n✅ Found subcategory: {result.name}")
@@ -64,4 +65,4 @@ def test_gemini_client():
         traceback.print_exc()
 
 if __name__ == "__main__":
-    test_gemini_client()
\ No newline at end of file
+    asyncio.run(test_gemini_client())
\ No newline at end of file
@@ -33,7 +33,7 @@ async def test_subcategory_generation():
         # Try to discover papers for first topic
         if topics:
             print(f"\nSearching papers for first topic: {topics[0]}")
-            result = client.discover_papers_for_topic(category_name, topics[0])
+            result = await client.discover_papers_for_topic(category_name, topics[0])
             
             if result:
                 print(f"\n✅ Found subcategory: {result.name}")
@@ -38,14 +38,14 @@ async def test_category_optimization():
     
     # 첫 번째 호출 (캐시 미스)
     start_time = time.time()
-    categories1 = client.generate_categories(keyword, count=5)
+    categories1 = await client.generate_categories(keyword, count=5)
     time1 = time.time() - start_time
     
     print(f"\n⏱️  첫 번째 호출 시간: {time1:.2f}초")
     
     # 두 번째 호출 (캐시 히트)
     start_time = time.time()
-    categories2 = client.generate_categories(keyword, count=5)
+    categories2 = await client.generate_categories(keyword, count=5)
     time2 = time.time() - start_time
     
     print(f"⏱️  두 번째 호출 시간: {time2:.2f}초 (캐시 사용)")
@@ -152,7 +152,7 @@ async def test_integrated_workflow():
     
     # 1. 카테고리 생성
     print("\n1️⃣ 카테고리 생성...")
-    categories = client.generate_categories("헬스", count=3)
+    categories = await client.generate_categories("헬스", count=3)
     
     if not categories:
         print("❌ 카테고리 생성 실패")
@@ -165,7 +165,7 @@ async def test_integrated_workflow():
     print("\n2️⃣ 논문 검색...")
     topic = "근력 운동 효과"
     
-    subcategory = client.discover_papers_for_topic(
+    subcategory = await client.discover_papers_for_topic(
         category=selected_category.name,
         subcategory_topic=topic
     )
@@ -174,7 +174,7 @@ async def test_integrated_workflow():
         print(f"❌ '{topic}' 주제로 논문을 찾을 수 없음")
         # 다른 주제로 재시도
         topic = "운동 세트수 최적화"
-        subcategory = client.discover_papers_for_topic(
+        subcategory = await client.discover_papers_for_topic(
             category=selected_category.name,
             subcategory_topic=topic
         )
@@ -187,7 +187,7 @@ async def test_integrated_workflow():
         
         # 3. 콘텐츠 생성 (간단한 테스트)
         print("\n3️⃣ 콘텐츠 생성 테스트...")
-        content = client.generate_content(subcategory, "shorts")
+        content = await client.generate_content(subcategory, "shorts")
         
         if content:
             print(f"✅ 콘텐츠 생성 성공")